@@ -396,6 +396,53 @@ def execute_query():
         return jsonify({"error": str(e)}), 400
 
 
+# Most statements accepted by one /api/query/batch request
+MAX_BATCH_QUERIES = 100
+
+
+@app.route("/api/query/batch", methods=["POST"])
+@require_api_key
+@require_permission(Permission.DB_QUERY)
+def execute_query_batch():
+    """Execute several database queries in one request
+
+    Results are returned in request order; a failing query reports its error
+    in its own slot without stopping the others.
+    """
+    data = request.get_json() or {}
+    queries = data.get("queries")
+
+    if not isinstance(queries, list) or not queries:
+        return jsonify({"error": "A non-empty list of queries is required"}), 400
+    if len(queries) > MAX_BATCH_QUERIES:
+        return (
+            jsonify({"error": f"At most {MAX_BATCH_QUERIES} queries per batch"}),
+            400,
+        )
+
+    results = []
+    for item in queries:
+        item = item if isinstance(item, dict) else {}
+        connection_name = item.get("connection")
+        query = item.get("query")
+
+        if not connection_name or not query:
+            results.append({"error": "Connection and query are required"})
+            continue
+
+        try:
+            STATS["active_connections"] += 1
+            connection = db_manager.get_connection(connection_name)
+            result = connection.execute_query(query, item.get("params"))
+            results.append({"status": "success", "result": result})
+        except Exception as e:
+            results.append({"error": str(e)})
+        finally:
+            STATS["active_connections"] -= 1
+
+    return jsonify({"status": "success", "results": results})
+
+
 @app.route("/api/schema/<connection_name>", methods=["GET"])
 @require_api_key
 @require_permission(Permission.DB_QUERY)
@@ -3,8 +3,12 @@ AI Insights Engine
 Provides intelligent analysis, insights, and recommendations using Gemini AI
 """
 
+import io
 import json
 import logging
+import re
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 try:
@@ -12,8 +16,138 @@ try:
 except ImportError:
     genai = None
 
+try:
+    from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+except ImportError:
+    BaseModel = None
+
 logger = logging.getLogger(__name__)
 
+if BaseModel is not None:
+
+    class _ResponseItem(BaseModel):
+        """Base for AI response items; unknown fields are kept"""
+
+        model_config = ConfigDict(extra="allow")
+
+    class Insight(_ResponseItem):
+        type: str = "general"
+        description: str = ""
+        importance: str = "medium"
+
+    class Trend(_ResponseItem):
+        pattern: str = ""
+        confidence: str = "medium"
+
+    class Recommendation(_ResponseItem):
+        action: str = ""
+        rationale: str = ""
+        priority: str = "medium"
+
+    class Anomaly(_ResponseItem):
+        description: str = ""
+        severity: str = "medium"
+
+    class InsightsResponse(_ResponseItem):
+        summary: str = ""
+        insights: List[Insight] = []
+        trends: List[Trend] = []
+        recommendations: List[Recommendation] = []
+        anomalies: List[Anomaly] = []
+
+    _INSIGHTS_ADAPTER = TypeAdapter(InsightsResponse)
+    _RECOMMENDATIONS_ADAPTER = TypeAdapter(List[Recommendation])
+else:
+    _INSIGHTS_ADAPTER = None
+    _RECOMMENDATIONS_ADAPTER = None
+
+# Structural JSON tokens; escapes are matched as a unit so an escaped quote
+# never toggles string state
+_JSON_TOKEN_RE = re.compile(r'\\.|["{}\[\]]', re.DOTALL)
+
+
+def _extract_json_block(text: str, open_char: str, close_char: str) -> Optional[str]:
+    """Return the first balanced JSON block opened by open_char, if any"""
+    start_idx = text.find(open_char)
+    if start_idx == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    for match in _JSON_TOKEN_RE.finditer(text, start_idx):
+        token = match.group()
+        if token == '"':
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif token == open_char:
+            depth += 1
+        elif token == close_char:
+            depth -= 1
+            if depth == 0:
+                return text[start_idx : match.end()]
+
+    return None
+
+
+def _extract_json_obj(text: str) -> Optional[str]:
+    """Extract the first balanced JSON object from text"""
+    return _extract_json_block(text, "{", "}")
+
+
+def _extract_json_array(text: str) -> Optional[str]:
+    """Extract the first balanced JSON array from text"""
+    return _extract_json_block(text, "[", "]")
+
+
+def _load_validated(json_text: str, adapter: Any) -> Any:
+    """Parse JSON with a pydantic adapter, falling back to json.loads"""
+    if adapter is not None:
+        try:
+            return adapter.dump_python(adapter.validate_json(json_text))
+        except ValidationError:
+            # Malformed or off-schema output; let json.loads decide below
+            pass
+    return json.loads(json_text)
+
+
+@lru_cache(maxsize=256)
+def _build_analysis_prompt(data_summary: str, question: Optional[str] = None) -> str:
+    """Build the data analysis prompt; cached for repeated summaries"""
+    prompt_parts = [
+        "You are a data analyst AI. Analyze the following data and provide:",
+        "1. Key insights and observations",
+        "2. Patterns and trends",
+        "3. Actionable recommendations",
+        "4. Potential issues or anomalies",
+        "",
+        "Please structure your response as JSON with the following format:",
+        "{",
+        '  "summary": "Brief overview of the data",',
+        '  "insights": [',
+        '    {"type": "insight_type", "description": "insight description", "importance": "high/medium/low"}',
+        "  ],",
+        '  "trends": [',
+        '    {"pattern": "pattern description", "confidence": "high/medium/low"}',
+        "  ],",
+        '  "recommendations": [',
+        '    {"action": "recommended action", "rationale": "why this action", "priority": "high/medium/low"}',
+        "  ],",
+        '  "anomalies": [',
+        '    {"description": "anomaly description", "severity": "high/medium/low"}',
+        "  ]",
+        "}",
+        "",
+        "Data to analyze:",
+        data_summary,
+    ]
+
+    # Add user question if provided
+    if question is not None:
+        prompt_parts.insert(5, f"\nUser Question: {question}\n")
+
+    return "\n".join(prompt_parts)
+
 
 class AIInsightsEngine:
     """AI-powered insights and recommendations engine"""
@@ -48,8 +182,17 @@ class AIInsightsEngine:
             logger.error(f"Error setting API key: {str(e)}")
             return False
 
+    def session(
+        self, data: Any, context: Optional[Dict[str, Any]] = None
+    ) -> "AnalysisSession":
+        """Open a session that summarizes data once for several AI calls"""
+        return AnalysisSession(self, data, context)
+
     def analyze_data(
-        self, data: Any, data_context: Optional[Dict[str, Any]] = None
+        self,
+        data: Any,
+        data_context: Optional[Dict[str, Any]] = None,
+        data_summary: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Analyze data and provide insights"""
         try:
@@ -61,7 +204,8 @@ class AIInsightsEngine:
                 }
 
             # Prepare data summary
-            data_summary = self._prepare_data_summary(data, data_context)
+            if data_summary is None:
+                data_summary = self._prepare_data_summary(data, data_context)
 
             # Create analysis prompt
             prompt = self._create_analysis_prompt(data_summary, data_context)
@@ -88,59 +232,62 @@ class AIInsightsEngine:
     ) -> str:
         """Prepare a summary of the data for analysis"""
         try:
-            summary_parts = []
+            buf = io.StringIO()
+
+            def add(line: str):
+                buf.write(line)
+                buf.write("\n")
 
             # Add context information
             if context:
-                summary_parts.append("Data Context:")
+                add("Data Context:")
                 if "source" in context:
-                    summary_parts.append(f"- Source: {context['source']}")
+                    add(f"- Source: {context['source']}")
                 if "query" in context:
-                    summary_parts.append(f"- Query: {context['query']}")
+                    add(f"- Query: {context['query']}")
                 if "table" in context:
-                    summary_parts.append(f"- Table: {context['table']}")
+                    add(f"- Table: {context['table']}")
                 if "database" in context:
-                    summary_parts.append(f"- Database: {context['database']}")
-                summary_parts.append("")
+                    add(f"- Database: {context['database']}")
+                add("")
 
             # Analyze data structure
             if isinstance(data, list):
-                summary_parts.append(f"Data Type: List with {len(data)} items")
+                add(f"Data Type: List with {len(data)} items")
 
                 if len(data) > 0:
                     # Sample first few items
                     sample_size = min(5, len(data))
-                    summary_parts.append(f"\nFirst {sample_size} items:")
+                    add(f"\nFirst {sample_size} items:")
 
                     for i, item in enumerate(data[:sample_size]):
                         if isinstance(item, dict):
-                            summary_parts.append(f"\nItem {i + 1}:")
-                            for key, value in list(item.items())[:10]:
-                                summary_parts.append(f"  {key}: {value}")
+                            add(f"\nItem {i + 1}:")
+                            for key, value in islice(item.items(), 10):
+                                add(f"  {key}: {value}")
                         else:
-                            summary_parts.append(f"  {i + 1}. {item}")
+                            add(f"  {i + 1}. {item}")
 
                     # Add column information if dict
                     if isinstance(data[0], dict):
                         columns = list(data[0].keys())
-                        summary_parts.append(
-                            f"\nColumns ({len(columns)}): {', '.join(columns)}"
-                        )
+                        add(f"\nColumns ({len(columns)}): {', '.join(columns)}")
 
             elif isinstance(data, dict):
-                summary_parts.append("Data Type: Dictionary")
-                summary_parts.append(f"Keys ({len(data)}): {', '.join(data.keys())}")
+                add("Data Type: Dictionary")
+                add(f"Keys ({len(data)}): {', '.join(data.keys())}")
 
                 # Show sample values
-                summary_parts.append("\nSample values:")
-                for key, value in list(data.items())[:10]:
-                    summary_parts.append(f"  {key}: {value}")
+                add("\nSample values:")
+                for key, value in islice(data.items(), 10):
+                    add(f"  {key}: {value}")
 
             else:
-                summary_parts.append(f"Data Type: {type(data).__name__}")
-                summary_parts.append(f"Value: {str(data)[:500]}")
+                add(f"Data Type: {type(data).__name__}")
+                add(f"Value: {str(data)[:500]}")
 
-            return "\n".join(summary_parts)
+            # Drop the trailing newline written after the last line
+            return buf.getvalue()[:-1]
 
         except Exception as e:
             logger.error(f"Error preparing data summary: {str(e)}")
@@ -150,50 +297,21 @@ class AIInsightsEngine:
         self, data_summary: str, context: Optional[Dict[str, Any]] = None
     ) -> str:
         """Create prompt for data analysis"""
-        prompt_parts = [
-            "You are a data analyst AI. Analyze the following data and provide:",
-            "1. Key insights and observations",
-            "2. Patterns and trends",
-            "3. Actionable recommendations",
-            "4. Potential issues or anomalies",
-            "",
-            "Please structure your response as JSON with the following format:",
-            "{",
-            '  "summary": "Brief overview of the data",',
-            '  "insights": [',
-            '    {"type": "insight_type", "description": "insight description", "importance": "high/medium/low"}',
-            "  ],",
-            '  "trends": [',
-            '    {"pattern": "pattern description", "confidence": "high/medium/low"}',
-            "  ],",
-            '  "recommendations": [',
-            '    {"action": "recommended action", "rationale": "why this action", "priority": "high/medium/low"}',
-            "  ],",
-            '  "anomalies": [',
-            '    {"description": "anomaly description", "severity": "high/medium/low"}',
-            "  ]",
-            "}",
-            "",
-            "Data to analyze:",
-            data_summary,
-        ]
-
-        # Add user question if provided
-        if context and "question" in context:
-            prompt_parts.insert(5, f"\nUser Question: {context['question']}\n")
-
-        return "\n".join(prompt_parts)
+        question = context.get("question") if context else None
+        try:
+            return _build_analysis_prompt(data_summary, question)
+        except TypeError:
+            # Unhashable question value; build without the cache
+            return _build_analysis_prompt.__wrapped__(data_summary, question)
 
     def _parse_insights_response(self, response_text: str) -> Dict[str, Any]:
         """Parse AI response into structured insights"""
         try:
             # Try to find JSON in response
-            start_idx = response_text.find("{")
-            end_idx = response_text.rfind("}") + 1
+            json_text = _extract_json_obj(response_text)
 
-            if start_idx != -1 and end_idx > start_idx:
-                json_text = response_text[start_idx:end_idx]
-                insights = json.loads(json_text)
+            if json_text is not None:
+                insights = _load_validated(json_text, _INSIGHTS_ADAPTER)
                 return insights
 
             # If no JSON found, create structured response from text
@@ -237,7 +355,11 @@ class AIInsightsEngine:
             }
 
     def answer_question(
-        self, question: str, data: Any, context: Optional[Dict[str, Any]] = None
+        self,
+        question: str,
+        data: Any,
+        context: Optional[Dict[str, Any]] = None,
+        data_summary: Optional[str] = None,
     ) -> str:
         """Answer a question about the data"""
         try:
@@ -245,7 +367,8 @@ class AIInsightsEngine:
                 return "AI model not initialized. Please set API key."
 
             # Prepare data context
-            data_summary = self._prepare_data_summary(data, context)
+            if data_summary is None:
+                data_summary = self._prepare_data_summary(data, context)
 
             # Create prompt
             prompt = [
@@ -268,7 +391,11 @@ class AIInsightsEngine:
             return f"Error: {str(e)}"
 
     def generate_recommendations(
-        self, data: Any, goal: str, context: Optional[Dict[str, Any]] = None
+        self,
+        data: Any,
+        goal: str,
+        context: Optional[Dict[str, Any]] = None,
+        data_summary: Optional[str] = None,
     ) -> List[Dict[str, str]]:
         """Generate actionable recommendations based on data and goal"""
         try:
@@ -282,7 +409,8 @@ class AIInsightsEngine:
                 ]
 
             # Prepare data
-            data_summary = self._prepare_data_summary(data, context)
+            if data_summary is None:
+                data_summary = self._prepare_data_summary(data, context)
 
             # Create prompt
             prompt = [
@@ -303,12 +431,12 @@ class AIInsightsEngine:
             # Parse response
             try:
                 # Find JSON array in response
-                start_idx = response.text.find("[")
-                end_idx = response.text.rfind("]") + 1
+                json_text = _extract_json_array(response.text)
 
-                if start_idx != -1 and end_idx > start_idx:
-                    json_text = response.text[start_idx:end_idx]
-                    recommendations = json.loads(json_text)
+                if json_text is not None:
+                    recommendations = _load_validated(
+                        json_text, _RECOMMENDATIONS_ADAPTER
+                    )
                     logger.info(f"Generated {len(recommendations)} recommendations")
                     return recommendations
 
@@ -329,7 +457,11 @@ class AIInsightsEngine:
             return [{"action": "Error", "rationale": str(e), "priority": "high"}]
 
     def summarize_data(
-        self, data: Any, max_length: int = 200, context: Optional[Dict[str, Any]] = None
+        self,
+        data: Any,
+        max_length: int = 200,
+        context: Optional[Dict[str, Any]] = None,
+        data_summary: Optional[str] = None,
     ) -> str:
         """Generate a concise summary of the data"""
         try:
@@ -337,7 +469,8 @@ class AIInsightsEngine:
                 return "AI model not initialized."
 
             # Prepare data
-            data_summary = self._prepare_data_summary(data, context)
+            if data_summary is None:
+                data_summary = self._prepare_data_summary(data, context)
 
             # Create prompt
             prompt = [
@@ -354,3 +487,58 @@ class AIInsightsEngine:
         except Exception as e:
             logger.error(f"Error summarizing data: {str(e)}")
             return f"Error: {str(e)}"
+
+
+class AnalysisSession:
+    """Reuses one data summary across analyze/recommend/summarize/ask calls"""
+
+    def __init__(
+        self,
+        engine: AIInsightsEngine,
+        data: Any,
+        context: Optional[Dict[str, Any]] = None,
+    ):
+        self.engine = engine
+        self.data = data
+        self.context = context
+        self._data_summary: Optional[str] = None
+
+    def __enter__(self) -> "AnalysisSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._data_summary = None
+        return False
+
+    @property
+    def data_summary(self) -> str:
+        """Data summary, built on first use"""
+        if self._data_summary is None:
+            self._data_summary = self.engine._prepare_data_summary(
+                self.data, self.context
+            )
+        return self._data_summary
+
+    def analyze(self) -> Dict[str, Any]:
+        """Analyze the session data"""
+        return self.engine.analyze_data(
+            self.data, self.context, data_summary=self.data_summary
+        )
+
+    def recommendations(self, goal: str) -> List[Dict[str, str]]:
+        """Generate recommendations for the session data"""
+        return self.engine.generate_recommendations(
+            self.data, goal, self.context, data_summary=self.data_summary
+        )
+
+    def summary(self, max_length: int = 200) -> str:
+        """Summarize the session data"""
+        return self.engine.summarize_data(
+            self.data, max_length, self.context, data_summary=self.data_summary
+        )
+
+    def ask(self, question: str) -> str:
+        """Answer a question about the session data"""
+        return self.engine.answer_question(
+            question, self.data, self.context, data_summary=self.data_summary
+        )
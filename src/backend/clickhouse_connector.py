@@ -4,9 +4,16 @@ Handles connections and queries to ClickHouse databases
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
 
-from backend.db_manager import DatabaseConnection
+try:
+    from clickhouse_driver import Client
+except ImportError:
+    Client = None
+
+from backend.db_manager import DatabaseConnection, rows_to_dicts
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +28,11 @@ class ClickHouseConnection(DatabaseConnection):
     def connect(self) -> bool:
         """Establish ClickHouse connection"""
         try:
-            from clickhouse_driver import Client
+            if Client is None:
+                raise ImportError(
+                    "clickhouse-driver is not installed. "
+                    "Install with: pip install clickhouse-driver"
+                )
 
             host = self.config.get("host", "localhost")
             port = self.config.get("port", 9000)
@@ -64,6 +75,13 @@ class ClickHouseConnection(DatabaseConnection):
 
     def execute_query(self, query: str, params: Optional[Dict] = None) -> List[Dict]:
         """Execute a ClickHouse query and return results"""
+        result = self.execute_query_columnar(query, params)
+        return rows_to_dicts(result["columns"], result["rows"])
+
+    def execute_query_columnar(
+        self, query: str, params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Execute a ClickHouse query and return columns plus row tuples"""
         if not self.client:
             raise ConnectionError("Not connected to ClickHouse")
 
@@ -72,23 +90,48 @@ class ClickHouseConnection(DatabaseConnection):
             result = self.client.execute(query, params or {}, with_column_types=True)
 
             if not result:
-                return []
+                return {"columns": [], "rows": []}
 
             # Parse results
             rows, column_info = result
             column_names = [col[0] for col in column_info]
 
-            # Convert to list of dictionaries
-            data = []
-            for row in rows:
-                row_dict = dict(zip(column_names, row))
-                data.append(row_dict)
+            logger.info("Query executed successfully: %d rows returned", len(rows))
+            return {"columns": column_names, "rows": rows}
+
+        except Exception as e:
+            logger.error("ClickHouse query error: %s", e)
+            raise
+
+    def execute_query_iter(
+        self, query: str, params: Optional[Dict] = None, chunk_size: int = 1000
+    ) -> Iterator[List[Dict]]:
+        """Execute a ClickHouse query and stream results in batches"""
+        if not self.client:
+            raise ConnectionError("Not connected to ClickHouse")
+
+        try:
+            rows = self.client.execute_iter(
+                query,
+                params or {},
+                with_column_types=True,
+                settings={"max_block_size": chunk_size},
+            )
 
-            logger.info(f"Query executed successfully: {len(data)} rows returned")
-            return data
+            # First item from execute_iter is the column name/type list
+            column_info = next(rows, None)
+            if column_info is None:
+                return
+            column_names = [col[0] for col in column_info]
+
+            while True:
+                batch = list(islice(rows, chunk_size))
+                if not batch:
+                    break
+                yield rows_to_dicts(column_names, batch)
 
         except Exception as e:
-            logger.error(f"ClickHouse query error: {str(e)}")
+            logger.error("ClickHouse query error: %s", e)
             raise
 
     def get_schema(self, database: Optional[str] = None) -> Dict[str, Any]:
@@ -264,22 +307,24 @@ class ClickHouseConnection(DatabaseConnection):
     ) -> Dict[str, Any]:
         """Execute query and return results with execution statistics"""
         try:
-            import time
-
             start_time = time.time()
 
-            # Get query stats
-            self.client.execute("SET send_progress_in_http_headers = 1")
-
             results = self.execute_query(query, params)
 
             execution_time = time.time() - start_time
 
+            # Server-side stats reported over the native protocol
+            last_query = getattr(self.client, "last_query", None)
+            profile_info = getattr(last_query, "profile_info", None)
+
             return {
                 "success": True,
                 "data": results,
                 "row_count": len(results),
                 "execution_time_seconds": round(execution_time, 3),
+                "rows_read": getattr(profile_info, "rows", None),
+                "bytes_read": getattr(profile_info, "bytes", None),
+                "server_elapsed_seconds": getattr(last_query, "elapsed", None),
                 "connection_id": self.connection_id,
             }
 
@@ -3,19 +3,254 @@ Configuration Manager
 Secure credential storage and configuration management for backend connectors
 """
 
+import atexit
+import base64
 import json
 import logging
 import os
+import threading
+import time
+import weakref
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 try:
     from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 except ImportError:
     Fernet = None
+    AESGCM = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Headers marking per-entry encrypted credentials formats: V2 entries are
+# Fernet tokens, V3 entries are base64 AES-GCM nonce + ciphertext under the
+# raw Fernet key, V4 entries are the same under a key derived from it with
+# the service name bound as associated data
+CREDENTIALS_FORMAT_V2 = b"VMC2\n"
+CREDENTIALS_FORMAT_V3 = b"VMC3\n"
+CREDENTIALS_FORMAT_V4 = b"VMC4\n"
+
+# HKDF info string separating the AES-GCM key from the Fernet key
+AESGCM_KEY_INFO = b"vmart-aesgcm"
+
+# Sentinel for "no existing value"
+_MISSING = object()
+
+# Seconds between checks of the credentials file for external changes
+CREDENTIALS_RECHECK_INTERVAL = 5.0
+
+# Seconds to wait for further updates before writing changes to disk
+FLUSH_DELAY = 0.25
+
+# Seconds to wait before retrying a failed write
+FLUSH_RETRY_DELAY = 5.0
+
+# Live ConfigManagers, flushed at exit; weak so dropped managers can be freed
+_LIVE_MANAGERS: "weakref.WeakSet[ConfigManager]" = weakref.WeakSet()
+
+
+def _flush_live_managers():
+    """Write pending changes of every live ConfigManager to disk"""
+    for manager in list(_LIVE_MANAGERS):
+        try:
+            manager.flush()
+        except Exception as e:
+            logger.error(f"Error flushing config at exit: {str(e)}")
+
+
+atexit.register(_flush_live_managers)
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when available"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write data to path in one write() and swap it into place atomically"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _unchanged(current: Any, value: Any) -> bool:
+    """Whether storing value over current would be a no-op"""
+    if current is value and isinstance(value, (dict, list)):
+        # Same container passed back; it may have been mutated in place
+        return False
+    return current == value
+
+
+@lru_cache(maxsize=1024)
+def _config_path(key: str) -> Tuple[str, ...]:
+    """Split a dotted config key into its path components"""
+    return tuple(key.split("."))
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _derive_aesgcm_key(fernet_key: bytes) -> bytes:
+    """Derive the AES-256-GCM key from the Fernet key file contents"""
+    return HKDF(
+        algorithm=hashes.SHA256(), length=32, salt=None, info=AESGCM_KEY_INFO
+    ).derive(base64.urlsafe_b64decode(fernet_key))
+
+
+class _AESGCMCipher:
+    """AES-GCM cipher storing a random 96-bit nonce ahead of each ciphertext"""
+
+    NONCE_SIZE = 12
+
+    def __init__(self, key: bytes):
+        self._aead = AESGCM(key)
+
+    def encrypt(self, data: bytes, associated_data: Optional[bytes] = None) -> bytes:
+        nonce = os.urandom(self.NONCE_SIZE)
+        return nonce + self._aead.encrypt(nonce, data, associated_data)
+
+    def decrypt(self, token: bytes, associated_data: Optional[bytes] = None) -> bytes:
+        nonce, ciphertext = token[: self.NONCE_SIZE], token[self.NONCE_SIZE :]
+        return self._aead.decrypt(nonce, ciphertext, associated_data)
+
+
+@dataclass(frozen=True)
+class ApiCredential:
+    """Parsed api_* credential set"""
+
+    __slots__ = ("api_key", "extra")
+
+    api_key: Optional[str]
+    extra: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, creds: Dict[str, Any]) -> "ApiCredential":
+        extra = {k: v for k, v in creds.items() if k != "api_key"}
+        return cls(creds.get("api_key"), extra)
+
+
+@dataclass(frozen=True)
+class DatabaseCredential:
+    """Parsed db_* credential set"""
+
+    __slots__ = ("db_type", "params")
+
+    db_type: Optional[str]
+    params: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, creds: Dict[str, Any]) -> "DatabaseCredential":
+        return cls(creds.get("type"), creds.get("params") or {})
+
+
+# Typed parsers for credential sets, by service name prefix
+_CREDENTIAL_TYPES = {"api": ApiCredential, "db": DatabaseCredential}
+
+
+class _CredentialStore(MutableMapping):
+    """Credential sets keyed by service, each encrypted on its own
+
+    Entries read from disk stay encrypted until first accessed. Saving only
+    encrypts entries that changed since the last save. Each entry is bound to
+    its service name, so it cannot be decrypted under another service.
+    """
+
+    def __init__(
+        self,
+        cipher: Any = None,
+        plain: Optional[Dict[str, Dict[str, Any]]] = None,
+        tokens: Optional[Dict[str, bytes]] = None,
+    ):
+        self._cipher = cipher
+        self._tokens: Dict[str, bytes] = dict(tokens or {})
+        self._plain: Dict[str, Dict[str, Any]] = dict(plain or {})
+        # Services in insertion order, whether decrypted or not
+        self._order: Dict[str, None] = dict.fromkeys(self._tokens)
+        self._order.update(dict.fromkeys(self._plain))
+        # Typed objects parsed from entries on first typed access
+        self._typed: Dict[str, Any] = {}
+
+    def __getitem__(self, service: str) -> Dict[str, Any]:
+        if service not in self._plain:
+            token = self._tokens[service]
+            self._plain[service] = _loads(
+                self._cipher.decrypt(token, service.encode("utf-8"))
+            )
+        return self._plain[service]
+
+    def __setitem__(self, service: str, credentials: Dict[str, Any]):
+        self._plain[service] = credentials
+        self._tokens.pop(service, None)
+        self._typed.pop(service, None)
+        self._order[service] = None
+
+    def __delitem__(self, service: str):
+        del self._order[service]
+        self._plain.pop(service, None)
+        self._tokens.pop(service, None)
+        self._typed.pop(service, None)
+
+    def __contains__(self, service: object) -> bool:
+        return service in self._order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def typed(self, service: str) -> Any:
+        """Entry parsed into its typed credential object, or None"""
+        cred = self._typed.get(service)
+        if cred is None and service in self._order:
+            cred_type = _CREDENTIAL_TYPES.get(service.partition("_")[0])
+            if cred_type is not None:
+                cred = self._typed[service] = cred_type.from_dict(self[service])
+        return cred
+
+    def encrypted(self) -> Dict[str, str]:
+        """Per-service tokens, encrypting only entries changed since last save"""
+        for service in self._order:
+            if service not in self._tokens:
+                self._tokens[service] = self._cipher.encrypt(
+                    _dumps(self._plain[service]), service.encode("utf-8")
+                )
+        return {
+            service: base64.b64encode(self._tokens[service]).decode("ascii")
+            for service in self
+        }
+
 
 class ConfigManager:
     """Manages secure storage of credentials and configurations"""
@@ -28,14 +263,72 @@ class ConfigManager:
         self.credentials_file = self.config_dir / "credentials.enc"
         self.key_file = self.config_dir / ".key"
 
+        # Startup reads: file name -> (data, mtime), or None if missing
+        self._preloaded: Dict[str, Optional[Tuple[bytes, float]]] = {}
+        self._preload_files()
+
         self.cipher = None
+        # Ciphers used only to read credentials saved in older formats:
+        # Fernet for V2 and blobs, AES-GCM under the raw Fernet key for V3
+        self._legacy_cipher = None
+        self._legacy_aesgcm = None
         self._initialize_encryption()
 
         self.config: Dict[str, Any] = {}
-        self.credentials: Dict[str, Dict[str, Any]] = {}
+        self.credentials = _CredentialStore()
+        # Insertion-ordered set of database connection names
+        self._db_connection_names: Dict[str, None] = {}
+        self._credentials_mtime: Optional[float] = None
+        self._credentials_checked_at = 0.0
+
+        self._dirty_config = False
+        self._dirty_credentials = False
+        # Guards config and credential data against a flush serializing it
+        # mid-update; taken before _flush_lock when both are needed
+        self._data_lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
 
         self._load_config()
         self._load_credentials()
+        self._preloaded.clear()
+
+        _LIVE_MANAGERS.add(self)
+
+    @staticmethod
+    def _read_from_disk(path: Path) -> Optional[Tuple[bytes, float]]:
+        """Read a file's bytes and mtime, or None if it does not exist"""
+        try:
+            with open(path, "rb") as f:
+                return f.read(), os.fstat(f.fileno()).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _preload_files(self):
+        """Read the key, config and credentials files concurrently"""
+        paths = {
+            p.name: p for p in (self.key_file, self.config_file, self.credentials_file)
+        }
+        self._preloaded = dict.fromkeys(paths)
+
+        # One directory scan instead of an exists() probe per file
+        with os.scandir(self.config_dir) as entries:
+            present = [
+                paths[e.name] for e in entries if e.name in paths and e.is_file()
+            ]
+
+        if present:
+            with ThreadPoolExecutor(max_workers=len(present)) as executor:
+                results = executor.map(self._read_from_disk, present)
+                for path, data in zip(present, results):
+                    self._preloaded[path.name] = data
+
+    def _read_file(self, path: Path) -> Optional[Tuple[bytes, float]]:
+        """Return a file's bytes and mtime, using the startup read if there is one"""
+        if path.name in self._preloaded:
+            return self._preloaded.pop(path.name)
+        return self._read_from_disk(path)
 
     def _initialize_encryption(self):
         """Initialize encryption for credentials"""
@@ -46,10 +339,10 @@ class ConfigManager:
                 )
                 return
 
-            if self.key_file.exists():
+            key_data = self._read_file(self.key_file)
+            if key_data is not None:
                 # Load existing key
-                with open(self.key_file, "rb") as f:
-                    key = f.read()
+                key = key_data[0]
             else:
                 # Generate new key
                 key = Fernet.generate_key()
@@ -61,19 +354,25 @@ class ConfigManager:
                 except Exception:
                     pass
 
-            self.cipher = Fernet(key)
+            # AES-256-GCM gets its own key derived from the Fernet key, which
+            # stays in use for reading Fernet-encrypted files
+            self._legacy_cipher = Fernet(key)
+            self._legacy_aesgcm = _AESGCMCipher(base64.urlsafe_b64decode(key))
+            self.cipher = _AESGCMCipher(_derive_aesgcm_key(key))
             logger.info("Encryption initialized for credentials")
 
         except Exception as e:
             logger.error(f"Error initializing encryption: {str(e)}")
             self.cipher = None
+            self._legacy_cipher = None
+            self._legacy_aesgcm = None
 
     def _load_config(self):
         """Load configuration from file"""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, "r") as f:
-                    self.config = json.load(f)
+            config_data = self._read_file(self.config_file)
+            if config_data is not None:
+                self.config = _loads(config_data[0])
                 logger.info("Loaded configuration")
             else:
                 self.config = self._get_default_config()
@@ -83,15 +382,17 @@ class ConfigManager:
             logger.error(f"Error loading config: {str(e)}")
             self.config = self._get_default_config()
 
-    def _save_config(self):
-        """Save configuration to file"""
+    def _save_config(self) -> bool:
+        """Save configuration to file, returning whether it was written"""
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=2)
+            with self._data_lock:
+                _atomic_write(self.config_file, _dumps(self.config, indent=True))
             logger.info("Saved configuration")
+            return True
 
         except Exception as e:
             logger.error(f"Error saving config: {str(e)}")
+            return False
 
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration"""
@@ -126,59 +427,100 @@ class ConfigManager:
     def _load_credentials(self):
         """Load encrypted credentials"""
         try:
-            if not self.credentials_file.exists():
-                self.credentials = {}
+            self._credentials_checked_at = time.monotonic()
+            credentials_data = self._read_file(self.credentials_file)
+            if credentials_data is None:
+                self.credentials = _CredentialStore(self.cipher)
+                self._credentials_mtime = None
+                self._rebuild_db_connection_index()
                 return
 
-            with open(self.credentials_file, "rb") as f:
-                encrypted_data = f.read()
+            encrypted_data, self._credentials_mtime = credentials_data
 
-            if self.cipher:
-                # Decrypt credentials
-                decrypted_data = self.cipher.decrypt(encrypted_data)
-                self.credentials = json.loads(decrypted_data.decode("utf-8"))
+            if self.cipher and encrypted_data.startswith(CREDENTIALS_FORMAT_V4):
+                # Per-entry tokens; each is decrypted on first access
+                tokens = _loads(encrypted_data[len(CREDENTIALS_FORMAT_V4) :])
+                self.credentials = _CredentialStore(
+                    self.cipher,
+                    tokens={k: base64.b64decode(v) for k, v in tokens.items()},
+                )
+            elif self.cipher:
+                # Older formats: decrypt everything once and rewrite the file
+                # in the current format
+                self.credentials = _CredentialStore(
+                    self.cipher, plain=self._decrypt_legacy(encrypted_data)
+                )
+                self._schedule_flush(credentials=True)
             else:
                 # No encryption available
-                self.credentials = json.loads(encrypted_data.decode("utf-8"))
+                self.credentials = _CredentialStore(plain=_loads(encrypted_data))
 
             logger.info(f"Loaded {len(self.credentials)} credential sets")
 
         except Exception as e:
             logger.error(f"Error loading credentials: {str(e)}")
-            self.credentials = {}
+            self.credentials = _CredentialStore(self.cipher)
+
+        self._rebuild_db_connection_index()
+
+    def _decrypt_legacy(self, encrypted_data: bytes) -> Dict[str, Dict[str, Any]]:
+        """Decrypt credentials saved in a format older than V4"""
+        if encrypted_data.startswith(CREDENTIALS_FORMAT_V3):
+            tokens = _loads(encrypted_data[len(CREDENTIALS_FORMAT_V3) :])
+            return {
+                service: _loads(self._legacy_aesgcm.decrypt(base64.b64decode(token)))
+                for service, token in tokens.items()
+            }
+
+        if encrypted_data.startswith(CREDENTIALS_FORMAT_V2):
+            tokens = _loads(encrypted_data[len(CREDENTIALS_FORMAT_V2) :])
+            return {
+                service: _loads(self._legacy_cipher.decrypt(token.encode("ascii")))
+                for service, token in tokens.items()
+            }
+
+        # One token over the whole credentials blob
+        return _loads(self._legacy_cipher.decrypt(encrypted_data))
+
+    def _rebuild_db_connection_index(self):
+        """Rebuild the index of database connection names"""
+        self._db_connection_names = {
+            svc[3:]: None for svc in self.credentials if svc.startswith("db_")
+        }
 
-    def _save_credentials(self):
-        """Save encrypted credentials"""
+    def _save_credentials(self) -> bool:
+        """Save encrypted credentials, returning whether they were written"""
         try:
-            credentials_json = json.dumps(self.credentials).encode("utf-8")
-
-            if self.cipher:
-                # Encrypt credentials
-                encrypted_data = self.cipher.encrypt(credentials_json)
-            else:
-                # No encryption available
-                encrypted_data = credentials_json
-
-            with open(self.credentials_file, "wb") as f:
-                f.write(encrypted_data)
-
-            # Secure the credentials file (Unix only)
-            try:
-                os.chmod(self.credentials_file, 0o600)
-            except Exception:
-                pass
+            with self._data_lock:
+                if self.cipher:
+                    # Encrypt each credential set on its own
+                    encrypted_data = CREDENTIALS_FORMAT_V4 + _dumps(
+                        self.credentials.encrypted()
+                    )
+                else:
+                    # No encryption available
+                    encrypted_data = _dumps(dict(self.credentials))
+
+                # Temp file is created 0600, so the credentials stay private
+                _atomic_write(self.credentials_file, encrypted_data)
+
+                self._credentials_mtime = self.credentials_file.stat().st_mtime
+                self._credentials_checked_at = time.monotonic()
 
             logger.info("Saved credentials")
+            return True
 
         except Exception as e:
             logger.error(f"Error saving credentials: {str(e)}")
+            return False
 
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
-        keys = key.split(".")
+        # Walk self.config on every call rather than keeping an index, so
+        # values changed in place (through self.config or a returned dict)
+        # are always seen
         value = self.config
-
-        for k in keys:
+        for k in _config_path(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -188,37 +530,128 @@ class ConfigManager:
 
     def set_config(self, key: str, value: Any):
         """Set configuration value"""
-        keys = key.split(".")
-        config = self.config
+        with self._data_lock:
+            # Skip no-op updates
+            if _unchanged(self.get_config(key, _MISSING), value):
+                return
+
+            keys = _config_path(key)
+            config = self.config
 
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
 
-        config[keys[-1]] = value
-        self._save_config()
+            config[keys[-1]] = value
+
+            self._schedule_flush(config=True)
         logger.info(f"Updated config: {key}")
 
+    def _schedule_flush(
+        self,
+        config: bool = False,
+        credentials: bool = False,
+        delay: float = FLUSH_DELAY,
+    ):
+        """Mark data dirty and write it out once updates go quiet"""
+        with self._flush_lock:
+            self._dirty_config = self._dirty_config or config
+            self._dirty_credentials = self._dirty_credentials or credentials
+
+            # Inside batch() the write happens when the outermost block exits
+            if self._batch_depth == 0 and self._flush_timer is None:
+                self._flush_timer = threading.Timer(delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    @contextmanager
+    def batch(self) -> Iterator["ConfigManager"]:
+        """Defer config and credential writes until the block exits"""
+        with self._flush_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._flush_lock:
+                self._batch_depth -= 1
+                done = self._batch_depth == 0
+            if done:
+                self.flush()
+
+    def flush(self):
+        """Write any pending config and credential changes to disk"""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            # Changes made while saving mark the data dirty again
+            config, self._dirty_config = self._dirty_config, False
+            credentials, self._dirty_credentials = self._dirty_credentials, False
+
+        config_failed = config and not self._save_config()
+        credentials_failed = credentials and not self._save_credentials()
+
+        if config_failed or credentials_failed:
+            # Keep the changes pending and try again later
+            self._schedule_flush(
+                config=config_failed,
+                credentials=credentials_failed,
+                delay=FLUSH_RETRY_DELAY,
+            )
+
+    def _refresh_credentials(self):
+        """Reload credentials if the file changed since it was last read"""
+        if self._dirty_credentials:
+            # Unsaved local changes take precedence over the file
+            return
+
+        now = time.monotonic()
+        if now - self._credentials_checked_at < CREDENTIALS_RECHECK_INTERVAL:
+            return
+        self._credentials_checked_at = now
+
+        try:
+            mtime = self.credentials_file.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        with self._data_lock:
+            # Re-check under the lock: a local change or save may have landed
+            if mtime != self._credentials_mtime and not self._dirty_credentials:
+                self._load_credentials()
+
     def get_credentials(self, service: str) -> Optional[Dict[str, Any]]:
         """Get credentials for a service"""
+        self._refresh_credentials()
         return self.credentials.get(service)
 
     def set_credentials(self, service: str, credentials: Dict[str, Any]):
         """Set credentials for a service"""
-        self.credentials[service] = credentials
-        self._save_credentials()
+        with self._data_lock:
+            if _unchanged(self.credentials.get(service, _MISSING), credentials):
+                return
+
+            self.credentials[service] = credentials
+            if service.startswith("db_"):
+                self._db_connection_names[service[3:]] = None
+            self._schedule_flush(credentials=True)
         logger.info(f"Updated credentials for: {service}")
 
     def delete_credentials(self, service: str) -> bool:
         """Delete credentials for a service"""
-        if service in self.credentials:
+        with self._data_lock:
+            if service not in self.credentials:
+                return False
+
             del self.credentials[service]
-            self._save_credentials()
-            logger.info(f"Deleted credentials for: {service}")
-            return True
+            if service.startswith("db_"):
+                self._db_connection_names.pop(service[3:], None)
+            self._schedule_flush(credentials=True)
 
-        return False
+        logger.info(f"Deleted credentials for: {service}")
+        return True
 
     def list_services(self) -> list:
         """List all services with stored credentials"""
@@ -236,13 +669,15 @@ class ConfigManager:
         """Get database connection credentials"""
         return self.get_credentials(f"db_{name}")
 
+    def get_database_credential(self, name: str) -> Optional[DatabaseCredential]:
+        """Get database connection credentials as a typed object"""
+        self._refresh_credentials()
+        return self.credentials.typed(f"db_{name}")
+
     def list_database_connections(self) -> list:
         """List all database connections"""
-        return [
-            svc.replace("db_", "")
-            for svc in self.credentials.keys()
-            if svc.startswith("db_")
-        ]
+        self._refresh_credentials()
+        return list(self._db_connection_names)
 
     def add_api_key(
         self,
@@ -256,10 +691,15 @@ class ConfigManager:
             params.update(additional_params)
         self.set_credentials(f"api_{service}", params)
 
+    def get_api_credential(self, service: str) -> Optional[ApiCredential]:
+        """Get API credentials for a service as a typed object"""
+        self._refresh_credentials()
+        return self.credentials.typed(f"api_{service}")
+
     def get_api_key(self, service: str) -> Optional[str]:
         """Get API key for a service"""
-        creds = self.get_credentials(f"api_{service}")
-        return creds.get("api_key") if creds else None
+        cred = self.get_api_credential(service)
+        return cred.api_key if cred else None
 
     def export_config(self, file_path: str, include_credentials: bool = False):
         """Export configuration to file"""
@@ -267,10 +707,10 @@ class ConfigManager:
             export_data = {"config": self.config}
 
             if include_credentials:
-                export_data["credentials"] = self.credentials
+                export_data["credentials"] = dict(self.credentials)
 
-            with open(file_path, "w") as f:
-                json.dump(export_data, f, indent=2)
+            with open(file_path, "wb") as f:
+                f.write(_dumps(export_data, indent=True))
 
             logger.info(f"Exported configuration to: {file_path}")
             return True
@@ -279,19 +719,38 @@ class ConfigManager:
             logger.error(f"Error exporting config: {str(e)}")
             return False
 
-    def import_config(self, file_path: str):
-        """Import configuration from file"""
+    def import_config(
+        self, file_path: str, sections: Tuple[str, ...] = ("config", "credentials")
+    ):
+        """Import configuration from file, loading only the requested sections"""
         try:
-            with open(file_path, "r") as f:
-                import_data = json.load(f)
-
-            if "config" in import_data:
-                self.config = import_data["config"]
-                self._save_config()
-
-            if "credentials" in import_data:
-                self.credentials = import_data["credentials"]
-                self._save_credentials()
+            with open(file_path, "rb") as f:
+                if ijson:
+                    # One streaming pass per requested section: ijson only
+                    # builds objects under the matching prefix, so skipped
+                    # sections are tokenised but never materialised
+                    import_data = {}
+                    for section in sections:
+                        f.seek(0)
+                        for value in ijson.items(f, section, use_float=True):
+                            import_data[section] = value
+                            break
+                else:
+                    import_data = _loads(f.read())
+
+            with self._data_lock:
+                if "config" in import_data and "config" in sections:
+                    self.config = import_data["config"]
+                    self._schedule_flush(config=True)
+
+                if "credentials" in import_data and "credentials" in sections:
+                    self.credentials = _CredentialStore(
+                        self.cipher, plain=import_data["credentials"]
+                    )
+                    self._rebuild_db_connection_index()
+                    self._schedule_flush(credentials=True)
+
+            self.flush()
 
             logger.info(f"Imported configuration from: {file_path}")
             return True
@@ -301,5 +760,15 @@ class ConfigManager:
             return False
 
 
-# Global configuration manager instance
-config_manager = ConfigManager()
+# Global configuration manager instance, created lazily on first access
+_config_manager_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """Create the global config_manager instance on first access (PEP 562)"""
+    if name == "config_manager":
+        with _config_manager_lock:
+            if "config_manager" not in globals():
+                globals()["config_manager"] = ConfigManager()
+        return globals()["config_manager"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,24 +3,243 @@ Database Connection Manager
 Manages connections to multiple database types with pooling and retry logic
 """
 
+import functools
+import hashlib
+import inspect
+import json
 import logging
+import re
+import sys
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 logger = logging.getLogger(__name__)
 
+# Statements after which cached schema metadata can no longer be trusted
+_DDL_RE = re.compile(
+    r"^\s*(CREATE|ALTER|DROP|TRUNCATE|RENAME|COMMENT)\b", re.IGNORECASE
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize driver values JSON has no type for (dates, Decimal, ...)"""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def rows_to_ndjson(rows: List[Dict[str, Any]]) -> bytes:
+    """Encode row dictionaries as newline-delimited JSON, using orjson if present"""
+    if orjson:
+        return b"".join(
+            orjson.dumps(row, default=_json_default) + b"\n" for row in rows
+        )
+    return "".join(
+        json.dumps(
+            row, default=_json_default, ensure_ascii=False, separators=(",", ":")
+        )
+        + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+
+def column_names(cursor: Any) -> List[str]:
+    """Return an executed cursor's column names as interned strings
+
+    Drivers create fresh name strings for every execute; interning lets
+    every row dictionary, across queries, share one key object per name.
+    """
+    return [sys.intern(desc[0]) for desc in cursor.description]
+
+
+def rows_to_dicts(columns: List[str], rows: List[tuple]) -> List[Dict[str, Any]]:
+    """Convert a columnar result into a list of row dictionaries"""
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def columnar_to_arrow(result: Dict[str, Any]) -> "pa.Table":
+    """Convert a columnar result into a pyarrow.Table"""
+    if pa is None:
+        raise ImportError("pyarrow is not installed. Install with: pip install pyarrow")
+
+    columns = result["columns"]
+    if result["rows"]:
+        arrays = [pa.array(values) for values in zip(*result["rows"])]
+    else:
+        arrays = [pa.array([], type=pa.null()) for _ in columns]
+    return pa.Table.from_arrays(arrays, names=columns)
+
+
+def group_rows(
+    result: Dict[str, Any], key_columns: int = 1
+) -> Dict[Any, List[Dict[str, Any]]]:
+    """Group a columnar result by its first column
+
+    The grouping column is dropped from each row dictionary, so a query over
+    many tables can be split back into the per-table row lists it replaces.
+    Rows are expected to be ordered by that column (ORDER BY in the query),
+    which lets each run of rows become one list without a per-row lookup.
+    With key_columns > 1 the leading columns are grouped on together and
+    each key is a tuple, e.g. (schema, table).
+    """
+    columns = result["columns"][key_columns:]
+    if key_columns == 1:
+        keyfunc = itemgetter(0)
+    else:
+        keyfunc = itemgetter(*range(key_columns))
+    grouped: Dict[Any, List[Dict[str, Any]]] = {}
+    for key, rows in groupby(result["rows"], key=keyfunc):
+        group = [dict(zip(columns, row[key_columns:])) for row in rows]
+        if key in grouped:
+            # Tolerate unordered input by merging repeated runs
+            grouped[key].extend(group)
+        else:
+            grouped[key] = group
+    return grouped
+
+
+def fetch_rows(cursor: Any, chunk_size: int) -> List[tuple]:
+    """Fetch an executed cursor's rows with fetchmany() round trips of chunk_size"""
+    rows: List[tuple] = []
+    while True:
+        chunk = cursor.fetchmany(chunk_size)
+        if not chunk:
+            return rows
+        rows.extend(chunk)
+
+
+def fetch_dicts(cursor: Any, chunk_size: int) -> List[Dict[str, Any]]:
+    """Fetch an executed cursor's rows as dictionaries, one batch at a time
+
+    Converting each fetchmany() batch as it arrives means the full list of
+    row tuples is never held alongside the dictionaries built from it.
+    """
+    names = column_names(cursor)
+    data: List[Dict[str, Any]] = []
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return data
+        data.extend(rows_to_dicts(names, rows))
+
+
+def iter_cursor_batches(
+    conn: Any, cursor: Any, chunk_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield batches of row dictionaries from an executed DB-API cursor"""
+    if not cursor.description:
+        # Query doesn't return data (INSERT, UPDATE, DELETE)
+        conn.commit()
+        yield [{"rows_affected": cursor.rowcount, "status": "success"}]
+        return
+
+    names = column_names(cursor)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield rows_to_dicts(names, rows)
+
+
+class _CachedFailure:
+    """Metadata cache entry recording that a load raised"""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def cached_metadata(
+    method: Optional[Callable] = None,
+    *,
+    ttl: Optional[float] = None,
+    error_ttl: Optional[float] = None,
+) -> Callable:
+    """Serve a metadata method from the connection's TTL cache
+
+    The cache key is the method name plus its arguments, so each schema or
+    table is cached separately. ttl caps the connection's meta_ttl for this
+    method; with error_ttl, a failed load is re-raised from the cache for
+    that long instead of hitting the database again on every retry.
+    """
+    if method is None:
+        return functools.partial(cached_metadata, ttl=ttl, error_ttl=error_ttl)
+
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Bind so positional, keyword and defaulted calls share one entry
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__,) + tuple(bound.arguments.values())[1:]
+        return self._cached(
+            key, lambda: method(self, *args, **kwargs), ttl=ttl, error_ttl=error_ttl
+        )
+
+    return wrapper
+
 
 class DatabaseConnection(ABC):
     """Abstract base class for database connections"""
 
+    # Seconds a successful connectivity check stays valid
+    HEALTHCHECK_TTL = 5.0
+
+    # Default seconds cached schema metadata stays valid ("meta_ttl" config)
+    METADATA_TTL = 300.0
+
+    # Most metadata results kept per connection
+    METADATA_CACHE_SIZE = 256
+
+    # Seconds schema/database lists stay cached, and failed lookups of them
+    SCHEMA_LIST_TTL = 60.0
+    SCHEMA_LIST_ERROR_TTL = 5.0
+
     def __init__(self, connection_id: str, config: Dict[str, Any]):
         self.connection_id = connection_id
         self.config = config
         self.connection = None
-        self.last_used = None
+        self._last_healthcheck_mono = 0.0
+        self._info_cache: Optional[Dict[str, Any]] = None
+        self._info_cache_key: Optional[tuple] = None
+        # Ordered from least to most recently used; values are (expiry, result)
+        self._meta_cache: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        # Request threads share the cache; loaders run outside the lock
+        self._meta_lock = threading.Lock()
+        self._meta_ttl = config.get("meta_ttl", self.METADATA_TTL)
+        # Monotonic timestamp; converted to wall-clock only when reported
+        self.last_used_monotonic: Optional[float] = None
         self.created_at = datetime.now()
 
+    @property
+    def last_used(self) -> Optional[datetime]:
+        """Wall-clock time the connection was last fetched from the pool"""
+        if self.last_used_monotonic is None:
+            return None
+        elapsed = time.monotonic() - self.last_used_monotonic
+        return datetime.now() - timedelta(seconds=elapsed)
+
     @abstractmethod
     def connect(self) -> bool:
         """Establish database connection"""
@@ -36,6 +255,114 @@ class DatabaseConnection(ABC):
         """Execute a query and return results"""
         pass
 
+    def execute_query_columnar(
+        self, query: str, params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Execute a query and return {"columns": [...], "rows": [tuple, ...]}
+
+        Connectors whose drivers return tuples override this to skip building
+        a dictionary per row.
+        """
+        results = self.execute_query(query, params)
+        columns = list(results[0].keys()) if results else []
+        return {"columns": columns, "rows": [tuple(row.values()) for row in results]}
+
+    def execute_query_arrow(self, query: str, params: Optional[Dict] = None) -> Any:
+        """Execute a query and return a column-oriented pyarrow.Table
+
+        Requires pyarrow. Connectors whose drivers can fetch Arrow data
+        directly override this.
+        """
+        return columnar_to_arrow(self.execute_query_columnar(query, params))
+
+    def execute_query_ndjson(
+        self, query: str, params: Optional[Dict] = None, chunk_size: int = 1000
+    ) -> Iterator[bytes]:
+        """Execute a query and stream it as newline-delimited JSON
+
+        Each yielded chunk holds up to chunk_size rows, one JSON object per
+        line, so a streaming HTTP response never holds the whole result.
+        """
+        for batch in self.execute_query_iter(query, params, chunk_size):
+            yield rows_to_ndjson(batch)
+
+    def execute_query_iter(
+        self, query: str, params: Optional[Dict] = None, chunk_size: int = 1000
+    ) -> Iterator[List[Dict]]:
+        """Execute a query and yield results in batches of up to chunk_size rows
+
+        Connectors with cursor support override this to stream from the
+        driver instead of materializing the full result first.
+        """
+        results = self.execute_query(query, params)
+        for start in range(0, len(results), chunk_size):
+            yield results[start : start + chunk_size]
+
+    def _cached(
+        self,
+        key: tuple,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+        error_ttl: Optional[float] = None,
+    ) -> Any:
+        """Return a cached metadata result, loading it when missing or stale"""
+        now = time.monotonic()
+        with self._meta_lock:
+            entry = self._meta_cache.get(key)
+            if entry is not None and now < entry[0]:
+                self._meta_cache.move_to_end(key)
+            else:
+                entry = None
+        if entry is not None:
+            if isinstance(entry[1], _CachedFailure):
+                raise entry[1].error
+            return entry[1]
+
+        try:
+            value = loader()
+        except Exception as e:
+            if error_ttl:
+                self._store_metadata(key, now + error_ttl, _CachedFailure(e))
+            raise
+
+        if ttl is not None:
+            ttl = min(ttl, self._meta_ttl)
+        else:
+            ttl = self._meta_ttl
+        self._store_metadata(key, now + ttl, value)
+        return value
+
+    def _store_metadata(self, key: tuple, expires: float, value: Any) -> None:
+        """Insert a metadata cache entry, evicting the least recently used"""
+        with self._meta_lock:
+            self._meta_cache[key] = (expires, value)
+            self._meta_cache.move_to_end(key)
+            while len(self._meta_cache) > self.METADATA_CACHE_SIZE:
+                self._meta_cache.popitem(last=False)
+
+    def invalidate_metadata(self, table: Optional[str] = None) -> None:
+        """Drop cached metadata, or only what may describe the given table
+
+        Schema-wide results (table lists, full schemas) are always dropped
+        since they include every table.
+        """
+        with self._meta_lock:
+            if table is None:
+                self._meta_cache.clear()
+                return
+
+            table = table.lower()
+            for key in list(self._meta_cache):
+                if key[0] != "get_table_info" or (
+                    len(key) > 1 and str(key[1]).lower() == table
+                ):
+                    del self._meta_cache[key]
+
+    def _check_ddl(self, query: str) -> None:
+        """Invalidate cached metadata after a schema-changing statement"""
+        if _DDL_RE.match(query):
+            self.invalidate_metadata()
+
     @abstractmethod
     def get_schema(self, database: Optional[str] = None) -> Dict[str, Any]:
         """Get database schema information"""
@@ -64,18 +391,211 @@ class DatabaseConnection(ABC):
 
     def get_connection_info(self) -> Dict[str, Any]:
         """Get connection metadata"""
-        return {
+        # Reuse the last result while connection state and the last-used
+        # second are unchanged
+        is_connected = self.is_connected()
+        used_second = (
+            int(self.last_used_monotonic)
+            if self.last_used_monotonic is not None
+            else None
+        )
+        cache_key = (is_connected, used_second)
+        if self._info_cache is not None and cache_key == self._info_cache_key:
+            return self._info_cache
+
+        last_used = self.last_used
+        self._info_cache_key = cache_key
+        self._info_cache = {
             "connection_id": self.connection_id,
             "type": self.__class__.__name__,
-            "is_connected": self.is_connected(),
+            "is_connected": is_connected,
             "created_at": self.created_at.isoformat(),
-            "last_used": self.last_used.isoformat() if self.last_used else None,
+            "last_used": last_used.isoformat() if last_used else None,
             "config": {
                 k: v
                 for k, v in self.config.items()
                 if k not in ["password", "api_key", "token"]
             },
         }
+        return self._info_cache
+
+
+def password_digest(password: Optional[str]) -> str:
+    """Digest standing in for a password in long-lived pool cache keys"""
+    return hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+
+
+def shared_pool(
+    pools: Dict[tuple, Any],
+    lock: threading.Lock,
+    key: tuple,
+    create: Callable[[], Any],
+) -> Any:
+    """Return the driver pool cached under key, creating it if missing
+
+    create() runs outside lock, so a slow or unreachable server does not hold
+    up connections to other databases; concurrent callers for the same key
+    wait on the first caller's attempt. A pool whose creation raises is not
+    cached.
+    """
+    with lock:
+        entry = pools.get(key)
+        creating = entry is None
+        if creating:
+            entry = pools[key] = Future()
+
+    if not isinstance(entry, Future):
+        return entry
+    if not creating:
+        return entry.result()
+
+    try:
+        pool = create()
+    except BaseException as e:
+        with lock:
+            del pools[key]
+        entry.set_exception(e)
+        raise
+
+    with lock:
+        pools[key] = pool
+    entry.set_result(pool)
+    return pool
+
+
+class HandoffPool:
+    """Pool of raw driver connections that hands them straight to waiters
+
+    Idle connections, free slots and queued waiters are guarded by one lock.
+    When every connection is in use, callers queue a Future that the next
+    release completes directly, which keeps waiters in FIFO order. A
+    borrowed connection that is garbage collected without being returned
+    gives its slot back, so a leaked connection does not shrink the pool.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_size: int = 10,
+        timeout: float = 30.0,
+        reset: Optional[Callable[[Any], None]] = None,
+    ):
+        self._factory = factory
+        self._reset = reset
+        self.timeout = timeout
+        # Reentrant: a leaked connection's finalizer can run during garbage
+        # collection triggered while this thread already holds the lock
+        self._lock = threading.RLock()
+        self._idle: "deque[Any]" = deque()
+        self._waiters: "deque[Future]" = deque()
+        # Connections that may still be opened
+        self._free = max_size
+        # Borrowed connections -> finalizer returning their slot if leaked
+        self._leases: Dict[int, Any] = {}
+
+    def getconn(self) -> Any:
+        """Take an idle connection, open a new one, or wait for a release"""
+        with self._lock:
+            if self._idle:
+                return self._lease(self._idle.pop())
+            if self._free:
+                self._free -= 1
+                waiter = None
+            else:
+                waiter = Future()
+                self._waiters.append(waiter)
+
+        if waiter is None:
+            return self._lease(self._open())
+
+        try:
+            conn = waiter.result(self.timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    # A release claimed this waiter just as it timed out
+                    pass
+                else:
+                    raise TimeoutError(
+                        f"No database connection available within {self.timeout}s"
+                    )
+            conn = waiter.result()
+
+        # None hands over a free slot rather than a connection
+        return self._lease(self._open() if conn is None else conn)
+
+    def putconn(self, conn: Any, close: bool = False) -> None:
+        """Return a connection, closing it if asked or if it cannot be reset"""
+        finalizer = self._leases.pop(id(conn), None)
+        if finalizer is not None:
+            finalizer.detach()
+
+        if not close and self._reset is not None:
+            try:
+                self._reset(conn)
+            except Exception as e:
+                logger.warning(f"Discarding pooled connection: {str(e)}")
+                close = True
+
+        if close:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            self._hand_off(None)
+        else:
+            self._hand_off(conn)
+
+    def closeall(self) -> None:
+        """Close every idle connection"""
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for conn in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            self._hand_off(None)
+
+    def _open(self) -> Any:
+        """Open a connection for a claimed slot, giving the slot back on error"""
+        try:
+            return self._factory()
+        except Exception:
+            self._hand_off(None)
+            raise
+
+    def _lease(self, conn: Any) -> Any:
+        """Record a borrowed connection so its slot is freed if it is leaked"""
+        key = id(conn)
+        try:
+            finalizer = weakref.finalize(conn, self._reclaim, key)
+        except TypeError:
+            # Driver connection without weak reference support
+            return conn
+        finalizer.atexit = False
+        self._leases[key] = finalizer
+        return conn
+
+    def _reclaim(self, key: int) -> None:
+        """Give back the slot of a borrowed connection that was never returned"""
+        self._leases.pop(key, None)
+        logger.warning("Pooled connection was not returned; freeing its slot")
+        self._hand_off(None)
+
+    def _hand_off(self, conn: Any) -> None:
+        """Give a connection (or a free slot when None) to the oldest waiter"""
+        with self._lock:
+            if not self._waiters:
+                if conn is None:
+                    self._free += 1
+                else:
+                    self._idle.append(conn)
+                return
+            waiter = self._waiters.popleft()
+        waiter.set_result(conn)
 
 
 class ConnectionPool:
@@ -83,19 +603,25 @@ class ConnectionPool:
 
     def __init__(self, max_connections: int = 10):
         self.max_connections = max_connections
-        self.connections: Dict[str, DatabaseConnection] = {}
+        # Ordered from least to most recently used
+        self.connections: "OrderedDict[str, DatabaseConnection]" = OrderedDict()
+        # Per-connection usage counts (statistics only)
         self.connection_usage: Dict[str, int] = {}
 
     def add_connection(
         self, connection_id: str, connection: DatabaseConnection
     ) -> bool:
         """Add a new connection to the pool"""
-        if len(self.connections) >= self.max_connections:
+        if (
+            connection_id not in self.connections
+            and len(self.connections) >= self.max_connections
+        ):
             logger.warning(f"Connection pool is full (max: {self.max_connections})")
-            # Remove least used connection
+            # Remove least recently used connection
             self._remove_least_used_connection()
 
         self.connections[connection_id] = connection
+        self.connections.move_to_end(connection_id)
         self.connection_usage[connection_id] = 0
         logger.info(f"Added connection: {connection_id}")
         return True
@@ -104,8 +630,9 @@ class ConnectionPool:
         """Get a connection from the pool"""
         connection = self.connections.get(connection_id)
         if connection:
+            self.connections.move_to_end(connection_id)
             self.connection_usage[connection_id] += 1
-            connection.last_used = datetime.now()
+            connection.last_used_monotonic = time.monotonic()
         return connection
 
     def remove_connection(self, connection_id: str) -> bool:
@@ -121,11 +648,11 @@ class ConnectionPool:
         return False
 
     def _remove_least_used_connection(self):
-        """Remove the least used connection"""
-        if not self.connection_usage:
+        """Remove the least recently used connection"""
+        if not self.connections:
             return
 
-        least_used_id = min(self.connection_usage, key=self.connection_usage.get)
+        least_used_id = next(iter(self.connections))
         self.remove_connection(least_used_id)
 
     def get_all_connections(self) -> Dict[str, Dict[str, Any]]:
@@ -183,6 +710,16 @@ class DatabaseManager:
         """Get a connection from the pool"""
         return self.pool.get_connection(connection_id)
 
+    def _ensure_connected(self, connection: DatabaseConnection):
+        """Reconnect if needed, re-checking at most once per HEALTHCHECK_TTL"""
+        now = time.monotonic()
+        if now - connection._last_healthcheck_mono < connection.HEALTHCHECK_TTL:
+            return
+
+        if not connection.is_connected():
+            connection.connect()
+        connection._last_healthcheck_mono = now
+
     def remove_connection(self, connection_id: str) -> bool:
         """Remove a connection"""
         return self.pool.remove_connection(connection_id)
@@ -196,9 +733,7 @@ class DatabaseManager:
             return {"success": False, "error": f"Connection not found: {connection_id}"}
 
         try:
-            # Reconnect if needed
-            if not connection.is_connected():
-                connection.connect()
+            self._ensure_connected(connection)
 
             results = connection.execute_query(query, params)
             return {
@@ -208,7 +743,34 @@ class DatabaseManager:
                 "connection_id": connection_id,
             }
         except Exception as e:
-            logger.error(f"Query execution error on {connection_id}: {str(e)}")
+            # Force a connectivity check on the next call
+            connection._last_healthcheck_mono = 0.0
+            logger.error("Query execution error on %s: %s", connection_id, e)
+            return {"success": False, "error": str(e), "connection_id": connection_id}
+
+    def execute_query_columnar(
+        self, connection_id: str, query: str, params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Execute a query and return column names plus row tuples"""
+        connection = self.get_connection(connection_id)
+        if not connection:
+            return {"success": False, "error": f"Connection not found: {connection_id}"}
+
+        try:
+            self._ensure_connected(connection)
+
+            result = connection.execute_query_columnar(query, params)
+            return {
+                "success": True,
+                "columns": result["columns"],
+                "rows": result["rows"],
+                "row_count": len(result["rows"]),
+                "connection_id": connection_id,
+            }
+        except Exception as e:
+            # Force a connectivity check on the next call
+            connection._last_healthcheck_mono = 0.0
+            logger.error("Query execution error on %s: %s", connection_id, e)
             return {"success": False, "error": str(e), "connection_id": connection_id}
 
     def fetch_one(
@@ -225,11 +787,50 @@ class DatabaseManager:
         Returns:
             First row as dict or None if no results
         """
-        result = self.execute_query(connection_id, query, params)
-        if result.get("success") and result.get("data"):
-            return result["data"][0] if len(result["data"]) > 0 else None
+        result = self.execute_query_columnar(connection_id, query, params)
+        if result.get("success") and result.get("rows"):
+            return dict(zip(result["columns"], result["rows"][0]))
         return None
 
+    def fetch_iter(
+        self,
+        connection_id: str,
+        query: str,
+        params: Optional[tuple] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute query and yield rows as dictionaries without holding them all
+
+        Args:
+            connection_id: Database connection ID
+            query: SQL query
+            params: Query parameters as tuple
+            chunk_size: Number of rows fetched from the driver at a time
+
+        Yields:
+            Rows as dicts; nothing if the connection is missing
+
+        Raises:
+            Exception: The driver error if the query fails, including after
+                some rows were already yielded
+        """
+        connection = self.get_connection(connection_id)
+        if not connection:
+            logger.error("Connection not found: %s", connection_id)
+            return
+
+        try:
+            self._ensure_connected(connection)
+
+            for batch in connection.execute_query_iter(query, params, chunk_size):
+                yield from batch
+        except Exception as e:
+            # Force a connectivity check on the next call
+            connection._last_healthcheck_mono = 0.0
+            logger.error("Query execution error on %s: %s", connection_id, e)
+            raise
+
     def fetch_all(
         self, connection_id: str, query: str, params: Optional[tuple] = None
     ) -> List[Dict[str, Any]]:
@@ -244,10 +845,11 @@ class DatabaseManager:
         Returns:
             List of rows as dicts or empty list if no results
         """
-        result = self.execute_query(connection_id, query, params)
-        if result.get("success") and result.get("data"):
-            return result["data"]
-        return []
+        try:
+            return list(self.fetch_iter(connection_id, query, params))
+        except Exception:
+            # Already logged by fetch_iter; never hand back a partial result
+            return []
 
     def get_schema(
         self, connection_id: str, database: Optional[str] = None
@@ -319,5 +921,15 @@ class DatabaseManager:
         self.pool.close_all()
 
 
-# Global database manager instance
-db_manager = DatabaseManager()
+# Global database manager instance, created lazily on first access
+_db_manager_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """Create the global db_manager instance on first access (PEP 562)"""
+    if name == "db_manager":
+        with _db_manager_lock:
+            if "db_manager" not in globals():
+                globals()["db_manager"] = DatabaseManager()
+        return globals()["db_manager"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,47 +3,197 @@ File System Connector
 Handles reading files from local and network file systems
 """
 
+import fnmatch
 import logging
 import mimetypes
 import os
+import re
+import stat as stat_module
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+# ({directory: mtime_ns}, {lower-cased file name: [paths]})
+_NameIndex = Tuple[Dict[str, int], Dict[str, List[str]]]
+
+
+def _split_glob_prefix(pattern: str) -> Tuple[str, str]:
+    """Split a glob into its leading literal directories and the rest"""
+    parts = pattern.replace(os.sep, "/").split("/")
+    for index, part in enumerate(parts):
+        if _GLOB_MAGIC.search(part):
+            return "/".join(parts[:index]), "/".join(parts[index:])
+    return "/".join(parts), ""
+
+
+@lru_cache(maxsize=128)
+def _compile_name_pattern(pattern: str) -> "re.Pattern":
+    """Compile a shell-style name pattern once for repeated searches"""
+    return re.compile(fnmatch.translate(pattern))
+
+
+class _CachedEntry:
+    """Directory entry replayed from the listing cache, mirroring os.DirEntry"""
+
+    __slots__ = ("name", "path", "_is_dir", "_is_file", "_is_symlink")
+
+    def __init__(self, entry: os.DirEntry):
+        self.name = entry.name
+        self.path = entry.path
+        self._is_dir = entry.is_dir()
+        self._is_file = entry.is_file()
+        self._is_symlink = entry.is_symlink()
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return self._is_dir and (follow_symlinks or not self._is_symlink)
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return self._is_file and (follow_symlinks or not self._is_symlink)
+
+    def is_symlink(self) -> bool:
+        return self._is_symlink
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        # File metadata is never cached, only the directory's member list
+        return os.stat(self.path, follow_symlinks=follow_symlinks)
+
+    def __fspath__(self) -> str:
+        return self.path
+
+
+@dataclass
+class FileInfo:
+    """File metadata; the less common attributes are computed on first access"""
+
+    name: str
+    path: str
+    extension: str
+    size: int
+    modified_time: float
+    stat_result: os.stat_result = field(repr=False, compare=False)
+    mime_types: Dict[str, Optional[str]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @cached_property
+    def absolute_path(self) -> str:
+        # Scans start from an absolute root, so entry paths usually already are
+        if os.path.isabs(self.path):
+            return self.path
+        return os.path.abspath(self.path)
+
+    @cached_property
+    def created_time(self) -> float:
+        return self.stat_result.st_ctime
+
+    @cached_property
+    def accessed_time(self) -> float:
+        return self.stat_result.st_atime
+
+    @cached_property
+    def is_readonly(self) -> bool:
+        return not self.stat_result.st_mode & stat_module.S_IWUSR
+
+    @cached_property
+    def mime_type(self) -> Optional[str]:
+        extension = self.extension.lower()
+        if extension in self.mime_types:
+            return self.mime_types[extension]
+        return mimetypes.guess_type(self.name)[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Full metadata in the format returned by list_files"""
+        return {
+            "name": self.name,
+            "path": self.absolute_path,
+            "extension": self.extension,
+            "size": self.size,
+            "created_time": self.created_time,
+            "modified_time": self.modified_time,
+            "accessed_time": self.accessed_time,
+            "is_readonly": self.is_readonly,
+            "mime_type": self.mime_type,
+        }
+
 
 class FileSystemConnector:
     """Local and network file system connector"""
 
-    def __init__(self, base_path: Optional[str] = None):
+    # Number of directory listings kept for re-use between scans
+    LISTING_CACHE_SIZE = 1024
+    # Number of search roots whose file names are indexed for exact lookups
+    NAME_INDEX_ROOTS = 8
+    # Lifetime (seconds) and size of the optional get_file_metadata stat cache
+    STAT_CACHE_TTL = 1.0
+    STAT_CACHE_SIZE = 4096
+    # Entries gathered per batch before their metadata is collected
+    STAT_BATCH_SIZE = 1024
+    # Below this many entries a batch is stat'ed inline rather than threaded
+    PARALLEL_STAT_THRESHOLD = 64
+
+    def __init__(self, base_path: Optional[str] = None, cache_stats: bool = False):
         self.base_path = Path(base_path) if base_path else Path.cwd()
-        self.allowed_extensions = [
-            # Documents
-            ".txt",
-            ".pdf",
-            ".doc",
-            ".docx",
-            ".odt",
-            # Spreadsheets
-            ".csv",
-            ".xlsx",
-            ".xls",
-            ".ods",
-            # Presentations
-            ".pptx",
-            ".ppt",
-            ".odp",
-            # Data files
-            ".json",
-            ".xml",
-            ".yaml",
-            ".yml",
-            # Logs
-            ".log",
-            # Markdown
-            ".md",
-            ".markdown",
-        ]
+        # Opt-in short-lived cache of stat results for repeated metadata lookups
+        self.cache_stats = cache_stats
+        self._stat_cache: "OrderedDict[str, Tuple[float, os.stat_result]]" = (
+            OrderedDict()
+        )
+        self._listing_cache: "OrderedDict[str, Tuple[int, List[_CachedEntry]]]" = (
+            OrderedDict()
+        )
+        self._listing_lock = threading.Lock()
+        self._name_indexes: "OrderedDict[str, _NameIndex]" = OrderedDict()
+        # Running totals for reads; individual reads only log at DEBUG
+        self._stats = {
+            "files_read": 0,
+            "chars_read": 0,
+            "bytes_read": 0,
+            "read_errors": 0,
+        }
+        self.allowed_extensions = frozenset(
+            {
+                # Documents
+                ".txt",
+                ".pdf",
+                ".doc",
+                ".docx",
+                ".odt",
+                # Spreadsheets
+                ".csv",
+                ".xlsx",
+                ".xls",
+                ".ods",
+                # Presentations
+                ".pptx",
+                ".ppt",
+                ".odp",
+                # Data files
+                ".json",
+                ".xml",
+                ".yaml",
+                ".yml",
+                # Logs
+                ".log",
+                # Markdown
+                ".md",
+                ".markdown",
+            }
+        )
+        # Static suffix -> MIME lookup for the extensions listed above
+        self._mime_types = {
+            ext: mimetypes.guess_type("file" + ext)[0]
+            for ext in self.allowed_extensions
+        }
 
     def set_base_path(self, path: str) -> bool:
         """Set the base path for file operations"""
@@ -58,6 +208,10 @@ class FileSystemConnector:
                 return False
 
             self.base_path = path_obj
+            with self._listing_lock:
+                self._listing_cache.clear()
+                self._name_indexes.clear()
+                self._stat_cache.clear()
             logger.info(f"Base path set to: {path}")
             return True
 
@@ -73,59 +227,258 @@ class FileSystemConnector:
     ) -> List[Dict[str, Any]]:
         """List files in a directory"""
         try:
-            search_path = Path(path) if path else self.base_path
-
-            if not search_path.exists():
-                logger.error(f"Path does not exist: {search_path}")
-                return []
-
-            files = []
-
-            if recursive:
-                pattern = "**/*"
-            else:
-                pattern = "*"
-
-            for file_path in search_path.glob(pattern):
-                if file_path.is_file():
-                    # Filter by extension
-                    if filter_extensions:
-                        if file_path.suffix.lower() not in filter_extensions:
-                            continue
-                    elif file_path.suffix.lower() not in self.allowed_extensions:
-                        continue
-
-                    file_info = self._get_file_info(file_path)
-                    files.append(file_info)
-
-            logger.info(f"Found {len(files)} files in {search_path}")
+            files = list(self.iter_files(path, recursive, filter_extensions))
+            logger.info(f"Found {len(files)} files in {path or self.base_path}")
             return files
 
         except Exception as e:
             logger.error(f"Error listing files: {str(e)}")
             return []
 
-    def _get_file_info(self, file_path: Path) -> Dict[str, Any]:
-        """Get metadata for a file"""
+    def iter_files(
+        self,
+        path: Optional[str] = None,
+        recursive: bool = False,
+        filter_extensions: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield file info for a directory one entry at a time"""
+        yield from self._iter_file_info(
+            self._iter_matching_entries(path, recursive, filter_extensions)
+        )
+
+    def iter_file_entries(
+        self,
+        path: Optional[str] = None,
+        recursive: bool = False,
+        filter_extensions: Optional[List[str]] = None,
+    ) -> Iterator[FileInfo]:
+        """Yield lightweight FileInfo objects that compute extra fields on demand"""
+        entries = self._iter_file_info(
+            self._iter_matching_entries(path, recursive, filter_extensions),
+            describe=self._try_file_entry,
+        )
+        # Files removed between the scan and the stat are skipped
+        yield from (entry for entry in entries if entry is not None)
+
+    def _iter_matching_entries(
+        self,
+        path: Optional[str],
+        recursive: bool,
+        filter_extensions: Optional[List[str]],
+    ) -> Iterator[os.DirEntry]:
+        """Yield directory entries whose extension is allowed"""
+        search_path = self._absolute_search_path(path)
+
+        if not search_path.exists():
+            logger.error(f"Path does not exist: {search_path}")
+            return
+
+        if filter_extensions:
+            extensions = frozenset(ext.lower() for ext in filter_extensions)
+        else:
+            extensions = self.allowed_extensions
+
+        # Filter by extension before touching the file metadata
+        for entry in self._scandir_walk(search_path, recursive):
+            if self._suffix(entry.name).lower() in extensions:
+                yield entry
+
+    def _iter_file_info(
+        self, entries: Iterator[Any], describe: Optional[Callable] = None
+    ) -> Iterator[Any]:
+        """Collect file info for entries in order, stat'ing large batches in threads"""
+        describe = describe or self._get_file_info
+        executor = None
+        try:
+            while True:
+                batch = list(islice(entries, self.STAT_BATCH_SIZE))
+                if not batch:
+                    return
+
+                if len(batch) < self.PARALLEL_STAT_THRESHOLD:
+                    yield from map(describe, batch)
+                    continue
+
+                # stat() releases the GIL, so network filesystems overlap well
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=min(32, len(batch) // 100 + 4)
+                    )
+                yield from executor.map(describe, batch)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _absolute_search_path(self, path: Optional[str]) -> Path:
+        """Make the search root absolute once so scandir entry paths are too"""
+        return Path(os.path.abspath(path or self.base_path))
+
+    @staticmethod
+    def _suffix(name: str) -> str:
+        """Extension of a file name, matching Path.suffix"""
+        index = name.rfind(".")
+        if index <= 0 or index == len(name) - 1:
+            return ""
+        return name[index:]
+
+    def _scan_directory(self, path: str) -> List[Any]:
+        """List a directory, re-using the previous scan while its mtime is unchanged"""
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        with self._listing_lock:
+            cached = self._listing_cache.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                self._listing_cache.move_to_end(path)
+                return cached[1]
+
+        with os.scandir(path) as it:
+            entries = list(it)
+
+        # A directory modified within the last second may change again without
+        # its mtime moving on coarse-grained filesystems, so don't trust it yet
+        if time.time_ns() - mtime_ns > 1_000_000_000:
+            snapshot = [_CachedEntry(entry) for entry in entries]
+            with self._listing_lock:
+                self._listing_cache[path] = (mtime_ns, snapshot)
+                self._listing_cache.move_to_end(path)
+                while len(self._listing_cache) > self.LISTING_CACHE_SIZE:
+                    self._listing_cache.popitem(last=False)
+
+        return entries
+
+    def _find_by_name(self, root: Path, name: str) -> List[str]:
+        """Paths under root whose file name is exactly name, via a cached index"""
+        key = os.fspath(root)
+
+        with self._listing_lock:
+            cached = self._name_indexes.get(key)
+
+        if cached is None or not self._index_is_current(cached[0]):
+            cached = self._build_name_index(key)
+
+        return [
+            path
+            for path in cached[1].get(name.lower(), ())
+            if os.path.basename(path) == name
+        ]
+
+    @staticmethod
+    def _index_is_current(directories: Dict[str, int]) -> bool:
+        """True while no indexed directory has gained, lost or renamed entries"""
         try:
+            return all(
+                os.stat(directory).st_mtime_ns == mtime_ns
+                for directory, mtime_ns in directories.items()
+            )
+        except OSError:
+            return False
+
+    def _build_name_index(self, root: str) -> _NameIndex:
+        """Walk root once, recording directory mtimes and file names"""
+        directories: Dict[str, int] = {}
+        names: Dict[str, List[str]] = {}
+        stack = [root]
+
+        while stack:
+            current = stack.pop()
+            try:
+                directories[current] = os.stat(current).st_mtime_ns
+                entries = self._scan_directory(current)
+            except (PermissionError, FileNotFoundError) as e:
+                logger.warning(f"Skipping unreadable directory {current}: {str(e)}")
+                continue
+
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.name.startswith(".") and not entry.is_symlink():
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    names.setdefault(entry.name.lower(), []).append(entry.path)
+
+        index = (directories, names)
+
+        # Same coarse-mtime guard as the listing cache
+        newest = max(directories.values(), default=0)
+        if time.time_ns() - newest > 1_000_000_000:
+            with self._listing_lock:
+                self._name_indexes[root] = index
+                self._name_indexes.move_to_end(root)
+                while len(self._name_indexes) > self.NAME_INDEX_ROOTS:
+                    self._name_indexes.popitem(last=False)
+
+        return index
+
+    def _scandir_walk(
+        self, root: Path, recursive: bool, directories: bool = False
+    ) -> Iterator[os.DirEntry]:
+        """Yield file (or directory) entries under root, skipping hidden dirs"""
+        stack = [os.fspath(root)]
+
+        while stack:
+            current = stack.pop()
+            try:
+                entries = self._scan_directory(current)
+            except (PermissionError, FileNotFoundError) as e:
+                logger.warning(f"Skipping unreadable directory {current}: {str(e)}")
+                continue
+
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name.startswith("."):
+                        continue
+                    if directories:
+                        yield entry
+                    if recursive and not entry.is_symlink():
+                        stack.append(entry.path)
+                elif not directories and entry.is_file():
+                    yield entry
+
+    def _file_entry(
+        self,
+        file_path: Union[os.DirEntry, Path],
+        stat: Optional[os.stat_result] = None,
+    ) -> FileInfo:
+        """Build a FileInfo from a scandir entry or a path"""
+        # DirEntry.stat() reuses the result cached by the directory scan
+        if stat is None:
             stat = file_path.stat()
-            mime_type, _ = mimetypes.guess_type(str(file_path))
+        name = file_path.name
+        return FileInfo(
+            name=name,
+            path=os.fspath(file_path),
+            extension=self._suffix(name),
+            size=stat.st_size,
+            modified_time=stat.st_mtime,
+            stat_result=stat,
+            mime_types=self._mime_types,
+        )
+
+    def _try_file_entry(
+        self, file_path: Union[os.DirEntry, Path]
+    ) -> Optional[FileInfo]:
+        """Build a FileInfo, logging and returning None when the file can't be read"""
+        try:
+            return self._file_entry(file_path)
+        except OSError as e:
+            logger.error(f"Error getting file info for {file_path}: {str(e)}")
+            return None
 
-            return {
-                "name": file_path.name,
-                "path": str(file_path.absolute()),
-                "extension": file_path.suffix,
-                "size": stat.st_size,
-                "created_time": stat.st_ctime,
-                "modified_time": stat.st_mtime,
-                "accessed_time": stat.st_atime,
-                "is_readonly": not os.access(file_path, os.W_OK),
-                "mime_type": mime_type,
-            }
+    def _get_file_info(
+        self,
+        file_path: Union[os.DirEntry, Path],
+        stat: Optional[os.stat_result] = None,
+    ) -> Dict[str, Any]:
+        """Get metadata for a file from a scandir entry or a path"""
+        try:
+            return self._file_entry(file_path, stat).to_dict()
 
         except Exception as e:
             logger.error(f"Error getting file info for {file_path}: {str(e)}")
-            return {"name": file_path.name, "path": str(file_path), "error": str(e)}
+            return {
+                "name": file_path.name,
+                "path": os.fspath(file_path),
+                "error": str(e),
+            }
 
     def read_file(self, file_path: str, encoding: str = "utf-8") -> Optional[str]:
         """Read text file content"""
@@ -134,31 +487,37 @@ class FileSystemConnector:
 
             if not path.exists():
                 logger.error(f"File does not exist: {file_path}")
+                self._stats["read_errors"] += 1
                 return None
 
             if not path.is_file():
                 logger.error(f"Path is not a file: {file_path}")
+                self._stats["read_errors"] += 1
                 return None
 
             with open(path, "r", encoding=encoding) as f:
                 content = f.read()
 
-            logger.info(f"Read file: {file_path} ({len(content)} characters)")
+            self._record_read(file_path, len(content), "chars")
             return content
 
         except UnicodeDecodeError:
             logger.warning(
-                f"Unicode decode error, trying with latin-1 encoding: {file_path}"
+                "Unicode decode error, trying with latin-1 encoding: %s", file_path
             )
             try:
                 with open(path, "r", encoding="latin-1") as f:
-                    return f.read()
+                    content = f.read()
+                self._record_read(file_path, len(content), "chars")
+                return content
             except Exception as e:
                 logger.error(f"Error reading file with latin-1: {str(e)}")
+                self._stats["read_errors"] += 1
                 return None
 
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {str(e)}")
+            self._stats["read_errors"] += 1
             return None
 
     def read_binary_file(self, file_path: str) -> Optional[bytes]:
@@ -168,22 +527,51 @@ class FileSystemConnector:
 
             if not path.exists():
                 logger.error(f"File does not exist: {file_path}")
+                self._stats["read_errors"] += 1
                 return None
 
             if not path.is_file():
                 logger.error(f"Path is not a file: {file_path}")
+                self._stats["read_errors"] += 1
                 return None
 
             with open(path, "rb") as f:
                 content = f.read()
 
-            logger.info(f"Read binary file: {file_path} ({len(content)} bytes)")
+            self._record_read(file_path, len(content), "bytes")
             return content
 
         except Exception as e:
             logger.error(f"Error reading binary file {file_path}: {str(e)}")
+            self._stats["read_errors"] += 1
             return None
 
+    def read_files(
+        self, file_paths: List[str], encoding: str = "utf-8"
+    ) -> Dict[str, Optional[str]]:
+        """Read several text files, logging one summary line for the batch"""
+        before = dict(self._stats)
+        contents = {path: self.read_file(path, encoding) for path in file_paths}
+
+        logger.info(
+            "Read %d of %d files (%d characters, %d errors)",
+            self._stats["files_read"] - before["files_read"],
+            len(file_paths),
+            self._stats["chars_read"] - before["chars_read"],
+            self._stats["read_errors"] - before["read_errors"],
+        )
+        return contents
+
+    def get_read_stats(self) -> Dict[str, int]:
+        """Totals for reads made through this connector"""
+        return dict(self._stats)
+
+    def _record_read(self, file_path: str, size: int, unit: str) -> None:
+        """Count a successful read and log it at DEBUG level"""
+        self._stats["files_read"] += 1
+        self._stats[f"{unit}_read"] += size
+        logger.debug("Read file: %s (%d %s)", file_path, size, unit)
+
     def search_files(
         self,
         pattern: str,
@@ -192,24 +580,7 @@ class FileSystemConnector:
     ) -> List[Dict[str, Any]]:
         """Search for files matching a pattern"""
         try:
-            search_path = Path(path) if path else self.base_path
-
-            if not search_path.exists():
-                logger.error(f"Path does not exist: {search_path}")
-                return []
-
-            files = []
-
-            if recursive:
-                glob_pattern = f"**/{pattern}"
-            else:
-                glob_pattern = pattern
-
-            for file_path in search_path.glob(glob_pattern):
-                if file_path.is_file():
-                    file_info = self._get_file_info(file_path)
-                    files.append(file_info)
-
+            files = list(self.iter_search_files(pattern, path, recursive))
             logger.info(f"Found {len(files)} files matching pattern: {pattern}")
             return files
 
@@ -217,53 +588,119 @@ class FileSystemConnector:
             logger.error(f"Error searching files: {str(e)}")
             return []
 
+    def iter_search_files(
+        self,
+        pattern: str,
+        path: Optional[str] = None,
+        recursive: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield file info for files matching a pattern"""
+        search_path = self._absolute_search_path(path)
+
+        if not search_path.exists():
+            logger.error(f"Path does not exist: {search_path}")
+            return
+
+        if recursive and "/" not in pattern and os.sep not in pattern:
+            if not _GLOB_MAGIC.search(pattern):
+                # Exact names are answered from the per-root name index
+                yield from self._iter_file_info(
+                    Path(file_path)
+                    for file_path in self._find_by_name(search_path, pattern)
+                )
+                return
+
+            # Bare name patterns match at any depth
+            name_regex = _compile_name_pattern(pattern)
+            yield from self._iter_file_info(
+                entry
+                for entry in self._scandir_walk(search_path, True)
+                if name_regex.match(entry.name)
+            )
+            return
+
+        # Descend straight into the literal part of the pattern
+        prefix, remaining = _split_glob_prefix(pattern)
+        start = search_path / prefix if prefix else search_path
+
+        if not remaining:
+            if start.is_file():
+                yield self._get_file_info(start)
+        elif start.is_dir() and "/" not in remaining:
+            name_regex = _compile_name_pattern(remaining)
+            yield from self._iter_file_info(
+                entry
+                for entry in self._scandir_walk(start, False)
+                if name_regex.match(entry.name)
+            )
+        elif start.is_dir():
+            for file_path in start.glob(remaining):
+                if file_path.is_file():
+                    yield self._get_file_info(file_path)
+
     def get_directory_tree(
         self, path: Optional[str] = None, max_depth: int = 3
     ) -> Dict[str, Any]:
         """Get directory tree structure"""
         try:
-            root_path = Path(path) if path else self.base_path
+            root_path = self._absolute_search_path(path)
 
             if not root_path.exists():
                 logger.error(f"Path does not exist: {root_path}")
                 return {}
 
-            def build_tree(current_path: Path, depth: int = 0) -> Dict[str, Any]:
+            def make_node(
+                current: Union[os.DirEntry, Path], is_dir: bool, depth: int
+            ) -> Dict[str, Any]:
                 if depth >= max_depth:
                     return {"truncated": True}
 
-                tree = {
-                    "name": current_path.name,
-                    "path": str(current_path.absolute()),
-                    "is_dir": current_path.is_dir(),
+                node = {
+                    "name": current.name,
+                    "path": os.fspath(current),
+                    "is_dir": is_dir,
                 }
+                if not is_dir:
+                    node.update(self._get_file_info(current))
+                return node
+
+            root_is_dir = root_path.is_dir()
+            tree = make_node(root_path, root_is_dir, 0)
+
+            # Walk with an explicit stack so deep trees can't hit the recursion limit
+            stack = []
+            if root_is_dir and max_depth > 0:
+                stack.append((root_path, tree, 0))
+
+            while stack:
+                current, node, depth = stack.pop()
+                try:
+                    entries = sorted(
+                        self._scan_directory(os.fspath(current)),
+                        key=lambda entry: entry.name,
+                    )
+                except PermissionError:
+                    node["error"] = "Permission denied"
+                    continue
+
+                children = []
+                for child in entries:
+                    # Skip hidden files and system folders
+                    if child.name.startswith("."):
+                        continue
 
-                if current_path.is_dir():
-                    children = []
-                    try:
-                        for child in sorted(current_path.iterdir()):
-                            # Skip hidden files and system folders
-                            if child.name.startswith("."):
-                                continue
-
-                            child_tree = build_tree(child, depth + 1)
-                            children.append(child_tree)
-
-                        tree["children"] = children
-                        tree["file_count"] = sum(
-                            1 for c in children if not c.get("is_dir")
-                        )
-                        tree["dir_count"] = sum(1 for c in children if c.get("is_dir"))
-
-                    except PermissionError:
-                        tree["error"] = "Permission denied"
+                    child_is_dir = child.is_dir()
+                    child_node = make_node(child, child_is_dir, depth + 1)
+                    children.append(child_node)
 
-                else:
-                    tree.update(self._get_file_info(current_path))
+                    if child_is_dir and depth + 1 < max_depth:
+                        stack.append((child, child_node, depth + 1))
 
-                return tree
+                node["children"] = children
+                node["file_count"] = sum(1 for c in children if not c.get("is_dir"))
+                node["dir_count"] = sum(1 for c in children if c.get("is_dir"))
 
-            return build_tree(root_path)
+            return tree
 
         except Exception as e:
             logger.error(f"Error getting directory tree: {str(e)}")
@@ -274,46 +711,67 @@ class FileSystemConnector:
         try:
             path = Path(file_path)
 
-            if not path.exists():
+            try:
+                stat = self._stat(os.fspath(path))
+            except FileNotFoundError:
                 logger.error(f"File does not exist: {file_path}")
                 return None
 
-            return self._get_file_info(path)
+            return self._get_file_info(path, stat)
 
         except Exception as e:
             logger.error(f"Error getting file metadata: {str(e)}")
             return None
 
-    def list_directories(
-        self, path: Optional[str] = None, recursive: bool = False
-    ) -> List[Dict[str, Any]]:
-        """List directories"""
-        try:
-            search_path = Path(path) if path else self.base_path
+    def _stat(self, file_path: str) -> os.stat_result:
+        """os.stat, served from a short TTL cache when cache_stats is enabled"""
+        if not self.cache_stats:
+            return os.stat(file_path)
 
-            if not search_path.exists():
-                logger.error(f"Path does not exist: {search_path}")
-                return []
+        now = time.monotonic()
+        with self._listing_lock:
+            cached = self._stat_cache.get(file_path)
+            if cached is not None and now - cached[0] < self.STAT_CACHE_TTL:
+                return cached[1]
 
-            directories = []
+        stat = os.stat(file_path)
 
-            if recursive:
-                pattern = "**/*"
-            else:
-                pattern = "*"
+        with self._listing_lock:
+            self._stat_cache[file_path] = (now, stat)
+            self._stat_cache.move_to_end(file_path)
+            while len(self._stat_cache) > self.STAT_CACHE_SIZE:
+                self._stat_cache.popitem(last=False)
 
-            for dir_path in search_path.glob(pattern):
-                if dir_path.is_dir() and not dir_path.name.startswith("."):
-                    dir_info = {
-                        "name": dir_path.name,
-                        "path": str(dir_path.absolute()),
-                        "modified_time": dir_path.stat().st_mtime,
-                    }
-                    directories.append(dir_info)
+        return stat
 
-            logger.info(f"Found {len(directories)} directories in {search_path}")
+    def list_directories(
+        self, path: Optional[str] = None, recursive: bool = False
+    ) -> List[Dict[str, Any]]:
+        """List directories"""
+        try:
+            directories = list(self.iter_directories(path, recursive))
+            logger.info(
+                f"Found {len(directories)} directories in {path or self.base_path}"
+            )
             return directories
 
         except Exception as e:
             logger.error(f"Error listing directories: {str(e)}")
             return []
+
+    def iter_directories(
+        self, path: Optional[str] = None, recursive: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield directory info one entry at a time"""
+        search_path = self._absolute_search_path(path)
+
+        if not search_path.exists():
+            logger.error(f"Path does not exist: {search_path}")
+            return
+
+        for entry in self._scandir_walk(search_path, recursive, directories=True):
+            yield {
+                "name": entry.name,
+                "path": entry.path,
+                "modified_time": entry.stat().st_mtime,
+            }
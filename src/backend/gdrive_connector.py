@@ -4,18 +4,34 @@ Handles connections and file operations with Google Drive
 """
 
 import io
+import json
 import logging
 import os
-import pickle
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import httplib2
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 
 logger = logging.getLogger(__name__)
 
+# Credentials shared by every connector in the process, keyed by
+# (credentials_file, scopes), so the token file is read and refreshed once
+_CREDENTIALS_CACHE: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+_CREDENTIALS_LOCK = threading.Lock()
+
+# Built services are kept per thread because httplib2 connections are not
+# thread-safe; each thread pays the build cost once
+_SERVICE_CACHE = threading.local()
+
 
 class GoogleDriveConnector:
     """Google Drive API connector"""
@@ -25,19 +41,47 @@ class GoogleDriveConnector:
         "https://www.googleapis.com/auth/drive.metadata.readonly",
     ]
 
+    # Field masks for listings; the minimal mask skips nested owner objects
+    MINIMAL_LIST_FIELDS = "nextPageToken, files(id, name, mimeType, size, modifiedTime)"
+    DETAILED_LIST_FIELDS = (
+        "nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime, "
+        "owners, parents, webViewLink, iconLink)"
+    )
+
+    # Socket timeout (seconds) for the shared Drive HTTP connection
+    HTTP_TIMEOUT = 30
+
+    # Maximum number of calls Drive accepts in one batch request
+    BATCH_SIZE = 100
+
+    # Bytes requested per download chunk
+    DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+    # Largest file read_file_content will buffer in memory
+    MAX_IN_MEMORY_BYTES = 100 * 1024 * 1024
+
     def __init__(self, credentials_file: str = "credentials.json"):
         self.credentials_file = credentials_file
-        self.token_file = "token_drive.pickle"
+        self.token_file = "token_drive.json"
         self.service = None
         self.creds = None
+        # (executor, http) prefetching listing pages, created on first use
+        self._prefetch: Optional[Tuple[ThreadPoolExecutor, Any]] = None
+        self._prefetch_lock = threading.Lock()
 
     def connect(self) -> bool:
         """Authenticate with Google Drive"""
+        self._close_prefetch()
         try:
+            cache_key = (self.credentials_file, tuple(self.SCOPES))
+            with _CREDENTIALS_LOCK:
+                self.creds = _CREDENTIALS_CACHE.get(cache_key)
+
             # Load saved credentials
-            if os.path.exists(self.token_file):
-                with open(self.token_file, "rb") as token:
-                    self.creds = pickle.load(token)
+            if self.creds is None and os.path.exists(self.token_file):
+                with open(self.token_file, "r") as token:
+                    self.creds = Credentials.from_authorized_user_info(
+                        json.load(token), self.SCOPES
+                    )
 
             # Refresh or get new credentials
             if not self.creds or not self.creds.valid:
@@ -50,11 +94,35 @@ class GoogleDriveConnector:
                     self.creds = flow.run_local_server(port=0)
 
                 # Save credentials
-                with open(self.token_file, "wb") as token:
-                    pickle.dump(self.creds, token)
+                with open(self.token_file, "w") as token:
+                    token.write(self.creds.to_json())
+
+            with _CREDENTIALS_LOCK:
+                _CREDENTIALS_CACHE[cache_key] = self.creds
+
+            services = getattr(_SERVICE_CACHE, "services", None)
+            if services is None:
+                services = _SERVICE_CACHE.services = {}
+
+            cached = services.get(cache_key)
+            if cached is not None and cached[0] is self.creds:
+                self.service = cached[1]
+            else:
+                # Build service on one authorized HTTP client so every call
+                # reuses the same keep-alive connection. The discovery document
+                # bundled with the client library avoids fetching it over HTTP.
+                http = AuthorizedHttp(
+                    self.creds, http=httplib2.Http(timeout=self.HTTP_TIMEOUT)
+                )
+                self.service = build(
+                    "drive",
+                    "v3",
+                    http=http,
+                    static_discovery=True,
+                    cache_discovery=False,
+                )
+                services[cache_key] = (self.creds, self.service)
 
-            # Build service
-            self.service = build("drive", "v3", credentials=self.creds)
             logger.info("Connected to Google Drive")
             return True
 
@@ -62,8 +130,34 @@ class GoogleDriveConnector:
             logger.error(f"Google Drive authentication error: {str(e)}")
             return False
 
+    def _prefetcher(self) -> Tuple[ThreadPoolExecutor, Any]:
+        """Executor and HTTP client that prefetch listing pages
+
+        One worker thread serves every prefetch for this connector, so its
+        httplib2 connection is never shared between threads and stays open
+        across listings.
+        """
+        with self._prefetch_lock:
+            if self._prefetch is None:
+                http = AuthorizedHttp(
+                    self.creds, http=httplib2.Http(timeout=self.HTTP_TIMEOUT)
+                )
+                executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="gdrive-prefetch"
+                )
+                self._prefetch = (executor, http)
+            return self._prefetch
+
+    def _close_prefetch(self):
+        """Stop the prefetch worker, if started"""
+        with self._prefetch_lock:
+            prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None:
+            prefetch[0].shutdown(wait=False)
+
     def disconnect(self) -> bool:
         """Disconnect from Google Drive"""
+        self._close_prefetch()
         self.service = None
         self.creds = None
         logger.info("Disconnected from Google Drive")
@@ -76,52 +170,150 @@ class GoogleDriveConnector:
         max_results: int = 100,
     ) -> List[Dict[str, Any]]:
         """List files in Google Drive"""
+        return self.list_files_detailed(folder_id, query, max_results)
+
+    def list_files_detailed(
+        self,
+        folder_id: Optional[str] = None,
+        query: Optional[str] = None,
+        max_results: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """List files with owners, parents and links"""
+        return self._list_files(folder_id, query, max_results, detailed=True)
+
+    def list_files_minimal(
+        self,
+        folder_id: Optional[str] = None,
+        query: Optional[str] = None,
+        max_results: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """List files with only id, name, mimeType, size and modifiedTime"""
+        return self._list_files(folder_id, query, max_results, detailed=False)
+
+    def _list_files(
+        self,
+        folder_id: Optional[str],
+        query: Optional[str],
+        max_results: int,
+        detailed: bool,
+    ) -> List[Dict[str, Any]]:
+        """Collect up to max_results files from iter_files"""
         if not self.service:
             raise ConnectionError("Not connected to Google Drive")
 
         try:
-            # Build query
-            if folder_id:
-                q = f"'{folder_id}' in parents"
-            elif query:
-                q = query
-            else:
-                q = "trashed=false"
-
-            results = (
-                self.service.files()
-                .list(
-                    q=q,
-                    pageSize=max_results,
-                    fields="files(id, name, mimeType, size, createdTime, modifiedTime, owners, parents, webViewLink, iconLink)",
+            return list(
+                self.iter_files(
+                    folder_id=folder_id,
+                    query=query,
+                    page_size=min(max_results, 1000),
+                    limit=max_results,
+                    detailed=detailed,
                 )
-                .execute()
             )
 
-            files = results.get("files", [])
-
-            return [
-                {
-                    "id": file.get("id"),
-                    "name": file.get("name"),
-                    "mimeType": file.get("mimeType"),
-                    "size": file.get("size"),
-                    "createdTime": file.get("createdTime"),
-                    "modifiedTime": file.get("modifiedTime"),
-                    "owners": [
-                        owner.get("emailAddress") for owner in file.get("owners", [])
-                    ],
-                    "parents": file.get("parents", []),
-                    "webViewLink": file.get("webViewLink"),
-                    "iconLink": file.get("iconLink"),
-                }
-                for file in files
-            ]
-
         except Exception as e:
             logger.error(f"Error listing files: {str(e)}")
             raise
 
+    def iter_files(
+        self,
+        folder_id: Optional[str] = None,
+        query: Optional[str] = None,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        detailed: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield files across result pages, fetching the next page in the background
+
+        The first page is fetched on the caller's thread over the service's
+        shared connection; the prefetch worker only starts when there are
+        more pages.
+        """
+        if not self.service:
+            raise ConnectionError("Not connected to Google Drive")
+
+        # Build query
+        if folder_id:
+            q = f"'{folder_id}' in parents"
+        elif query:
+            q = query
+        else:
+            q = "trashed=false"
+
+        if detailed:
+            fields, summarize = self.DETAILED_LIST_FIELDS, self._file_summary
+        else:
+            fields, summarize = self.MINIMAL_LIST_FIELDS, self._file_minimal
+
+        service = self.service
+
+        def fetch_page(page_token: Optional[str], http: Any = None) -> Dict[str, Any]:
+            return (
+                service.files()
+                .list(
+                    q=q,
+                    pageSize=page_size,
+                    pageToken=page_token,
+                    fields=fields,
+                )
+                .execute(http=http)
+            )
+
+        results = fetch_page(None)
+        count = 0
+        pending = None
+        try:
+            while True:
+                files = results.get("files", [])
+                next_token = results.get("nextPageToken")
+
+                # Request the next page while this one is being converted
+                if next_token and (limit is None or count + len(files) < limit):
+                    executor, worker_http = self._prefetcher()
+                    pending = executor.submit(fetch_page, next_token, worker_http)
+
+                for file in files:
+                    yield summarize(file)
+                    count += 1
+                    if limit is not None and count >= limit:
+                        return
+
+                if pending is None:
+                    return
+                results = pending.result()
+                pending = None
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    @staticmethod
+    def _file_minimal(file: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a Drive file resource fetched with the minimal field mask"""
+        return {
+            "id": file.get("id"),
+            "name": file.get("name"),
+            "mimeType": file.get("mimeType"),
+            "size": file.get("size"),
+            "modifiedTime": file.get("modifiedTime"),
+        }
+
+    @staticmethod
+    def _file_summary(file: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a Drive file resource into the listing format"""
+        return {
+            "id": file.get("id"),
+            "name": file.get("name"),
+            "mimeType": file.get("mimeType"),
+            "size": file.get("size"),
+            "createdTime": file.get("createdTime"),
+            "modifiedTime": file.get("modifiedTime"),
+            "owners": [owner.get("emailAddress") for owner in file.get("owners", [])],
+            "parents": file.get("parents", []),
+            "webViewLink": file.get("webViewLink"),
+            "iconLink": file.get("iconLink"),
+        }
+
     def get_file_metadata(self, file_id: str) -> Dict[str, Any]:
         """Get detailed metadata for a file"""
         if not self.service:
@@ -137,34 +329,67 @@ class GoogleDriveConnector:
                 .execute()
             )
 
-            return {
-                "id": file.get("id"),
-                "name": file.get("name"),
-                "mimeType": file.get("mimeType"),
-                "description": file.get("description"),
-                "size": file.get("size"),
-                "createdTime": file.get("createdTime"),
-                "modifiedTime": file.get("modifiedTime"),
-                "viewedByMeTime": file.get("viewedByMeTime"),
-                "owners": [
-                    owner.get("emailAddress") for owner in file.get("owners", [])
-                ],
-                "lastModifyingUser": file.get("lastModifyingUser", {}).get(
-                    "emailAddress"
-                ),
-                "shared": file.get("shared"),
-                "parents": file.get("parents", []),
-                "webViewLink": file.get("webViewLink"),
-                "webContentLink": file.get("webContentLink"),
-                "iconLink": file.get("iconLink"),
-                "thumbnailLink": file.get("thumbnailLink"),
-                "version": file.get("version"),
-            }
+            return self._file_metadata(file)
+
+        except Exception as e:
+            logger.error(f"Error getting file metadata: {str(e)}")
+            raise
+
+    def get_files_metadata(self, file_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get detailed metadata for many files using batched HTTP requests"""
+        if not self.service:
+            raise ConnectionError("Not connected to Google Drive")
+
+        results: Dict[str, Dict[str, Any]] = {}
+
+        def store(request_id: str, response: Dict[str, Any], exception) -> None:
+            if exception is not None:
+                logger.error(f"Error getting metadata for {request_id}: {exception}")
+                results[request_id] = {"id": request_id, "error": str(exception)}
+            else:
+                results[request_id] = self._file_metadata(response)
+
+        try:
+            # Drive accepts at most 100 calls per batch request
+            unique_ids = list(dict.fromkeys(file_ids))
+            for start in range(0, len(unique_ids), self.BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=store)
+                for file_id in unique_ids[start : start + self.BATCH_SIZE]:
+                    batch.add(
+                        self.service.files().get(fileId=file_id, fields="*"),
+                        request_id=file_id,
+                    )
+                batch.execute()
+
+            return results
 
         except Exception as e:
             logger.error(f"Error getting file metadata: {str(e)}")
             raise
 
+    @staticmethod
+    def _file_metadata(file: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a full Drive file resource into the metadata format"""
+        return {
+            "id": file.get("id"),
+            "name": file.get("name"),
+            "mimeType": file.get("mimeType"),
+            "description": file.get("description"),
+            "size": file.get("size"),
+            "createdTime": file.get("createdTime"),
+            "modifiedTime": file.get("modifiedTime"),
+            "viewedByMeTime": file.get("viewedByMeTime"),
+            "owners": [owner.get("emailAddress") for owner in file.get("owners", [])],
+            "lastModifyingUser": file.get("lastModifyingUser", {}).get("emailAddress"),
+            "shared": file.get("shared"),
+            "parents": file.get("parents", []),
+            "webViewLink": file.get("webViewLink"),
+            "webContentLink": file.get("webContentLink"),
+            "iconLink": file.get("iconLink"),
+            "thumbnailLink": file.get("thumbnailLink"),
+            "version": file.get("version"),
+        }
+
     def download_file(self, file_id: str, destination_path: str) -> bool:
         """Download a file from Google Drive"""
         if not self.service:
@@ -172,23 +397,25 @@ class GoogleDriveConnector:
 
         try:
             request = self.service.files().get_media(fileId=file_id)
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
 
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-                logger.info(f"Download {int(status.progress() * 100)}%")
-
-            # Write to file
+            # Stream chunks straight to disk instead of buffering the whole file
             with open(destination_path, "wb") as f:
-                f.write(fh.getvalue())
+                downloader = MediaIoBaseDownload(
+                    f, request, chunksize=self.DOWNLOAD_CHUNK_SIZE
+                )
+
+                done = False
+                while not done:
+                    status, done = downloader.next_chunk()
+                    logger.info(f"Download {int(status.progress() * 100)}%")
 
             logger.info(f"Downloaded file to {destination_path}")
             return True
 
         except Exception as e:
             logger.error(f"Error downloading file: {str(e)}")
+            if os.path.exists(destination_path):
+                os.remove(destination_path)
             return False
 
     def read_file_content(self, file_id: str) -> bytes:
@@ -197,9 +424,19 @@ class GoogleDriveConnector:
             raise ConnectionError("Not connected to Google Drive")
 
         try:
+            metadata = self.service.files().get(fileId=file_id, fields="size").execute()
+            size = int(metadata.get("size") or 0)
+            if size > self.MAX_IN_MEMORY_BYTES:
+                raise ValueError(
+                    f"File {file_id} is {size} bytes; use download_file for files "
+                    f"larger than {self.MAX_IN_MEMORY_BYTES} bytes"
+                )
+
             request = self.service.files().get_media(fileId=file_id)
             fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
+            downloader = MediaIoBaseDownload(
+                fh, request, chunksize=self.DOWNLOAD_CHUNK_SIZE
+            )
 
             done = False
             while not done:
@@ -216,6 +453,8 @@ class GoogleDriveConnector:
         name_contains: Optional[str] = None,
         mime_type: Optional[str] = None,
         max_results: int = 100,
+        extensions: Optional[List[str]] = None,
+        modified_after: Optional[datetime] = None,
     ) -> List[Dict[str, Any]]:
         """Search for files in Google Drive"""
         if not self.service:
@@ -230,9 +469,35 @@ class GoogleDriveConnector:
             if mime_type:
                 query_parts.append(f"mimeType='{mime_type}'")
 
+            if extensions:
+                # Let Drive drop non-matching files before they are sent to us
+                name_filters = " or ".join(
+                    "name contains '{}'".format(ext.replace("'", "\\'"))
+                    for ext in extensions
+                )
+                query_parts.append(f"({name_filters})")
+
+            if modified_after:
+                if modified_after.tzinfo is None:
+                    modified_after = modified_after.replace(tzinfo=timezone.utc)
+                timestamp = modified_after.astimezone(timezone.utc).strftime(
+                    "%Y-%m-%dT%H:%M:%S"
+                )
+                query_parts.append(f"modifiedTime > '{timestamp}'")
+
             q = " and ".join(query_parts)
 
-            return self.list_files(query=q, max_results=max_results)
+            if not extensions:
+                return self.list_files(query=q, max_results=max_results)
+
+            # "name contains" is a token match, so confirm the suffix locally
+            suffixes = tuple(ext.lower() for ext in extensions)
+            matches = (
+                file
+                for file in self.iter_files(query=q, page_size=min(max_results, 1000))
+                if (file.get("name") or "").lower().endswith(suffixes)
+            )
+            return list(islice(matches, max_results))
 
         except Exception as e:
             logger.error(f"Error searching files: {str(e)}")
@@ -3,13 +3,126 @@ Oracle Database Connector
 Handles connections and queries to Oracle databases
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
-
-from backend.db_manager import DatabaseConnection
+import re
+import sys
+import threading
+import weakref
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from backend.db_manager import (
+    DatabaseConnection,
+    cached_metadata,
+    column_names,
+    fetch_dicts,
+    fetch_rows,
+    group_rows,
+    iter_cursor_batches,
+    password_digest,
+    shared_pool,
+)
 
 logger = logging.getLogger(__name__)
 
+# Session pools shared by connections to the same database as the same user
+_POOLS: Dict[tuple, Any] = {}
+_POOLS_LOCK = threading.Lock()
+
+# Oracle-maintained schemas left out of get_schemas
+_ORACLE_SYSTEM_SCHEMAS = frozenset(
+    {
+        "SYS",
+        "SYSTEM",
+        "OUTLN",
+        "DBSNMP",
+        "APPQOSSYS",
+        "WMSYS",
+        "EXFSYS",
+        "CTXSYS",
+        "XDB",
+        "ANONYMOUS",
+        "ORDSYS",
+        "MDSYS",
+        "ORDDATA",
+        "OLAPSYS",
+    }
+)
+
+# Async pools are bound to the event loop that created them
+_ASYNC_POOLS: "weakref.WeakKeyDictionary[Any, Dict[tuple, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# get_schema reads the whole schema with these three queries
+_SCHEMA_TABLES_SQL = """
+    SELECT 
+        table_name,
+        tablespace_name,
+        num_rows
+    FROM all_tables
+    WHERE owner = :schema
+    ORDER BY table_name
+"""
+
+_SCHEMA_COLUMNS_SQL = """
+    SELECT 
+        table_name,
+        column_name,
+        data_type,
+        data_length,
+        data_precision,
+        data_scale,
+        nullable,
+        data_default
+    FROM all_tab_columns
+    WHERE owner = :schema
+    ORDER BY table_name, column_id
+"""
+
+_SCHEMA_INDEXES_SQL = """
+    SELECT 
+        table_name,
+        index_name,
+        index_type,
+        uniqueness
+    FROM all_indexes
+    WHERE owner = :schema
+    ORDER BY table_name, index_name
+"""
+
+
+# Unquoted Oracle identifier characters
+_IDENT_RE = re.compile(r"[A-Za-z0-9_$#]+")
+
+
+@lru_cache(maxsize=4096)
+def _ora_ident(name: str) -> str:
+    """Validate a schema/table name and return its interned uppercase form"""
+    if not _IDENT_RE.fullmatch(name):
+        raise ValueError(f"Invalid Oracle identifier: {name!r}")
+    return sys.intern(name.upper())
+
+
+@lru_cache(maxsize=128)
+def _make_dsn(
+    host: str, port: int, service_name: Optional[str], sid: Optional[str]
+) -> str:
+    """Build the connect descriptor for a database, once per distinct target"""
+    import oracledb
+
+    if service_name:
+        return oracledb.makedsn(host, port, service_name=service_name)
+    if sid:
+        return oracledb.makedsn(host, port, sid=sid)
+    raise ValueError("Either service_name or sid must be provided")
+
 
 class OracleConnection(DatabaseConnection):
     """Oracle database connection implementation"""
@@ -18,31 +131,27 @@ class OracleConnection(DatabaseConnection):
         super().__init__(connection_id, config)
         self.conn = None
         self.cursor = None
+        self._pool = None
 
     def connect(self) -> bool:
         """Establish Oracle connection"""
         try:
             import oracledb
 
-            host = self.config.get("host", "localhost")
-            port = self.config.get("port", 1521)
-            user = self.config.get("user", "system")
-            password = self.config.get("password", "")
-            service_name = self.config.get("service_name")
-            sid = self.config.get("sid")
-
-            # Create DSN
-            if service_name:
-                dsn = oracledb.makedsn(host, port, service_name=service_name)
-            elif sid:
-                dsn = oracledb.makedsn(host, port, sid=sid)
-            else:
-                raise ValueError("Either service_name or sid must be provided")
+            key, pool_args = self._pool_args()
+            pool = shared_pool(
+                _POOLS, _POOLS_LOCK, key, lambda: oracledb.create_pool(**pool_args)
+            )
 
-            self.conn = oracledb.connect(user=user, password=password, dsn=dsn)
-            self.cursor = self.conn.cursor()
+            self.conn = pool.acquire()
+            self._pool = pool
+            self.cursor = self._new_cursor()
 
-            logger.info(f"Connected to Oracle: {host}:{port}")
+            logger.info(
+                "Connected to Oracle: %s:%s",
+                self.config.get("host", "localhost"),
+                self.config.get("port", 1521),
+            )
             self.connection = self.conn
             return True
 
@@ -50,16 +159,62 @@ class OracleConnection(DatabaseConnection):
             logger.error(f"Oracle connection error: {str(e)}")
             return False
 
+    def _pool_args(self) -> Tuple[tuple, Dict[str, Any]]:
+        """Return the shared-pool key and create_pool arguments for this config
+
+        acquire() waits up to the "pool_timeout" config value (seconds) for a
+        free session and then raises, which connect() reports as a failure.
+        """
+        import oracledb
+
+        host = self.config.get("host", "localhost")
+        port = self.config.get("port", 1521)
+        user = self.config.get("user", "system")
+        password = self.config.get("password", "")
+        service_name = self.config.get("service_name")
+        sid = self.config.get("sid")
+
+        key = (host, port, service_name or sid, user, password_digest(password))
+        return key, {
+            "user": user,
+            "password": password,
+            "dsn": _make_dsn(host, port, service_name, sid),
+            "min": self.config.get("pool_min", 2),
+            "max": self.config.get("pool_max", 10),
+            "increment": 1,
+            "getmode": oracledb.POOL_GETMODE_TIMEDWAIT,
+            "wait_timeout": int(self.config.get("pool_timeout", 30.0) * 1000),
+        }
+
+    def _schema_name(self, database: Optional[str]) -> str:
+        """Resolve the schema to inspect, defaulting to the connecting user's"""
+        return _ora_ident(database or self.config.get("user", "system"))
+
+    def _new_cursor(self):
+        """Open a cursor tuned for bulk fetches
+
+        arraysize controls rows per fetch round trip and prefetchrows the rows
+        returned with the execute itself; the driver defaults (100 / 2) cost a
+        round trip per hundred rows on large result sets.
+        """
+        cursor = self.conn.cursor()
+        cursor.arraysize = self.config.get("arraysize", 1000)
+        cursor.prefetchrows = self.config.get("prefetchrows", 1000)
+        return cursor
+
     def disconnect(self) -> bool:
         """Close Oracle connection"""
+        self.invalidate_metadata()
         try:
             if self.cursor:
                 self.cursor.close()
                 self.cursor = None
 
             if self.conn:
-                self.conn.close()
+                # Hand the session back to the shared pool for reuse
+                self._pool.release(self.conn)
                 self.conn = None
+                self._pool = None
                 self.connection = None
                 logger.info(f"Disconnected from Oracle: {self.connection_id}")
             return True
@@ -73,115 +228,194 @@ class OracleConnection(DatabaseConnection):
             raise ConnectionError("Not connected to Oracle")
 
         try:
-            # Execute query
-            if params:
-                self.cursor.execute(query, params)
-            else:
-                self.cursor.execute(query)
+            if not self._execute(query, params):
+                return [{"rows_affected": self.cursor.rowcount, "status": "success"}]
+
+            # Rows become dictionaries batch by batch as they are fetched
+            data = fetch_dicts(self.cursor, self.cursor.arraysize)
+
+            logger.info("Query executed successfully: %d rows returned", len(data))
+            return data
 
-            # Check if query returns data
-            if self.cursor.description:
-                # Get column names
-                column_names = [desc[0] for desc in self.cursor.description]
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("Oracle query error: %s", e)
+            raise
 
-                # Fetch all results
-                rows = self.cursor.fetchall()
+    def execute_query_columnar(self, query: str, params=None) -> Dict[str, Any]:
+        """Execute an Oracle query and return columns plus row tuples"""
+        if not self.conn or not self.cursor:
+            raise ConnectionError("Not connected to Oracle")
 
-                # Convert to list of dictionaries
-                data = []
-                for row in rows:
-                    row_dict = dict(zip(column_names, row))
-                    data.append(row_dict)
+        try:
+            if not self._execute(query, params):
+                return {
+                    "columns": ["rows_affected", "status"],
+                    "rows": [(self.cursor.rowcount, "success")],
+                }
 
-                logger.info(f"Query executed successfully: {len(data)} rows returned")
-                return data
+            # Get column names
+            columns = column_names(self.cursor)
+
+            # Fetch all results, one arraysize batch per round trip
+            rows = fetch_rows(self.cursor, self.cursor.arraysize)
+
+            logger.info("Query executed successfully: %d rows returned", len(rows))
+            return {"columns": columns, "rows": rows}
+
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("Oracle query error: %s", e)
+            raise
+
+    def execute_query_arrow(self, query: str, params=None) -> Any:
+        """Execute an Oracle query and return a pyarrow.Table
+
+        python-oracledb 3+ fetches straight into Arrow buffers via
+        fetch_df_all(); older drivers go through the columnar result.
+        """
+        if not self.conn:
+            raise ConnectionError("Not connected to Oracle")
+        if pa is None or not hasattr(self.conn, "fetch_df_all"):
+            return super().execute_query_arrow(query, params)
+
+        try:
+            odf = self.conn.fetch_df_all(
+                statement=query,
+                parameters=params,
+                arraysize=self.config.get("arraysize", 1000),
+            )
+            return pa.table(odf)
+
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("Oracle query error: %s", e)
+            raise
+
+    def _execute(self, query: str, params=None) -> bool:
+        """Run a statement on the shared cursor, committing it if it returns no rows"""
+        if params:
+            self.cursor.execute(query, params)
+        else:
+            self.cursor.execute(query)
+
+        # Check if query returns data
+        if self.cursor.description:
+            return True
+
+        # Query doesn't return data (INSERT, UPDATE, DELETE)
+        self.conn.commit()
+        self._check_ddl(query)
+        logger.info(
+            "Query executed successfully: %d rows affected", self.cursor.rowcount
+        )
+        return False
+
+    def execute_query_iter(
+        self, query: str, params=None, chunk_size: int = 1000
+    ) -> Iterator[List[Dict]]:
+        """Execute an Oracle query and yield results in batches"""
+        if not self.conn:
+            raise ConnectionError("Not connected to Oracle")
+
+        # Dedicated cursor so other queries can run while this one streams
+        cursor = self._new_cursor()
+        cursor.arraysize = max(cursor.arraysize, chunk_size)
+        try:
+            if params:
+                cursor.execute(query, params)
             else:
-                # Query doesn't return data (INSERT, UPDATE, DELETE)
-                self.conn.commit()
-                logger.info(
-                    f"Query executed successfully: {self.cursor.rowcount} rows affected"
-                )
-                return [
-                    {
-                        "rows_affected": self.cursor.rowcount,
-                        "status": "success",
-                    }
-                ]
+                cursor.execute(query)
+
+            yield from iter_cursor_batches(self.conn, cursor, chunk_size)
 
         except Exception as e:
             self.conn.rollback()
-            logger.error(f"Oracle query error: {str(e)}")
+            logger.error("Oracle query error: %s", e)
             raise
+        finally:
+            cursor.close()
 
+    @cached_metadata
     def get_schema(self, database: Optional[str] = None) -> Dict[str, Any]:
         """Get Oracle database schema information"""
-        schema_name = (database or self.config.get("user", "")).upper()
+        schema_name = self._schema_name(database)
 
         try:
-            # Get all tables in schema
-            tables_query = """
-                SELECT 
-                    table_name,
-                    tablespace_name,
-                    num_rows
-                FROM all_tables
-                WHERE owner = :schema
-                ORDER BY table_name
-            """
+            params = {"schema": schema_name}
+            return self._build_schema(
+                schema_name,
+                self.execute_query_columnar(_SCHEMA_TABLES_SQL, params),
+                self.execute_query_columnar(_SCHEMA_COLUMNS_SQL, params),
+                self.execute_query_columnar(_SCHEMA_INDEXES_SQL, params),
+            )
 
-            results = self.execute_query(tables_query, {"schema": schema_name})
-            tables = [row["TABLE_NAME"] for row in results]
-
-            # Get columns for each table
-            schema = {"schema": schema_name, "tables": {}}
-
-            for table_name in tables:
-                columns_query = """
-                    SELECT 
-                        column_name,
-                        data_type,
-                        data_length,
-                        data_precision,
-                        data_scale,
-                        nullable,
-                        data_default
-                    FROM all_tab_columns
-                    WHERE owner = :schema AND table_name = :table
-                    ORDER BY column_id
-                """
-
-                columns = self.execute_query(
-                    columns_query, {"schema": schema_name, "table": table_name}
-                )
-
-                # Get indexes
-                indexes_query = """
-                    SELECT 
-                        index_name,
-                        index_type,
-                        uniqueness
-                    FROM all_indexes
-                    WHERE owner = :schema AND table_name = :table
-                """
-
-                indexes = self.execute_query(
-                    indexes_query, {"schema": schema_name, "table": table_name}
-                )
-
-                schema["tables"][table_name] = {
-                    "columns": columns,
-                    "indexes": indexes,
-                }
+        except Exception as e:
+            logger.error(f"Schema retrieval error: {str(e)}")
+            raise
+
+    async def get_schema_async(self, database: Optional[str] = None) -> Dict[str, Any]:
+        """Get Oracle schema information, running its three queries concurrently
+
+        Each query runs on its own session from an asyncio pool, so the call
+        waits about one query's latency instead of three.
+        """
+        import oracledb
 
-            return schema
+        schema_name = self._schema_name(database)
+        params = {"schema": schema_name}
+
+        key, pool_args = self._pool_args()
+        pools = _ASYNC_POOLS.setdefault(asyncio.get_running_loop(), {})
+        pool = pools.get(key)
+        if pool is None:
+            pool = pools[key] = oracledb.create_pool_async(**pool_args)
+
+        async def fetch(query: str) -> Dict[str, Any]:
+            async with pool.acquire() as conn:
+                cursor = conn.cursor()
+                cursor.arraysize = self.config.get("arraysize", 1000)
+                await cursor.execute(query, params)
+                columns = column_names(cursor)
+                return {"columns": columns, "rows": await cursor.fetchall()}
+
+        try:
+            results = await asyncio.gather(
+                fetch(_SCHEMA_TABLES_SQL),
+                fetch(_SCHEMA_COLUMNS_SQL),
+                fetch(_SCHEMA_INDEXES_SQL),
+            )
+            return self._build_schema(schema_name, *results)
 
         except Exception as e:
             logger.error(f"Schema retrieval error: {str(e)}")
             raise
 
+    @staticmethod
+    def _build_schema(
+        schema_name: str,
+        tables_result: Dict[str, Any],
+        columns_result: Dict[str, Any],
+        indexes_result: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Assemble get_schema's result from its three columnar results"""
+        columns = group_rows(columns_result)
+        indexes = group_rows(indexes_result)
+
+        schema = {"schema": schema_name, "tables": {}}
+        for row in tables_result["rows"]:
+            table_name = row[0]
+            schema["tables"][table_name] = {
+                "columns": columns.get(table_name, []),
+                "indexes": indexes.get(table_name, []),
+            }
+
+        return schema
+
+    @cached_metadata
     def get_tables(self, database: Optional[str] = None) -> List[str]:
         """Get list of tables in Oracle database"""
-        schema_name = (database or self.config.get("user", "")).upper()
+        schema_name = self._schema_name(database)
 
         try:
             query = """
@@ -198,12 +432,13 @@ class OracleConnection(DatabaseConnection):
             logger.error(f"Table listing error: {str(e)}")
             raise
 
+    @cached_metadata
     def get_table_info(
         self, table_name: str, database: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get detailed information about an Oracle table"""
-        schema_name = (database or self.config.get("user", "")).upper()
-        table_name = table_name.upper()
+        schema_name = self._schema_name(database)
+        table_name = _ora_ident(table_name)
 
         try:
             # Get columns
@@ -304,21 +539,24 @@ class OracleConnection(DatabaseConnection):
         except Exception:
             return False
 
+    @cached_metadata(
+        ttl=DatabaseConnection.SCHEMA_LIST_TTL,
+        error_ttl=DatabaseConnection.SCHEMA_LIST_ERROR_TTL,
+    )
     def get_schemas(self) -> List[str]:
         """Get list of all schemas"""
         try:
             query = """
                 SELECT DISTINCT owner
                 FROM all_tables
-                WHERE owner NOT IN (
-                    'SYS', 'SYSTEM', 'OUTLN', 'DBSNMP', 'APPQOSSYS',
-                    'WMSYS', 'EXFSYS', 'CTXSYS', 'XDB', 'ANONYMOUS',
-                    'ORDSYS', 'MDSYS', 'ORDDATA', 'OLAPSYS'
-                )
                 ORDER BY owner
             """
             results = self.execute_query(query)
-            return [row["OWNER"] for row in results]
+            return [
+                row["OWNER"]
+                for row in results
+                if row["OWNER"] not in _ORACLE_SYSTEM_SCHEMAS
+            ]
         except Exception as e:
             logger.error(f"Schema listing error: {str(e)}")
             raise
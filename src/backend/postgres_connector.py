@@ -4,12 +4,46 @@ Handles connections and queries to PostgreSQL databases
 """
 
 import logging
-from typing import Any, Dict, List, Optional
-
-from backend.db_manager import DatabaseConnection
+import re
+import threading
+import uuid
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import psycopg
+    from psycopg_pool import ConnectionPool as PsycopgPool
+except ImportError:
+    psycopg = None
+    PsycopgPool = None
+
+from backend.db_manager import (
+    DatabaseConnection,
+    HandoffPool,
+    cached_metadata,
+    column_names,
+    fetch_dicts,
+    fetch_rows,
+    group_rows,
+    iter_cursor_batches,
+    password_digest,
+    rows_to_dicts,
+    shared_pool,
+)
 
 logger = logging.getLogger(__name__)
 
+# Connection pools shared by connections to the same database as the same user
+_POOLS: Dict[tuple, Any] = {}
+_POOLS_LOCK = threading.Lock()
+
+# Catalog schemas left out of get_schemas
+_PG_SYSTEM_SCHEMAS = frozenset({"pg_catalog", "information_schema"})
+_PG_INTERNAL_SCHEMA_PREFIXES = ("pg_toast", "pg_temp_")
+
+# Statements that can be wrapped in a server-side (DECLARE ... CURSOR) cursor
+_SELECT_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
 
 class PostgreSQLConnection(DatabaseConnection):
     """PostgreSQL database connection implementation"""
@@ -18,12 +52,11 @@ class PostgreSQLConnection(DatabaseConnection):
         super().__init__(connection_id, config)
         self.conn = None
         self.cursor = None
+        self._pool = None
 
     def connect(self) -> bool:
         """Establish PostgreSQL connection"""
         try:
-            import psycopg2
-
             host = self.config.get("host", "localhost")
             port = self.config.get("port", 5432)
             user = self.config.get("user", "postgres")
@@ -31,16 +64,28 @@ class PostgreSQLConnection(DatabaseConnection):
             database = self.config.get("database", "postgres")
             sslmode = self.config.get("sslmode", "prefer")
 
-            self.conn = psycopg2.connect(
-                host=host,
-                port=port,
-                user=user,
-                password=password,
-                database=database,
-                sslmode=sslmode,
+            key = (host, port, database, user, password_digest(password), sslmode)
+            # _create_pool raises if the server is unreachable, so a dead pool
+            # is never cached
+            pool = shared_pool(
+                _POOLS,
+                _POOLS_LOCK,
+                key,
+                lambda: self._create_pool(
+                    host=host,
+                    port=port,
+                    user=user,
+                    password=password,
+                    dbname=database,
+                    sslmode=sslmode,
+                ),
             )
 
+            self.conn = pool.getconn()
+            self._pool = pool
+
             self.cursor = self.conn.cursor()
+            self.cursor.arraysize = self.config.get("arraysize", 1000)
             logger.info(f"Connected to PostgreSQL: {host}:{port}/{database}")
             self.connection = self.conn
             return True
@@ -49,16 +94,67 @@ class PostgreSQLConnection(DatabaseConnection):
             logger.error(f"PostgreSQL connection error: {str(e)}")
             return False
 
+    def _create_pool(self, **conn_kwargs):
+        """Create a connection pool, preferring psycopg 3 over psycopg2
+
+        Both pool types hand out connections with getconn() and take them
+        back with putconn(); psycopg2 connections go through HandoffPool.
+        When every connection is in use, getconn() waits up to the
+        "pool_timeout" config value (seconds) and then raises, which connect()
+        reports as a failed connection.
+
+        Raises:
+            psycopg_pool.PoolTimeout: The pool could not open its connections
+                within the "connect_timeout" config value (seconds)
+        """
+        max_size = self.config.get("pool_max", 10)
+        # Seconds getconn() waits for a free connection before failing
+        pool_timeout = self.config.get("pool_timeout", 30.0)
+        connect_timeout = self.config.get("connect_timeout", 10)
+        # Bounds each libpq connection attempt
+        conn_kwargs["connect_timeout"] = connect_timeout
+        if PsycopgPool is not None:
+            pool = PsycopgPool(
+                kwargs=conn_kwargs,
+                min_size=self.config.get("pool_min", 2),
+                max_size=max_size,
+                timeout=pool_timeout,
+                open=True,
+            )
+            # The pool connects in the background and would otherwise only
+            # fail once getconn() times out; check the server is reachable
+            # now and shut the pool's workers down if it is not
+            try:
+                pool.wait(timeout=connect_timeout)
+            except Exception:
+                pool.close()
+                raise
+            return pool
+
+        import psycopg2
+
+        # Rolling back clears any transaction a borrower left open; it fails
+        # on a closed connection, which makes the pool discard it
+        return HandoffPool(
+            lambda: psycopg2.connect(**conn_kwargs),
+            max_size=max_size,
+            timeout=pool_timeout,
+            reset=lambda conn: conn.rollback(),
+        )
+
     def disconnect(self) -> bool:
         """Close PostgreSQL connection"""
+        self.invalidate_metadata()
         try:
             if self.cursor:
                 self.cursor.close()
                 self.cursor = None
 
             if self.conn:
-                self.conn.close()
+                # Hand the connection back to the shared pool for reuse
+                self._pool.putconn(self.conn)
                 self.conn = None
+                self._pool = None
                 self.connection = None
                 logger.info(f"Disconnected from PostgreSQL: {self.connection_id}")
             return True
@@ -72,96 +168,229 @@ class PostgreSQLConnection(DatabaseConnection):
             raise ConnectionError("Not connected to PostgreSQL")
 
         try:
-            # Execute query
+            if not self._execute(query, params):
+                return [{"rows_affected": self.cursor.rowcount, "status": "success"}]
+
+            # Rows become dictionaries batch by batch as they are fetched
+            data = fetch_dicts(self.cursor, self.cursor.arraysize)
+
+            logger.info("Query executed successfully: %d rows returned", len(data))
+            return data
+
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("PostgreSQL query error: %s", e)
+            raise
+
+    def execute_query_columnar(self, query: str, params=None) -> Dict[str, Any]:
+        """Execute a PostgreSQL query and return columns plus row tuples"""
+        if not self.conn or not self.cursor:
+            raise ConnectionError("Not connected to PostgreSQL")
+
+        try:
+            if not self._execute(query, params):
+                return {
+                    "columns": ["rows_affected", "status"],
+                    "rows": [(self.cursor.rowcount, "success")],
+                }
+
+            # Get column names
+            columns = column_names(self.cursor)
+
+            # Fetch all results, one arraysize batch per round trip
+            rows = fetch_rows(self.cursor, self.cursor.arraysize)
+
+            logger.info("Query executed successfully: %d rows returned", len(rows))
+            return {"columns": columns, "rows": rows}
+
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("PostgreSQL query error: %s", e)
+            raise
+
+    def _execute(self, query: str, params=None) -> bool:
+        """Run a statement on the shared cursor, committing it if it returns no rows"""
+        if params:
+            self.cursor.execute(query, params)
+        else:
+            self.cursor.execute(query)
+
+        # Check if query returns data
+        if self.cursor.description:
+            return True
+
+        # Query doesn't return data (INSERT, UPDATE, DELETE)
+        self.conn.commit()
+        self._check_ddl(query)
+        logger.info(
+            "Query executed successfully: %d rows affected", self.cursor.rowcount
+        )
+        return False
+
+    def execute_query_iter(
+        self, query: str, params=None, chunk_size: int = 1000
+    ) -> Iterator[List[Dict]]:
+        """Execute a PostgreSQL query and yield results in batches"""
+        if not self.conn:
+            raise ConnectionError("Not connected to PostgreSQL")
+
+        if _SELECT_RE.match(query):
+            yield from self._iter_server_side(query, params, chunk_size)
+            return
+
+        # Dedicated cursor so other queries can run while this one streams
+        cursor = self.conn.cursor()
+        try:
             if params:
-                self.cursor.execute(query, params)
+                cursor.execute(query, params)
             else:
-                self.cursor.execute(query)
+                cursor.execute(query)
 
-            # Check if query returns data
-            if self.cursor.description:
-                # Get column names
-                column_names = [desc[0] for desc in self.cursor.description]
+            yield from iter_cursor_batches(self.conn, cursor, chunk_size)
 
-                # Fetch all results
-                rows = self.cursor.fetchall()
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("PostgreSQL query error: %s", e)
+            raise
+        finally:
+            cursor.close()
+
+    def _iter_server_side(
+        self, query: str, params, chunk_size: int
+    ) -> Iterator[List[Dict]]:
+        """Stream a SELECT through a named cursor so rows stay on the server
+
+        The driver pulls itersize rows per network round trip, keeping client
+        memory bounded to about one batch regardless of the result size.
+        """
+        cursor = self.conn.cursor(name=f"vmart_{uuid.uuid4().hex}")
+        cursor.itersize = self.config.get("itersize", 2000)
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+
+            rows = iter(cursor)
+            names = None
+            while True:
+                batch = list(islice(rows, chunk_size))
+                if not batch:
+                    break
+                if names is None:
+                    # Named cursors only describe the result after a fetch
+                    names = column_names(cursor)
+                yield rows_to_dicts(names, batch)
 
-                # Convert to list of dictionaries
-                data = []
-                for row in rows:
-                    row_dict = dict(zip(column_names, row))
-                    data.append(row_dict)
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("PostgreSQL query error: %s", e)
+            raise
+        finally:
+            cursor.close()
+
+    def _execute_batch(
+        self, statements: List[Tuple[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Run several SELECTs and return a columnar result for each
+
+        With psycopg 3 the statements are sent through one pipeline, so the
+        whole burst costs about one network round trip, and are executed as
+        prepared statements; with psycopg2 they run one after another.
+        """
+        if not self.conn:
+            raise ConnectionError("Not connected to PostgreSQL")
 
-                logger.info(f"Query executed successfully: {len(data)} rows returned")
-                return data
-            else:
-                # Query doesn't return data (INSERT, UPDATE, DELETE)
-                self.conn.commit()
-                logger.info(
-                    f"Query executed successfully: {self.cursor.rowcount} rows affected"
-                )
-                return [
-                    {
-                        "rows_affected": self.cursor.rowcount,
-                        "status": "success",
-                    }
-                ]
+        # Pipeline mode needs a psycopg 3 connection and libpq 14 or newer
+        if not (hasattr(self.conn, "pipeline") and psycopg.Pipeline.is_supported()):
+            return [
+                self.execute_query_columnar(query, params)
+                for query, params in statements
+            ]
+
+        # Metadata statements repeat on every call: prepare them server-side and
+        # take results in binary format to skip text parsing of numbers
+        cursors = [self.conn.cursor(binary=True) for _ in statements]
+        try:
+            with self.conn.pipeline():
+                for cursor, (query, params) in zip(cursors, statements):
+                    cursor.execute(query, params, prepare=True)
+
+            return [
+                {
+                    "columns": column_names(cursor),
+                    "rows": cursor.fetchall(),
+                }
+                for cursor in cursors
+            ]
 
         except Exception as e:
             self.conn.rollback()
-            logger.error(f"PostgreSQL query error: {str(e)}")
+            logger.error("PostgreSQL query error: %s", e)
             raise
+        finally:
+            for cursor in cursors:
+                cursor.close()
 
+    @cached_metadata
     def get_schema(self, database: Optional[str] = None) -> Dict[str, Any]:
         """Get PostgreSQL database schema information"""
         schema_name = database or "public"
 
         try:
             # Get all tables in schema
+            # Tables, views, foreign and partitioned tables
             tables_query = """
+                SELECT 
+                    c.relname,
+                    c.relkind
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relkind IN ('r', 'v', 'f', 'p')
+                ORDER BY c.relname
+            """
+
+            # Columns and indexes for every table in one query each
+            columns_query = """
                 SELECT 
                     table_name,
-                    table_type
-                FROM information_schema.tables
+                    column_name,
+                    data_type,
+                    character_maximum_length,
+                    is_nullable,
+                    column_default
+                FROM information_schema.columns
                 WHERE table_schema = %s
-                ORDER BY table_name
+                ORDER BY table_name, ordinal_position
             """
 
-            results = self.execute_query(tables_query, (schema_name,))
-            tables = [row["table_name"] for row in results]
+            indexes_query = """
+                SELECT 
+                    tablename,
+                    indexname,
+                    indexdef
+                FROM pg_indexes
+                WHERE schemaname = %s
+                ORDER BY tablename, indexname
+            """
 
-            # Get columns for each table
-            schema = {"schema": schema_name, "tables": {}}
+            params = (schema_name,)
+            tables_result, columns_result, indexes_result = self._execute_batch(
+                [
+                    (tables_query, params),
+                    (columns_query, params),
+                    (indexes_query, params),
+                ]
+            )
+            tables = [row[0] for row in tables_result["rows"]]
+            columns = group_rows(columns_result)
+            indexes = group_rows(indexes_result)
 
+            schema = {"schema": schema_name, "tables": {}}
             for table_name in tables:
-                columns_query = """
-                    SELECT 
-                        column_name,
-                        data_type,
-                        character_maximum_length,
-                        is_nullable,
-                        column_default
-                    FROM information_schema.columns
-                    WHERE table_schema = %s AND table_name = %s
-                    ORDER BY ordinal_position
-                """
-
-                columns = self.execute_query(columns_query, (schema_name, table_name))
-
-                # Get indexes
-                indexes_query = """
-                    SELECT 
-                        indexname,
-                        indexdef
-                    FROM pg_indexes
-                    WHERE schemaname = %s AND tablename = %s
-                """
-
-                indexes = self.execute_query(indexes_query, (schema_name, table_name))
-
                 schema["tables"][table_name] = {
-                    "columns": columns,
-                    "indexes": indexes,
+                    "columns": columns.get(table_name, []),
+                    "indexes": indexes.get(table_name, []),
                 }
 
             return schema
@@ -170,25 +399,30 @@ class PostgreSQLConnection(DatabaseConnection):
             logger.error(f"Schema retrieval error: {str(e)}")
             raise
 
+    @cached_metadata
     def get_tables(self, database: Optional[str] = None) -> List[str]:
         """Get list of tables in PostgreSQL database"""
         schema_name = database or "public"
 
         try:
+            # Ordinary and partitioned tables, read from the catalog directly
+            # rather than through the information_schema.tables view
             query = """
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = %s AND table_type = 'BASE TABLE'
-                ORDER BY table_name
+                SELECT c.relname
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relkind IN ('r', 'p')
+                ORDER BY c.relname
             """
 
             results = self.execute_query(query, (schema_name,))
-            return [row["table_name"] for row in results]
+            return [row["relname"] for row in results]
 
         except Exception as e:
             logger.error(f"Table listing error: {str(e)}")
             raise
 
+    @cached_metadata
     def get_table_info(
         self, table_name: str, database: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -196,78 +430,84 @@ class PostgreSQLConnection(DatabaseConnection):
         schema_name = database or "public"
 
         try:
-            # Get columns
-            columns_query = """
-                SELECT 
-                    column_name,
-                    data_type,
-                    character_maximum_length,
-                    numeric_precision,
-                    numeric_scale,
-                    is_nullable,
-                    column_default,
-                    is_identity,
-                    is_generated
-                FROM information_schema.columns
-                WHERE table_schema = %s AND table_name = %s
-                ORDER BY ordinal_position
-            """
-
-            columns = self.execute_query(columns_query, (schema_name, table_name))
-
-            # Get indexes
-            indexes_query = """
-                SELECT 
-                    i.indexname,
-                    i.indexdef,
-                    pg_size_pretty(pg_relation_size(s.indexrelid)) as size
-                FROM pg_indexes i
-                JOIN pg_stat_user_indexes s ON i.indexname = s.indexrelname
-                WHERE i.schemaname = %s AND i.tablename = %s
-            """
-
-            indexes = self.execute_query(indexes_query, (schema_name, table_name))
-
-            # Get constraints
-            constraints_query = """
-                SELECT 
-                    tc.constraint_name,
-                    tc.constraint_type,
-                    kcu.column_name
-                FROM information_schema.table_constraints tc
-                LEFT JOIN information_schema.key_column_usage kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                    AND tc.table_schema = kcu.table_schema
-                WHERE tc.table_schema = %s AND tc.table_name = %s
-            """
-
-            constraints = self.execute_query(
-                constraints_query, (schema_name, table_name)
-            )
-
-            # Get table stats
-            stats_query = """
+            # Columns, indexes, constraints and stats as JSON in one round trip
+            table_info_query = """
+                WITH cols AS (
+                    SELECT json_agg(c) AS j FROM (
+                        SELECT 
+                            column_name,
+                            data_type,
+                            character_maximum_length,
+                            numeric_precision,
+                            numeric_scale,
+                            is_nullable,
+                            column_default,
+                            is_identity,
+                            is_generated
+                        FROM information_schema.columns
+                        WHERE table_schema = %(schema)s AND table_name = %(table)s
+                        ORDER BY ordinal_position
+                    ) c
+                ),
+                idx AS (
+                    SELECT json_agg(i) AS j FROM (
+                        SELECT 
+                            i.indexname,
+                            i.indexdef,
+                            pg_size_pretty(pg_relation_size(s.indexrelid)) as size
+                        FROM pg_indexes i
+                        JOIN pg_stat_user_indexes s ON i.indexname = s.indexrelname
+                        WHERE i.schemaname = %(schema)s AND i.tablename = %(table)s
+                    ) i
+                ),
+                cons AS (
+                    SELECT json_agg(k) AS j FROM (
+                        SELECT 
+                            tc.constraint_name,
+                            tc.constraint_type,
+                            kcu.column_name
+                        FROM information_schema.table_constraints tc
+                        LEFT JOIN information_schema.key_column_usage kcu
+                            ON tc.constraint_name = kcu.constraint_name
+                            AND tc.table_schema = kcu.table_schema
+                        WHERE tc.table_schema = %(schema)s
+                            AND tc.table_name = %(table)s
+                    ) k
+                ),
+                stats AS (
+                    SELECT row_to_json(t) AS j FROM (
+                        SELECT 
+                            n_live_tup as row_count,
+                            pg_size_pretty(pg_total_relation_size(%(rel)s::regclass))
+                                as total_size,
+                            pg_size_pretty(pg_relation_size(%(rel)s::regclass))
+                                as table_size,
+                            pg_size_pretty(
+                                pg_total_relation_size(%(rel)s::regclass)
+                                - pg_relation_size(%(rel)s::regclass)
+                            ) as indexes_size
+                        FROM pg_stat_user_tables
+                        WHERE schemaname = %(schema)s AND relname = %(table)s
+                    ) t
+                )
                 SELECT 
-                    n_live_tup as row_count,
-                    pg_size_pretty(pg_total_relation_size(%s::regclass)) as total_size,
-                    pg_size_pretty(pg_relation_size(%s::regclass)) as table_size,
-                    pg_size_pretty(pg_total_relation_size(%s::regclass) - pg_relation_size(%s::regclass)) as indexes_size
-                FROM pg_stat_user_tables
-                WHERE schemaname = %s AND relname = %s
+                    COALESCE(cols.j, '[]'::json),
+                    COALESCE(idx.j, '[]'::json),
+                    COALESCE(cons.j, '[]'::json),
+                    stats.j
+                FROM cols, idx, cons, stats
             """
 
-            stats_param = f"{schema_name}.{table_name}"
-            stats = self.execute_query(
-                stats_query,
-                (
-                    stats_param,
-                    stats_param,
-                    stats_param,
-                    stats_param,
-                    schema_name,
-                    table_name,
-                ),
+            result = self.execute_query_columnar(
+                table_info_query,
+                {
+                    "schema": schema_name,
+                    "table": table_name,
+                    "rel": f"{schema_name}.{table_name}",
+                },
             )
+            # The driver decodes json columns into Python lists and dicts
+            columns, indexes, constraints, stats = result["rows"][0]
 
             return {
                 "table_name": table_name,
@@ -278,7 +518,7 @@ class PostgreSQLConnection(DatabaseConnection):
                 "index_count": len(indexes),
                 "constraints": constraints,
                 "constraint_count": len(constraints),
-                "stats": stats[0] if stats else {},
+                "stats": stats or {},
             }
 
         except Exception as e:
@@ -295,6 +535,10 @@ class PostgreSQLConnection(DatabaseConnection):
         except Exception:
             return False
 
+    @cached_metadata(
+        ttl=DatabaseConnection.SCHEMA_LIST_TTL,
+        error_ttl=DatabaseConnection.SCHEMA_LIST_ERROR_TTL,
+    )
     def get_databases(self) -> List[str]:
         """Get list of all databases"""
         try:
@@ -310,17 +554,27 @@ class PostgreSQLConnection(DatabaseConnection):
             logger.error(f"Database listing error: {str(e)}")
             raise
 
+    @cached_metadata(
+        ttl=DatabaseConnection.SCHEMA_LIST_TTL,
+        error_ttl=DatabaseConnection.SCHEMA_LIST_ERROR_TTL,
+    )
     def get_schemas(self) -> List[str]:
         """Get list of all schemas"""
         try:
             query = """
-                SELECT schema_name
-                FROM information_schema.schemata
-                WHERE schema_name NOT IN ('pg_catalog', 'information_schema')
-                ORDER BY schema_name
+                SELECT nspname
+                FROM pg_namespace
+                WHERE has_schema_privilege(oid, 'USAGE')
+                ORDER BY nspname
             """
             results = self.execute_query(query)
-            return [row["schema_name"] for row in results]
+            # pg_namespace also holds TOAST and temp schemas, so skip those
+            return [
+                row["nspname"]
+                for row in results
+                if row["nspname"] not in _PG_SYSTEM_SCHEMAS
+                and not row["nspname"].startswith(_PG_INTERNAL_SCHEMA_PREFIXES)
+            ]
         except Exception as e:
             logger.error(f"Schema listing error: {str(e)}")
             raise
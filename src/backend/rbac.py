@@ -4,15 +4,29 @@ Manages users, roles, permissions, and access control for backend resources
 """
 
 import logging
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache, reduce
+from operator import or_
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
 
 class Permission(Enum):
-    """System permissions"""
+    """System permissions
+
+    Each member also carries a distinct single-bit ``mask`` so permission
+    sets can be held and compared as one integer.
+    """
+
+    def __new__(cls, value: str):
+        obj = object.__new__(cls)
+        obj._value_ = value
+        obj.mask = 1 << len(cls.__members__)
+        return obj
 
     # Database operations
     DB_CONNECT = "db:connect"
@@ -50,9 +64,103 @@ class Permission(Enum):
     SYSTEM_ADMIN = "system:admin"
 
 
+# Bumped on every change that can alter a permission decision: role
+# permissions, user role lists, user activation, users added or removed.
+# Cached masks and decisions are only valid for the value they were built at
+_generation = 0
+
+
+def _invalidate():
+    """Mark every cached permission mask and decision as stale"""
+    global _generation
+    _generation += 1
+
+
+# (bit, permission) pairs in definition order, for expanding a mask
+_PERMISSION_BITS = tuple((permission.mask, permission) for permission in Permission)
+
+# Permission lookup by value, without Enum.__call__ or a ValueError on misses
+_PERMISSIONS_BY_VALUE: Dict[str, Permission] = {
+    permission.value: permission for permission in Permission
+}
+
+
+def _mask_of(permissions: Iterable[Permission]) -> int:
+    """Combine permissions into a single bit mask"""
+    return reduce(or_, (permission.mask for permission in permissions), 0)
+
+
+def _permissions_in(mask: int) -> List[Permission]:
+    """Expand a bit mask into its permissions, in definition order"""
+    return [permission for bit, permission in _PERMISSION_BITS if mask & bit]
+
+
+# Permission masks of the default roles, folded once at import
+
+# Admin role - full access
+_ADMIN_MASK = (
+    Permission.DB_ADMIN.mask
+    | Permission.DATASOURCE_ADMIN.mask
+    | Permission.FILE_DELETE.mask
+    | Permission.AI_QUERY.mask
+    | Permission.AI_ANALYZE.mask
+    | Permission.AI_RECOMMEND.mask
+    | Permission.USER_WRITE.mask
+    | Permission.USER_DELETE.mask
+    | Permission.ROLE_WRITE.mask
+    | Permission.ROLE_DELETE.mask
+    | Permission.SYSTEM_ADMIN.mask
+    | Permission.SYSTEM_CONFIG.mask
+)
+
+# Analyst role - data access and AI
+_ANALYST_MASK = (
+    Permission.DB_CONNECT.mask
+    | Permission.DB_QUERY.mask
+    | Permission.DATASOURCE_READ.mask
+    | Permission.FILE_READ.mask
+    | Permission.AI_QUERY.mask
+    | Permission.AI_ANALYZE.mask
+    | Permission.AI_RECOMMEND.mask
+    | Permission.USER_READ.mask
+    | Permission.ROLE_READ.mask
+)
+
+# Viewer role - read-only access
+_VIEWER_MASK = (
+    Permission.DB_CONNECT.mask
+    | Permission.DB_QUERY.mask
+    | Permission.DATASOURCE_READ.mask
+    | Permission.FILE_READ.mask
+    | Permission.AI_QUERY.mask
+)
+
+# Developer role - read/write access, no admin
+_DEVELOPER_MASK = (
+    Permission.DB_CONNECT.mask
+    | Permission.DB_QUERY.mask
+    | Permission.DB_WRITE.mask
+    | Permission.DATASOURCE_READ.mask
+    | Permission.DATASOURCE_WRITE.mask
+    | Permission.FILE_READ.mask
+    | Permission.FILE_WRITE.mask
+    | Permission.AI_QUERY.mask
+    | Permission.AI_ANALYZE.mask
+)
+
+
 class Role:
     """User role with permissions"""
 
+    __slots__ = (
+        "name",
+        "description",
+        "_mask",
+        "created_at",
+        "_created_monotonic",
+        "_updated_monotonic",
+    )
+
     def __init__(
         self,
         name: str,
@@ -61,30 +169,78 @@ class Role:
     ):
         self.name = name
         self.description = description
-        self.permissions: Set[Permission] = permissions or set()
+        # Bit mask of Permission.mask values
+        self._mask = _mask_of(permissions or ())
         self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # Monotonic stamps; updated_at is derived from them only when read
+        self._created_monotonic = time.monotonic()
+        self._updated_monotonic = self._created_monotonic
+
+    @classmethod
+    def from_mask(cls, name: str, description: str, mask: int) -> "Role":
+        """Create a role directly from a permission bit mask"""
+        role = cls(name, description)
+        role._mask = mask
+        return role
+
+    @property
+    def updated_at(self) -> datetime:
+        """Wall-clock time of the role's last permission change"""
+        elapsed = self._updated_monotonic - self._created_monotonic
+        return self.created_at + timedelta(seconds=elapsed)
+
+    @property
+    def mask(self) -> int:
+        """Bit mask of the permissions granted by the role"""
+        return self._mask
+
+    @mask.setter
+    def mask(self, mask: int):
+        self._mask = mask
+        _invalidate()
+
+    @property
+    def permissions(self) -> FrozenSet[Permission]:
+        """Permissions granted by the role, read-only
+
+        Built from the mask on each access; change them with
+        add_permission/remove_permission or by assigning a new collection.
+        """
+        return frozenset(_permissions_in(self.mask))
+
+    @permissions.setter
+    def permissions(self, permissions: Iterable[Permission]):
+        self.mask = _mask_of(permissions)
 
     def add_permission(self, permission: Permission):
         """Add a permission to the role"""
-        self.permissions.add(permission)
-        self.updated_at = datetime.now()
+        self.mask |= permission.mask
+        self._updated_monotonic = time.monotonic()
 
     def remove_permission(self, permission: Permission):
         """Remove a permission from the role"""
-        self.permissions.discard(permission)
-        self.updated_at = datetime.now()
+        self.mask &= ~permission.mask
+        self._updated_monotonic = time.monotonic()
 
     def has_permission(self, permission: Permission) -> bool:
         """Check if role has a permission"""
-        return permission in self.permissions
+        return bool(self.mask & permission.mask)
+
+    # Roles are identified by name, so a user's role set dedupes by name
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Role):
+            return NotImplemented
+        return self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert role to dictionary"""
         return {
             "name": self.name,
             "description": self.description,
-            "permissions": [p.value for p in self.permissions],
+            "permissions": [p.value for p in _permissions_in(self.mask)],
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -93,156 +249,159 @@ class Role:
 class User:
     """System user with roles and permissions"""
 
+    __slots__ = (
+        "username",
+        "email",
+        "_roles",
+        "_is_active",
+        "created_at",
+        "last_login",
+        "metadata",
+        "_perm_generation",
+        "_perm_mask",
+        "_cached_perms",
+    )
+
     def __init__(
         self,
         username: str,
         email: str,
-        roles: Optional[List[Role]] = None,
+        roles: Optional[Iterable[Role]] = None,
     ):
         self.username = username
         self.email = email
-        self.roles: List[Role] = roles or []
-        self.is_active = True
+        self._roles: Set[Role] = set(roles or ())
+        self._is_active = True
         self.created_at = datetime.now()
         self.last_login = None
         self.metadata: Dict[str, Any] = {}
+        # Union of the roles' permissions, valid while _perm_generation
+        # matches the module's _generation
+        self._perm_generation: Optional[int] = None
+        self._perm_mask = 0
+        self._cached_perms: Optional[FrozenSet[Permission]] = None
+
+    @property
+    def roles(self) -> FrozenSet[Role]:
+        """Roles assigned to the user, read-only
+
+        Change them with add_role/remove_role or by assigning a new collection,
+        so cached permission checks are invalidated.
+        """
+        return frozenset(self._roles)
+
+    @roles.setter
+    def roles(self, roles: Iterable[Role]):
+        self._roles = set(roles)
+        _invalidate()
+
+    @property
+    def is_active(self) -> bool:
+        """Inactive users are denied every permission"""
+        return self._is_active
+
+    @is_active.setter
+    def is_active(self, is_active: bool):
+        self._is_active = is_active
+        _invalidate()
 
     def add_role(self, role: Role):
         """Add a role to the user"""
-        if role not in self.roles:
-            self.roles.append(role)
+        if role not in self._roles:
+            self._roles.add(role)
+            _invalidate()
 
     def remove_role(self, role: Role):
         """Remove a role from the user"""
-        if role in self.roles:
-            self.roles.remove(role)
+        if role in self._roles:
+            self._roles.discard(role)
+            _invalidate()
+
+    def permission_mask(self) -> int:
+        """Bit mask of the permissions granted by all of the user's roles"""
+        generation = _generation
+        if self._perm_generation != generation:
+            mask = 0
+            for role in self._roles:
+                mask |= role.mask
+            self._perm_mask = mask
+            self._cached_perms = None
+            self._perm_generation = generation
+        return self._perm_mask
 
     def has_permission(self, permission: Permission) -> bool:
         """Check if user has a permission through any role"""
         if not self.is_active:
             return False
 
-        for role in self.roles:
-            if role.has_permission(permission):
-                return True
-
-        return False
+        return bool(self.permission_mask() & permission.mask)
 
     def has_any_permission(self, permissions: List[Permission]) -> bool:
         """Check if user has any of the specified permissions"""
-        for permission in permissions:
-            if self.has_permission(permission):
-                return True
-        return False
+        if not self.is_active:
+            return False
+
+        return not self.get_all_permissions().isdisjoint(permissions)
 
     def has_all_permissions(self, permissions: List[Permission]) -> bool:
         """Check if user has all specified permissions"""
-        for permission in permissions:
-            if not self.has_permission(permission):
-                return False
-        return True
+        if not self.is_active:
+            # Vacuously true for an empty list, as before
+            return not permissions
+
+        return self.get_all_permissions().issuperset(permissions)
 
-    def get_all_permissions(self) -> Set[Permission]:
+    def get_all_permissions(self) -> FrozenSet[Permission]:
         """Get all permissions from all roles"""
-        all_permissions = set()
-        for role in self.roles:
-            all_permissions.update(role.permissions)
-        return all_permissions
+        mask = self.permission_mask()
+        if self._cached_perms is None:
+            self._cached_perms = frozenset(_permissions_in(mask))
+        return self._cached_perms
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert user to dictionary"""
         return {
             "username": self.username,
             "email": self.email,
-            "roles": [role.name for role in self.roles],
+            "roles": sorted(role.name for role in self._roles),
             "is_active": self.is_active,
             "created_at": self.created_at.isoformat(),
             "last_login": self.last_login.isoformat() if self.last_login else None,
-            "permissions": [p.value for p in self.get_all_permissions()],
+            "permissions": [p.value for p in _permissions_in(self.permission_mask())],
         }
 
 
 class RBACManager:
     """RBAC system manager"""
 
+    # Built-in roles created at startup; they cannot be deleted
+    _DEFAULT_ROLES = frozenset({"admin", "analyst", "viewer", "developer"})
+
     def __init__(self):
         self.users: Dict[str, User] = {}
         self.roles: Dict[str, Role] = {}
+        # Per-manager decision cache, so managers don't share entries or
+        # keep each other alive through a class-level cache
+        self._check_permission = lru_cache(maxsize=4096)(self._decide_permission)
         self._initialize_default_roles()
 
     def _initialize_default_roles(self):
         """Initialize default system roles"""
-        # Admin role - full access
-        admin_role = Role(
-            "admin",
-            "System administrator with full access",
-            {
-                Permission.DB_ADMIN,
-                Permission.DATASOURCE_ADMIN,
-                Permission.FILE_DELETE,
-                Permission.AI_QUERY,
-                Permission.AI_ANALYZE,
-                Permission.AI_RECOMMEND,
-                Permission.USER_WRITE,
-                Permission.USER_DELETE,
-                Permission.ROLE_WRITE,
-                Permission.ROLE_DELETE,
-                Permission.SYSTEM_ADMIN,
-                Permission.SYSTEM_CONFIG,
-            },
-        )
-
-        # Analyst role - data access and AI
-        analyst_role = Role(
-            "analyst",
-            "Data analyst with read access and AI capabilities",
-            {
-                Permission.DB_CONNECT,
-                Permission.DB_QUERY,
-                Permission.DATASOURCE_READ,
-                Permission.FILE_READ,
-                Permission.AI_QUERY,
-                Permission.AI_ANALYZE,
-                Permission.AI_RECOMMEND,
-                Permission.USER_READ,
-                Permission.ROLE_READ,
-            },
-        )
-
-        # Viewer role - read-only access
-        viewer_role = Role(
-            "viewer",
-            "Read-only access to data and reports",
-            {
-                Permission.DB_CONNECT,
-                Permission.DB_QUERY,
-                Permission.DATASOURCE_READ,
-                Permission.FILE_READ,
-                Permission.AI_QUERY,
-            },
-        )
-
-        # Developer role - read/write access, no admin
-        developer_role = Role(
-            "developer",
-            "Developer with read/write access to data sources",
-            {
-                Permission.DB_CONNECT,
-                Permission.DB_QUERY,
-                Permission.DB_WRITE,
-                Permission.DATASOURCE_READ,
-                Permission.DATASOURCE_WRITE,
-                Permission.FILE_READ,
-                Permission.FILE_WRITE,
-                Permission.AI_QUERY,
-                Permission.AI_ANALYZE,
-            },
-        )
-
-        self.roles["admin"] = admin_role
-        self.roles["analyst"] = analyst_role
-        self.roles["viewer"] = viewer_role
-        self.roles["developer"] = developer_role
+        for name, description, mask in (
+            ("admin", "System administrator with full access", _ADMIN_MASK),
+            (
+                "analyst",
+                "Data analyst with read access and AI capabilities",
+                _ANALYST_MASK,
+            ),
+            ("viewer", "Read-only access to data and reports", _VIEWER_MASK),
+            (
+                "developer",
+                "Developer with read/write access to data sources",
+                _DEVELOPER_MASK,
+            ),
+        ):
+            self.roles[name] = Role.from_mask(name, description, mask)
 
         logger.info("Initialized default RBAC roles")
 
@@ -252,7 +411,7 @@ class RBACManager:
         """Create a new user"""
         try:
             if username in self.users:
-                logger.warning(f"User already exists: {username}")
+                logger.warning("User already exists: %s", username)
                 return None
 
             # Get roles
@@ -262,16 +421,17 @@ class RBACManager:
                     if role_name in self.roles:
                         roles.append(self.roles[role_name])
                     else:
-                        logger.warning(f"Role not found: {role_name}")
+                        logger.warning("Role not found: %s", role_name)
 
             user = User(username, email, roles)
             self.users[username] = user
+            _invalidate()
 
-            logger.info(f"Created user: {username} with roles: {role_names}")
+            logger.info("Created user: %s with roles: %s", username, role_names)
             return user
 
         except Exception as e:
-            logger.error(f"Error creating user: {str(e)}")
+            logger.error("Error creating user: %s", e)
             return None
 
     def get_user(self, username: str) -> Optional[User]:
@@ -283,14 +443,15 @@ class RBACManager:
         try:
             if username in self.users:
                 del self.users[username]
-                logger.info(f"Deleted user: {username}")
+                _invalidate()
+                logger.info("Deleted user: %s", username)
                 return True
 
-            logger.warning(f"User not found: {username}")
+            logger.warning("User not found: %s", username)
             return False
 
         except Exception as e:
-            logger.error(f"Error deleting user: {str(e)}")
+            logger.error("Error deleting user: %s", e)
             return False
 
     def update_user_roles(self, username: str, role_names: List[str]) -> bool:
@@ -298,24 +459,24 @@ class RBACManager:
         try:
             user = self.get_user(username)
             if not user:
-                logger.warning(f"User not found: {username}")
+                logger.warning("User not found: %s", username)
                 return False
 
             # Clear existing roles
-            user.roles = []
+            user.roles = ()
 
             # Add new roles
             for role_name in role_names:
                 if role_name in self.roles:
                     user.add_role(self.roles[role_name])
                 else:
-                    logger.warning(f"Role not found: {role_name}")
+                    logger.warning("Role not found: %s", role_name)
 
-            logger.info(f"Updated roles for user {username}: {role_names}")
+            logger.info("Updated roles for user %s: %s", username, role_names)
             return True
 
         except Exception as e:
-            logger.error(f"Error updating user roles: {str(e)}")
+            logger.error("Error updating user roles: %s", e)
             return False
 
     def create_role(
@@ -324,27 +485,27 @@ class RBACManager:
         """Create a custom role"""
         try:
             if name in self.roles:
-                logger.warning(f"Role already exists: {name}")
+                logger.warning("Role already exists: %s", name)
                 return None
 
             # Parse permissions
             role_permissions = set()
             if permissions:
                 for perm_str in permissions:
-                    try:
-                        permission = Permission(perm_str)
+                    permission = _PERMISSIONS_BY_VALUE.get(perm_str)
+                    if permission is None:
+                        logger.warning("Invalid permission: %s", perm_str)
+                    else:
                         role_permissions.add(permission)
-                    except ValueError:
-                        logger.warning(f"Invalid permission: {perm_str}")
 
             role = Role(name, description, role_permissions)
             self.roles[name] = role
 
-            logger.info(f"Created role: {name}")
+            logger.info("Created role: %s", name)
             return role
 
         except Exception as e:
-            logger.error(f"Error creating role: {str(e)}")
+            logger.error("Error creating role: %s", e)
             return None
 
     def get_role(self, name: str) -> Optional[Role]:
@@ -355,8 +516,8 @@ class RBACManager:
         """Delete a role"""
         try:
             # Don't delete default roles
-            if name in ["admin", "analyst", "viewer", "developer"]:
-                logger.warning(f"Cannot delete default role: {name}")
+            if name in self._DEFAULT_ROLES:
+                logger.warning("Cannot delete default role: %s", name)
                 return False
 
             if name in self.roles:
@@ -366,24 +527,35 @@ class RBACManager:
                     user.remove_role(role)
 
                 del self.roles[name]
-                logger.info(f"Deleted role: {name}")
+                logger.info("Deleted role: %s", name)
                 return True
 
-            logger.warning(f"Role not found: {name}")
+            logger.warning("Role not found: %s", name)
             return False
 
         except Exception as e:
-            logger.error(f"Error deleting role: {str(e)}")
+            logger.error("Error deleting role: %s", e)
             return False
 
     def check_permission(self, username: str, permission: Permission) -> bool:
         """Check if user has permission"""
+        return self._check_permission(_generation, username, permission)
+
+    def _decide_permission(
+        self, generation: int, username: str, permission: Permission
+    ) -> bool:
+        """Decide a permission check; cached until the RBAC state changes"""
         user = self.get_user(username)
         if not user:
             return False
 
         return user.has_permission(permission)
 
+    def invalidate(self):
+        """Drop cached permission decisions, e.g. after editing users directly"""
+        _invalidate()
+        self._check_permission.cache_clear()
+
     def list_users(self) -> List[Dict[str, Any]]:
         """List all users"""
         return [user.to_dict() for user in self.users.values()]
@@ -398,8 +570,18 @@ class RBACManager:
         if not user:
             return []
 
-        return [p.value for p in user.get_all_permissions()]
+        return [p.value for p in _permissions_in(user.permission_mask())]
+
+
+# Global RBAC manager instance, created lazily on first access
+_rbac_manager_lock = threading.Lock()
 
 
-# Global RBAC manager instance
-rbac_manager = RBACManager()
+def __getattr__(name: str) -> Any:
+    """Create the global rbac_manager instance on first access (PEP 562)"""
+    if name == "rbac_manager":
+        with _rbac_manager_lock:
+            if "rbac_manager" not in globals():
+                globals()["rbac_manager"] = RBACManager()
+        return globals()["rbac_manager"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,13 +3,182 @@ SQL Server Database Connector
 Handles connections and queries to Microsoft SQL Server databases
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
-
-from backend.db_manager import DatabaseConnection
+import threading
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterator, List, Optional
+
+from backend.db_manager import (
+    DatabaseConnection,
+    HandoffPool,
+    cached_metadata,
+    column_names,
+    fetch_dicts,
+    fetch_rows,
+    group_rows,
+    iter_cursor_batches,
+)
 
 logger = logging.getLogger(__name__)
 
+# Connection pools shared by connections to the same database as the same user
+_POOLS: Dict[tuple, HandoffPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+# Catalog queries; {db} is filled in by _catalog_sql with the quoted database
+_SCHEMA_TABLES_SQL = """
+    SELECT 
+        TABLE_SCHEMA,
+        TABLE_NAME,
+        TABLE_TYPE
+    FROM {db}.INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_TYPE = 'BASE TABLE'
+    ORDER BY TABLE_SCHEMA, TABLE_NAME
+"""
+
+_SCHEMA_COLUMNS_SQL = """
+    SELECT 
+        TABLE_SCHEMA,
+        TABLE_NAME,
+        COLUMN_NAME,
+        DATA_TYPE,
+        CHARACTER_MAXIMUM_LENGTH,
+        NUMERIC_PRECISION,
+        NUMERIC_SCALE,
+        IS_NULLABLE,
+        COLUMN_DEFAULT
+    FROM {db}.INFORMATION_SCHEMA.COLUMNS
+    ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
+"""
+
+_SCHEMA_INDEXES_SQL = """
+    SELECT 
+        s.name as TABLE_SCHEMA,
+        t.name as TABLE_NAME,
+        i.name as INDEX_NAME,
+        i.type_desc as INDEX_TYPE,
+        i.is_unique as IS_UNIQUE,
+        i.is_primary_key as IS_PRIMARY_KEY,
+        COL_NAME(ic.object_id, ic.column_id) as COLUMN_NAME
+    FROM {db}.sys.indexes i
+    INNER JOIN {db}.sys.index_columns ic 
+        ON i.object_id = ic.object_id 
+        AND i.index_id = ic.index_id
+    INNER JOIN {db}.sys.tables t 
+        ON i.object_id = t.object_id
+    INNER JOIN {db}.sys.schemas s 
+        ON t.schema_id = s.schema_id
+    ORDER BY s.name, t.name, i.name, ic.key_ordinal
+"""
+
+_TABLES_SQL = """
+    SELECT TABLE_SCHEMA + '.' + TABLE_NAME as TABLE_NAME
+    FROM {db}.INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_TYPE = 'BASE TABLE'
+    ORDER BY TABLE_SCHEMA, TABLE_NAME
+"""
+
+_TABLE_COLUMNS_SQL = """
+    SELECT 
+        COLUMN_NAME,
+        DATA_TYPE,
+        CHARACTER_MAXIMUM_LENGTH,
+        NUMERIC_PRECISION,
+        NUMERIC_SCALE,
+        IS_NULLABLE,
+        COLUMN_DEFAULT,
+        ORDINAL_POSITION
+    FROM {db}.INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = @schema AND TABLE_NAME = @table
+    ORDER BY ORDINAL_POSITION
+"""
+
+_TABLE_INDEXES_SQL = """
+    SELECT 
+        i.name as INDEX_NAME,
+        i.type_desc as INDEX_TYPE,
+        i.is_unique as IS_UNIQUE,
+        i.is_primary_key as IS_PRIMARY_KEY,
+        COL_NAME(ic.object_id, ic.column_id) as COLUMN_NAME,
+        ic.key_ordinal as KEY_ORDINAL
+    FROM {db}.sys.indexes i
+    INNER JOIN {db}.sys.index_columns ic 
+        ON i.object_id = ic.object_id 
+        AND i.index_id = ic.index_id
+    INNER JOIN {db}.sys.tables t 
+        ON i.object_id = t.object_id
+    INNER JOIN {db}.sys.schemas s 
+        ON t.schema_id = s.schema_id
+    WHERE s.name = @schema AND t.name = @table
+    ORDER BY i.name, ic.key_ordinal
+"""
+
+_TABLE_CONSTRAINTS_SQL = """
+    SELECT 
+        tc.CONSTRAINT_NAME,
+        tc.CONSTRAINT_TYPE,
+        kcu.COLUMN_NAME
+    FROM {db}.INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+    LEFT JOIN {db}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+        ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+        AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
+        AND tc.TABLE_NAME = kcu.TABLE_NAME
+    WHERE tc.TABLE_SCHEMA = @schema AND tc.TABLE_NAME = @table
+"""
+
+_TABLE_STATS_SQL = """
+    SELECT 
+        p.rows as ROW_COUNT,
+        SUM(a.total_pages) * 8 as TOTAL_SIZE_KB,
+        SUM(a.used_pages) * 8 as USED_SIZE_KB
+    FROM {db}.sys.tables t
+    INNER JOIN {db}.sys.schemas s 
+        ON t.schema_id = s.schema_id
+    INNER JOIN {db}.sys.partitions p 
+        ON t.object_id = p.object_id
+    INNER JOIN {db}.sys.allocation_units a 
+        ON p.partition_id = a.container_id
+    WHERE s.name = @schema AND t.name = @table AND p.index_id IN (0,1)
+    GROUP BY p.rows
+"""
+
+# get_table_info sends its four queries as one batch and reads the four
+# result sets in turn; the table is bound once into T-SQL variables
+_TABLE_INFO_SQL = (
+    "SET NOCOUNT ON;\n"
+    "DECLARE @schema sysname = ?, @table sysname = ?;\n"
+    + ";\n".join(
+        (
+            _TABLE_COLUMNS_SQL,
+            _TABLE_INDEXES_SQL,
+            _TABLE_CONSTRAINTS_SQL,
+            _TABLE_STATS_SQL,
+        )
+    )
+)
+
+_SCHEMAS_SQL = """
+    SELECT SCHEMA_NAME
+    FROM {db}.INFORMATION_SCHEMA.SCHEMATA
+    WHERE SCHEMA_NAME NOT IN ('db_owner', 'db_accessadmin', 
+        'db_securityadmin', 'db_ddladmin', 'db_backupoperator',
+        'db_datareader', 'db_datawriter', 'db_denydatareader',
+        'db_denydatawriter', 'INFORMATION_SCHEMA', 'sys')
+    ORDER BY SCHEMA_NAME
+"""
+
+
+@lru_cache(maxsize=1024)
+def _catalog_sql(template: str, db_name: str) -> str:
+    """Fill a catalog query with a bracket-quoted database name, once per pair
+
+    Database names cannot be bound as parameters; quoting them (doubling any
+    closing bracket) keeps the name inert, and reusing the same text for a
+    database lets SQL Server reuse its cached plan.
+    """
+    return template.format(db="[" + db_name.replace("]", "]]") + "]")
+
 
 class SQLServerConnection(DatabaseConnection):
     """SQL Server database connection implementation"""
@@ -18,12 +187,11 @@ class SQLServerConnection(DatabaseConnection):
         super().__init__(connection_id, config)
         self.conn = None
         self.cursor = None
+        self._pool = None
 
     def connect(self) -> bool:
         """Establish SQL Server connection"""
         try:
-            import pyodbc
-
             server = self.config.get("server", "localhost")
             port = self.config.get("port", 1433)
             database = self.config.get("database", "master")
@@ -49,32 +217,77 @@ class SQLServerConnection(DatabaseConnection):
                     f"PWD={password};"
                 )
 
-            self.conn = pyodbc.connect(conn_str)
+            autocommit = self.config.get("autocommit", False)
+            char_encoding = self.config.get("char_encoding")
+
+            key = (conn_str, autocommit, char_encoding)
+            with _POOLS_LOCK:
+                pool = _POOLS.get(key)
+                if pool is None:
+                    # Rolling back clears any transaction a borrower left open;
+                    # it fails on a dead connection, which makes the pool
+                    # discard it
+                    pool = HandoffPool(
+                        partial(
+                            self._open_connection, conn_str, autocommit, char_encoding
+                        ),
+                        max_size=self.config.get("pool_max", 10),
+                        timeout=self.config.get("pool_timeout", 30.0),
+                        reset=lambda conn: conn.rollback(),
+                    )
+                    _POOLS[key] = pool
+
+            self.conn = pool.getconn()
+            self._pool = pool
+
             self.cursor = self.conn.cursor()
+            self.cursor.arraysize = self.config.get("arraysize", 1000)
+            # Bind executemany() parameters as one array instead of row by row
+            self.cursor.fast_executemany = True
 
-            logger.info(f"Connected to SQL Server: {server}:{port}/{database}")
+            logger.info("Connected to SQL Server: %s:%s/%s", server, port, database)
             self.connection = self.conn
             return True
 
         except Exception as e:
-            logger.error(f"SQL Server connection error: {str(e)}")
+            logger.error("SQL Server connection error: %s", e)
             return False
 
+    @staticmethod
+    def _open_connection(
+        conn_str: str, autocommit: bool, char_encoding: Optional[str]
+    ) -> Any:
+        """Open a pyodbc connection for the pool with its encodings set up"""
+        import pyodbc
+
+        conn = pyodbc.connect(conn_str, autocommit=autocommit)
+
+        # NVARCHAR data travels as UTF-16LE, SQL Server's native encoding,
+        # so pyodbc passes it through without transcoding
+        conn.setencoding(encoding="utf-16le")
+        conn.setdecoding(pyodbc.SQL_WCHAR, encoding="utf-16le")
+        if char_encoding:
+            conn.setdecoding(pyodbc.SQL_CHAR, encoding=char_encoding)
+        return conn
+
     def disconnect(self) -> bool:
         """Close SQL Server connection"""
+        self.invalidate_metadata()
         try:
             if self.cursor:
                 self.cursor.close()
                 self.cursor = None
 
             if self.conn:
-                self.conn.close()
+                # Hand the connection back to the shared pool for reuse
+                self._pool.putconn(self.conn)
                 self.conn = None
+                self._pool = None
                 self.connection = None
-                logger.info(f"Disconnected from SQL Server: {self.connection_id}")
+                logger.info("Disconnected from SQL Server: %s", self.connection_id)
             return True
         except Exception as e:
-            logger.error(f"SQL Server disconnect error: {str(e)}")
+            logger.error("SQL Server disconnect error: %s", e)
             return False
 
     def execute_query(self, query: str, params=None) -> List[Dict]:
@@ -83,146 +296,201 @@ class SQLServerConnection(DatabaseConnection):
             raise ConnectionError("Not connected to SQL Server")
 
         try:
-            # Execute query
+            if not self._execute(query, params):
+                return [{"rows_affected": self.cursor.rowcount, "status": "success"}]
+
+            # Rows become dictionaries batch by batch as they are fetched
+            data = fetch_dicts(self.cursor, self.cursor.arraysize)
+
+            logger.info("Query executed successfully: %d rows returned", len(data))
+            return data
+
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("SQL Server query error: %s", e)
+            raise
+
+    def execute_query_columnar(self, query: str, params=None) -> Dict[str, Any]:
+        """Execute a SQL Server query and return columns plus row tuples"""
+        if not self.conn or not self.cursor:
+            raise ConnectionError("Not connected to SQL Server")
+
+        try:
+            if not self._execute(query, params):
+                return {
+                    "columns": ["rows_affected", "status"],
+                    "rows": [(self.cursor.rowcount, "success")],
+                }
+
+            # Get column names
+            columns = column_names(self.cursor)
+
+            # Fetch all results, one arraysize batch per round trip
+            rows = fetch_rows(self.cursor, self.cursor.arraysize)
+
+            logger.info("Query executed successfully: %d rows returned", len(rows))
+            return {"columns": columns, "rows": rows}
+
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("SQL Server query error: %s", e)
+            raise
+
+    def execute_many(self, query: str, seq_of_params: List[tuple]) -> int:
+        """Execute a SQL Server statement once per parameter set and commit"""
+        if not self.conn or not self.cursor:
+            raise ConnectionError("Not connected to SQL Server")
+
+        try:
+            self.cursor.executemany(query, seq_of_params)
+            self.conn.commit()
+            logger.info(
+                "Batch executed successfully: %d parameter sets",
+                len(seq_of_params),
+            )
+            return self.cursor.rowcount
+
+        except Exception as e:
+            self.conn.rollback()
+            logger.error("SQL Server batch error: %s", e)
+            raise
+
+    def _execute(self, query: str, params=None) -> bool:
+        """Run a statement on the shared cursor, committing it if it returns no rows"""
+        if params:
+            self.cursor.execute(query, params)
+        else:
+            self.cursor.execute(query)
+
+        # Check if query returns data
+        if self.cursor.description:
+            return True
+
+        # Query doesn't return data (INSERT, UPDATE, DELETE)
+        self.conn.commit()
+        self._check_ddl(query)
+        logger.info(
+            "Query executed successfully: %d rows affected", self.cursor.rowcount
+        )
+        return False
+
+    async def execute_query_async(self, query: str, params=None) -> List[Dict]:
+        """Execute a SQL Server query in a worker thread and return results
+
+        pyodbc releases the GIL while it waits on the server, so the event
+        loop keeps running; the query borrows its own pooled connection, so
+        several can be in flight at once.
+        """
+        if not self._pool:
+            raise ConnectionError("Not connected to SQL Server")
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._execute_pooled, query, params)
+
+    def _execute_pooled(self, query: str, params=None) -> List[Dict]:
+        """Run a query on a connection borrowed from the pool"""
+        conn = self._pool.getconn()
+        try:
+            cursor = conn.cursor()
+        except Exception as e:
+            # A connection that cannot open a cursor is dead; discard it so
+            # its pool slot is freed
+            logger.error("SQL Server query error: %s", e)
+            self._pool.putconn(conn, close=True)
+            raise
+
+        try:
+            cursor.arraysize = self.config.get("arraysize", 1000)
             if params:
-                self.cursor.execute(query, params)
+                cursor.execute(query, params)
             else:
-                self.cursor.execute(query)
+                cursor.execute(query)
 
-            # Check if query returns data
-            if self.cursor.description:
-                # Get column names
-                column_names = [column[0] for column in self.cursor.description]
+            if not cursor.description:
+                # Query doesn't return data (INSERT, UPDATE, DELETE)
+                conn.commit()
+                self._check_ddl(query)
+                return [{"rows_affected": cursor.rowcount, "status": "success"}]
 
-                # Fetch all results
-                rows = self.cursor.fetchall()
+            return fetch_dicts(cursor, cursor.arraysize)
 
-                # Convert to list of dictionaries
-                data = []
-                for row in rows:
-                    row_dict = dict(zip(column_names, row))
-                    data.append(row_dict)
+        except Exception as e:
+            logger.error("SQL Server query error: %s", e)
+            raise
+        finally:
+            cursor.close()
+            # The pool rolls back anything left uncommitted
+            self._pool.putconn(conn)
+
+    def execute_query_iter(
+        self, query: str, params=None, chunk_size: int = 1000
+    ) -> Iterator[List[Dict]]:
+        """Execute a SQL Server query and yield results in batches"""
+        if not self.conn:
+            raise ConnectionError("Not connected to SQL Server")
 
-                logger.info(
-                    f"Query executed successfully: {len(data)} rows returned"
-                )
-                return data
+        # Dedicated cursor so other queries can run while this one streams
+        cursor = self.conn.cursor()
+        try:
+            if params:
+                cursor.execute(query, params)
             else:
-                # Query doesn't return data (INSERT, UPDATE, DELETE)
-                self.conn.commit()
-                logger.info(
-                    f"Query executed successfully: {self.cursor.rowcount} rows affected"
-                )
-                return [
-                    {
-                        "rows_affected": self.cursor.rowcount,
-                        "status": "success",
-                    }
-                ]
+                cursor.execute(query)
+
+            yield from iter_cursor_batches(self.conn, cursor, chunk_size)
 
         except Exception as e:
             self.conn.rollback()
-            logger.error(f"SQL Server query error: {str(e)}")
+            logger.error("SQL Server query error: %s", e)
             raise
+        finally:
+            cursor.close()
 
+    @cached_metadata
     def get_schema(self, database: Optional[str] = None) -> Dict[str, Any]:
         """Get SQL Server database schema information"""
         db_name = database or self.config.get("database", "master")
 
         try:
-            # Get all tables in database
-            tables_query = f"""
-                SELECT 
-                    TABLE_SCHEMA,
-                    TABLE_NAME,
-                    TABLE_TYPE
-                FROM [{db_name}].INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_TYPE = 'BASE TABLE'
-                ORDER BY TABLE_SCHEMA, TABLE_NAME
-            """
+            tables_query = _catalog_sql(_SCHEMA_TABLES_SQL, db_name)
+            columns_query = _catalog_sql(_SCHEMA_COLUMNS_SQL, db_name)
+            indexes_query = _catalog_sql(_SCHEMA_INDEXES_SQL, db_name)
 
-            results = self.execute_query(tables_query)
+            # Columns and indexes for every table in two bulk queries,
+            # rather than two queries per table
+            tables_result = self.execute_query_columnar(tables_query)
+            columns = group_rows(self.execute_query_columnar(columns_query), 2)
+            indexes = group_rows(self.execute_query_columnar(indexes_query), 2)
 
-            # Get columns for each table
             schema = {"database": db_name, "schemas": {}}
-
-            for row in results:
-                schema_name = row["TABLE_SCHEMA"]
-                table_name = row["TABLE_NAME"]
-
-                if schema_name not in schema["schemas"]:
-                    schema["schemas"][schema_name] = {}
-
-                columns_query = f"""
-                    SELECT 
-                        COLUMN_NAME,
-                        DATA_TYPE,
-                        CHARACTER_MAXIMUM_LENGTH,
-                        NUMERIC_PRECISION,
-                        NUMERIC_SCALE,
-                        IS_NULLABLE,
-                        COLUMN_DEFAULT
-                    FROM [{db_name}].INFORMATION_SCHEMA.COLUMNS
-                    WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
-                    ORDER BY ORDINAL_POSITION
-                """
-
-                columns = self.execute_query(
-                    columns_query, (schema_name, table_name)
-                )
-
-                # Get indexes
-                indexes_query = f"""
-                    SELECT 
-                        i.name as INDEX_NAME,
-                        i.type_desc as INDEX_TYPE,
-                        i.is_unique as IS_UNIQUE,
-                        i.is_primary_key as IS_PRIMARY_KEY,
-                        COL_NAME(ic.object_id, ic.column_id) as COLUMN_NAME
-                    FROM [{db_name}].sys.indexes i
-                    INNER JOIN [{db_name}].sys.index_columns ic 
-                        ON i.object_id = ic.object_id 
-                        AND i.index_id = ic.index_id
-                    INNER JOIN [{db_name}].sys.tables t 
-                        ON i.object_id = t.object_id
-                    INNER JOIN [{db_name}].sys.schemas s 
-                        ON t.schema_id = s.schema_id
-                    WHERE s.name = ? AND t.name = ?
-                    ORDER BY i.name, ic.key_ordinal
-                """
-
-                indexes = self.execute_query(indexes_query, (schema_name, table_name))
-
-                schema["schemas"][schema_name][table_name] = {
-                    "columns": columns,
-                    "indexes": indexes,
+            for schema_name, table_name, _ in tables_result["rows"]:
+                key = (schema_name, table_name)
+                schema["schemas"].setdefault(schema_name, {})[table_name] = {
+                    "columns": columns.get(key, []),
+                    "indexes": indexes.get(key, []),
                 }
 
             return schema
 
         except Exception as e:
-            logger.error(f"Schema retrieval error: {str(e)}")
+            logger.error("Schema retrieval error: %s", e)
             raise
 
+    @cached_metadata
     def get_tables(self, database: Optional[str] = None) -> List[str]:
         """Get list of tables in SQL Server database"""
         db_name = database or self.config.get("database", "master")
 
         try:
-            query = f"""
-                SELECT TABLE_SCHEMA + '.' + TABLE_NAME as TABLE_NAME
-                FROM [{db_name}].INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_TYPE = 'BASE TABLE'
-                ORDER BY TABLE_SCHEMA, TABLE_NAME
-            """
-
+            query = _catalog_sql(_TABLES_SQL, db_name)
             results = self.execute_query(query)
             return [row["TABLE_NAME"] for row in results]
 
         except Exception as e:
-            logger.error(f"Table listing error: {str(e)}")
+            logger.error("Table listing error: %s", e)
             raise
 
+    @cached_metadata
     def get_table_info(
         self, table_name: str, database: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -236,84 +504,14 @@ class SQLServerConnection(DatabaseConnection):
             schema_name = "dbo"
             tbl_name = table_name
 
-        try:
-            # Get columns
-            columns_query = f"""
-                SELECT 
-                    COLUMN_NAME,
-                    DATA_TYPE,
-                    CHARACTER_MAXIMUM_LENGTH,
-                    NUMERIC_PRECISION,
-                    NUMERIC_SCALE,
-                    IS_NULLABLE,
-                    COLUMN_DEFAULT,
-                    ORDINAL_POSITION
-                FROM [{db_name}].INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
-                ORDER BY ORDINAL_POSITION
-            """
-
-            columns = self.execute_query(columns_query, (schema_name, tbl_name))
-
-            # Get indexes
-            indexes_query = f"""
-                SELECT 
-                    i.name as INDEX_NAME,
-                    i.type_desc as INDEX_TYPE,
-                    i.is_unique as IS_UNIQUE,
-                    i.is_primary_key as IS_PRIMARY_KEY,
-                    COL_NAME(ic.object_id, ic.column_id) as COLUMN_NAME,
-                    ic.key_ordinal as KEY_ORDINAL
-                FROM [{db_name}].sys.indexes i
-                INNER JOIN [{db_name}].sys.index_columns ic 
-                    ON i.object_id = ic.object_id 
-                    AND i.index_id = ic.index_id
-                INNER JOIN [{db_name}].sys.tables t 
-                    ON i.object_id = t.object_id
-                INNER JOIN [{db_name}].sys.schemas s 
-                    ON t.schema_id = s.schema_id
-                WHERE s.name = ? AND t.name = ?
-                ORDER BY i.name, ic.key_ordinal
-            """
-
-            indexes = self.execute_query(indexes_query, (schema_name, tbl_name))
-
-            # Get constraints
-            constraints_query = f"""
-                SELECT 
-                    tc.CONSTRAINT_NAME,
-                    tc.CONSTRAINT_TYPE,
-                    kcu.COLUMN_NAME
-                FROM [{db_name}].INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-                LEFT JOIN [{db_name}].INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-                    ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-                    AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
-                    AND tc.TABLE_NAME = kcu.TABLE_NAME
-                WHERE tc.TABLE_SCHEMA = ? AND tc.TABLE_NAME = ?
-            """
+        if not self.conn or not self.cursor:
+            raise ConnectionError("Not connected to SQL Server")
 
-            constraints = self.execute_query(
-                constraints_query, (schema_name, tbl_name)
+        try:
+            self.cursor.execute(
+                _catalog_sql(_TABLE_INFO_SQL, db_name), (schema_name, tbl_name)
             )
-
-            # Get table stats
-            stats_query = f"""
-                SELECT 
-                    p.rows as ROW_COUNT,
-                    SUM(a.total_pages) * 8 as TOTAL_SIZE_KB,
-                    SUM(a.used_pages) * 8 as USED_SIZE_KB
-                FROM [{db_name}].sys.tables t
-                INNER JOIN [{db_name}].sys.schemas s 
-                    ON t.schema_id = s.schema_id
-                INNER JOIN [{db_name}].sys.partitions p 
-                    ON t.object_id = p.object_id
-                INNER JOIN [{db_name}].sys.allocation_units a 
-                    ON p.partition_id = a.container_id
-                WHERE s.name = ? AND t.name = ? AND p.index_id IN (0,1)
-                GROUP BY p.rows
-            """
-
-            stats = self.execute_query(stats_query, (schema_name, tbl_name))
+            columns, indexes, constraints, stats = self._fetch_result_sets()
 
             return {
                 "table_name": tbl_name,
@@ -329,9 +527,18 @@ class SQLServerConnection(DatabaseConnection):
             }
 
         except Exception as e:
-            logger.error(f"Table info error: {str(e)}")
+            self.conn.rollback()
+            logger.error("Table info error: %s", e)
             raise
 
+    def _fetch_result_sets(self) -> List[List[Dict]]:
+        """Fetch every result set of the batch just run on the shared cursor"""
+        results = []
+        while True:
+            results.append(fetch_dicts(self.cursor, self.cursor.arraysize))
+            if not self.cursor.nextset():
+                return results
+
     def test_connection(self) -> bool:
         """Test if SQL Server connection is alive"""
         try:
@@ -342,6 +549,10 @@ class SQLServerConnection(DatabaseConnection):
         except Exception:
             return False
 
+    @cached_metadata(
+        ttl=DatabaseConnection.SCHEMA_LIST_TTL,
+        error_ttl=DatabaseConnection.SCHEMA_LIST_ERROR_TTL,
+    )
     def get_databases(self) -> List[str]:
         """Get list of all databases"""
         try:
@@ -354,25 +565,21 @@ class SQLServerConnection(DatabaseConnection):
             results = self.execute_query(query)
             return [row["name"] for row in results]
         except Exception as e:
-            logger.error(f"Database listing error: {str(e)}")
+            logger.error("Database listing error: %s", e)
             raise
 
+    @cached_metadata(
+        ttl=DatabaseConnection.SCHEMA_LIST_TTL,
+        error_ttl=DatabaseConnection.SCHEMA_LIST_ERROR_TTL,
+    )
     def get_schemas(self, database: Optional[str] = None) -> List[str]:
         """Get list of all schemas in database"""
         db_name = database or self.config.get("database", "master")
 
         try:
-            query = f"""
-                SELECT SCHEMA_NAME
-                FROM [{db_name}].INFORMATION_SCHEMA.SCHEMATA
-                WHERE SCHEMA_NAME NOT IN ('db_owner', 'db_accessadmin', 
-                    'db_securityadmin', 'db_ddladmin', 'db_backupoperator',
-                    'db_datareader', 'db_datawriter', 'db_denydatareader',
-                    'db_denydatawriter', 'INFORMATION_SCHEMA', 'sys')
-                ORDER BY SCHEMA_NAME
-            """
+            query = _catalog_sql(_SCHEMAS_SQL, db_name)
             results = self.execute_query(query)
             return [row["SCHEMA_NAME"] for row in results]
         except Exception as e:
-            logger.error(f"Schema listing error: {str(e)}")
+            logger.error("Schema listing error: %s", e)
             raise
@@ -7,6 +7,8 @@ import logging
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,10 @@ logger = logging.getLogger(__name__)
 class TableauConnector:
     """Tableau Server/Online API connector"""
 
+    # REST API metadata responses default to XML; their parsers expect JSON.
+    # Sent per call so the CSV/image/PDF view exports keep their own types.
+    JSON_HEADERS = {"Accept": "application/json"}
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.server_url = config.get("server_url")
@@ -22,6 +28,28 @@ class TableauConnector:
         self.token = None
         self.site_id_from_signin = None
         self.user_id = None
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session shared by every API call
+
+        Reusing one session keeps TCP/TLS connections to the server alive
+        between calls; idempotent requests that hit a transient error or a
+        rate limit are retried with backoff.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.config.get("pool_maxsize", 16),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def connect(self) -> bool:
         """Authenticate with Tableau Server/Online"""
@@ -56,11 +84,12 @@ class TableauConnector:
             }
         }
 
-        response = requests.post(url, json=payload)
+        response = self.session.post(url, json=payload, headers=self.JSON_HEADERS)
         response.raise_for_status()
 
         data = response.json()
         self.token = data["credentials"]["token"]
+        self.session.headers["X-Tableau-Auth"] = self.token
         self.site_id_from_signin = data["credentials"]["site"]["id"]
         self.user_id = data["credentials"]["user"]["id"]
 
@@ -83,11 +112,12 @@ class TableauConnector:
             }
         }
 
-        response = requests.post(url, json=payload)
+        response = self.session.post(url, json=payload, headers=self.JSON_HEADERS)
         response.raise_for_status()
 
         data = response.json()
         self.token = data["credentials"]["token"]
+        self.session.headers["X-Tableau-Auth"] = self.token
         self.site_id_from_signin = data["credentials"]["site"]["id"]
         self.user_id = data["credentials"]["user"]["id"]
 
@@ -101,12 +131,14 @@ class TableauConnector:
                 return True
 
             url = f"{self.server_url}/api/{self.api_version}/auth/signout"
-            headers = {"X-Tableau-Auth": self.token}
 
-            response = requests.post(url, headers=headers)
+            response = self.session.post(url)
             response.raise_for_status()
 
             self.token = None
+            self.session.headers.pop("X-Tableau-Auth", None)
+            # Drop pooled connections; the session reconnects if used again
+            self.session.close()
             logger.info("Signed out from Tableau")
             return True
 
@@ -121,9 +153,8 @@ class TableauConnector:
 
         try:
             url = f"{self.server_url}/api/{self.api_version}/sites/{self.site_id_from_signin}/workbooks"
-            headers = {"X-Tableau-Auth": self.token}
 
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=self.JSON_HEADERS)
             response.raise_for_status()
 
             data = response.json()
@@ -156,9 +187,8 @@ class TableauConnector:
 
         try:
             url = f"{self.server_url}/api/{self.api_version}/sites/{self.site_id_from_signin}/workbooks/{workbook_id}/views"
-            headers = {"X-Tableau-Auth": self.token}
 
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=self.JSON_HEADERS)
             response.raise_for_status()
 
             data = response.json()
@@ -191,9 +221,8 @@ class TableauConnector:
 
         try:
             url = f"{self.server_url}/api/{self.api_version}/sites/{self.site_id_from_signin}/datasources"
-            headers = {"X-Tableau-Auth": self.token}
 
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=self.JSON_HEADERS)
             response.raise_for_status()
 
             data = response.json()
@@ -228,9 +257,8 @@ class TableauConnector:
 
         try:
             url = f"{self.server_url}/api/{self.api_version}/sites/{self.site_id_from_signin}/projects"
-            headers = {"X-Tableau-Auth": self.token}
 
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=self.JSON_HEADERS)
             response.raise_for_status()
 
             data = response.json()
@@ -261,7 +289,6 @@ class TableauConnector:
 
         try:
             url = f"{self.server_url}/api/{self.api_version}/sites/{self.site_id_from_signin}/views/{view_id}/data"
-            headers = {"X-Tableau-Auth": self.token}
 
             # Add filters as query parameters
             params = {}
@@ -269,7 +296,7 @@ class TableauConnector:
                 for key, value in filters.items():
                     params[f"vf_{key}"] = value
 
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
             # Returns CSV data
@@ -286,10 +313,9 @@ class TableauConnector:
 
         try:
             url = f"{self.server_url}/api/{self.api_version}/sites/{self.site_id_from_signin}/views/{view_id}/image"
-            headers = {"X-Tableau-Auth": self.token}
             params = {"resolution": resolution}
 
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
             return response.content
@@ -305,10 +331,9 @@ class TableauConnector:
 
         try:
             url = f"{self.server_url}/api/{self.api_version}/sites/{self.site_id_from_signin}/views/{view_id}/pdf"
-            headers = {"X-Tableau-Auth": self.token}
             params = {"type": page_type}
 
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
             return response.content
@@ -324,9 +349,8 @@ class TableauConnector:
                 return False
 
             url = f"{self.server_url}/api/{self.api_version}/sites/{self.site_id_from_signin}"
-            headers = {"X-Tableau-Auth": self.token}
 
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=self.JSON_HEADERS)
             return response.status_code == 200
 
         except Exception:
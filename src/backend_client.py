@@ -36,12 +36,15 @@ Version: 1.0.0
 """
 
 import json
-import time
+import socket
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 
 
 class BackendConnectionError(Exception):
@@ -62,8 +65,42 @@ class BackendAuthError(Exception):
     pass
 
 
-class BackendClient:
-    """HTTP client for V-Mart Backend Server"""
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets use TCP keepalive and TCP_NODELAY
+
+    Keepalive probes stop idle pooled connections from being silently dropped
+    by NAT/firewalls between chatbot and backend; TCP_NODELAY sends small
+    JSON requests without waiting on Nagle's algorithm.
+    """
+
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+class BackendRetry(Retry):
+    """Retry policy that never replays a POST after a gateway error
+
+    A 502/503/504 from a proxy can arrive after the backend already ran a
+    write, so POSTs are retried on status only for 429, which the server
+    returns before processing the request. Connection errors and timeouts
+    are retried for every allowed method.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method == "POST" and status_code != 429:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class BackendClientBase:
+    """Configuration, response cache and response handling shared by the
+    synchronous BackendClient and the asyncio AsyncBackendClient"""
 
     def __init__(
         self,
@@ -95,15 +132,12 @@ class BackendClient:
         # Cache storage
         self._cache: Dict[str, Dict[str, Any]] = {}
 
-        # Session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "V-Mart-Chatbot-Client/1.0",
-            }
-        )
+        # Sent with every request
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "V-Mart-Chatbot-Client/1.0",
+        }
 
     def _get_cache_key(self, endpoint: str, params: Optional[Dict] = None) -> str:
         """Generate cache key from endpoint and params"""
@@ -131,6 +165,106 @@ class BackendClient:
             "expires_at": datetime.now() + timedelta(seconds=self.cache_ttl),
         }
 
+    def _handle_response(self, response: Any) -> Any:
+        """
+        Check a response's status and return its parsed JSON body
+
+        Works with requests and httpx responses alike.
+
+        Raises:
+            BackendConnectionError: Error status or rate limit
+            BackendAuthError: Authentication failed
+        """
+        if response.status_code == 401:
+            raise BackendAuthError("Invalid API key or unauthorized")
+        elif response.status_code == 403:
+            raise BackendAuthError("Insufficient permissions")
+        elif response.status_code == 429:
+            # Still rate limited after the client's retries
+            raise BackendConnectionError("Rate limit exceeded")
+        elif response.status_code >= 400:
+            error_data = response.json() if response.text else {}
+            error_msg = error_data.get("error", f"HTTP {response.status_code}")
+            raise BackendConnectionError(error_msg)
+
+        return response.json() if response.text else {}
+
+    # ========================================================================
+    # Cache Management
+    # ========================================================================
+
+    def clear_cache(self) -> None:
+        """Clear all cached data"""
+        self._cache.clear()
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics
+
+        Returns:
+            Cache size and hit count
+        """
+        total_entries = len(self._cache)
+        valid_entries = sum(
+            1
+            for cached in self._cache.values()
+            if datetime.now() < cached["expires_at"]
+        )
+        return {"total_entries": total_entries, "valid_entries": valid_entries}
+
+    def get_offline_message(self) -> str:
+        """
+        Get user-friendly offline message
+
+        Returns:
+            Message to display when backend is offline
+        """
+        return (
+            "⚠️ Backend server is currently unavailable. "
+            "Some features may be limited. "
+            "Please try again later or contact your administrator."
+        )
+
+
+class BackendClient(BackendClientBase):
+    """HTTP client for V-Mart Backend Server"""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: int = 30,
+        retry_attempts: int = 3,
+        cache_ttl: int = 300,
+        verify_ssl: bool = True,
+    ):
+        """Initialize Backend Client (see BackendClientBase for arguments)"""
+        super().__init__(
+            base_url, api_key, timeout, retry_attempts, cache_ttl, verify_ssl
+        )
+
+        # Session for connection pooling; urllib3 retries connection errors,
+        # timeouts and 429/502/503/504 (only 429 for POST) with exponential
+        # backoff
+        self.session = requests.Session()
+        adapter = KeepAliveAdapter(
+            pool_connections=8,
+            pool_maxsize=64,
+            max_retries=BackendRetry(
+                total=max(self.retry_attempts - 1, 0),
+                backoff_factor=1,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self.headers)
+
+        # Queries collected by queue_query() until flush()
+        self._pending_batch: List[Dict[str, Any]] = []
+
     def _make_request(
         self,
         method: str,
@@ -164,72 +298,41 @@ class BackendClient:
             if cached_data is not None:
                 return cached_data
 
-        # Retry logic with exponential backoff
-        last_exception = None
-        for attempt in range(self.retry_attempts):
-            try:
-                if method == "GET":
-                    response = self.session.get(
-                        url, params=data, timeout=self.timeout, verify=self.verify_ssl
-                    )
-                elif method == "POST":
-                    response = self.session.post(
-                        url, json=data, timeout=self.timeout, verify=self.verify_ssl
-                    )
-                elif method == "DELETE":
-                    response = self.session.delete(
-                        url, timeout=self.timeout, verify=self.verify_ssl
-                    )
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-
-                # Handle response
-                if response.status_code == 401:
-                    raise BackendAuthError("Invalid API key or unauthorized")
-                elif response.status_code == 403:
-                    raise BackendAuthError("Insufficient permissions")
-                elif response.status_code == 429:
-                    # Rate limit exceeded - wait and retry
-                    if attempt < self.retry_attempts - 1:
-                        wait_time = 2**attempt
-                        time.sleep(wait_time)
-                        continue
-                    raise BackendConnectionError("Rate limit exceeded")
-                elif response.status_code >= 400:
-                    error_data = response.json() if response.text else {}
-                    error_msg = error_data.get("error", f"HTTP {response.status_code}")
-                    raise BackendConnectionError(error_msg)
-
-                # Parse response
-                result = response.json() if response.text else {}
-
-                # Cache GET requests
-                if method == "GET" and use_cache:
-                    cache_key = self._get_cache_key(endpoint, data)
-                    self._set_cache(cache_key, result)
-
-                return result
-
-            except requests.exceptions.Timeout:
-                last_exception = BackendTimeoutError(
-                    f"Request timeout after {self.timeout}s"
+        # Retries happen inside the session's adapter
+        try:
+            if method == "GET":
+                response = self.session.get(
+                    url, params=data, timeout=self.timeout, verify=self.verify_ssl
                 )
-                if attempt < self.retry_attempts - 1:
-                    wait_time = 2**attempt
-                    time.sleep(wait_time)
-                    continue
-            except requests.exceptions.ConnectionError as e:
-                last_exception = BackendConnectionError(f"Connection failed: {str(e)}")
-                if attempt < self.retry_attempts - 1:
-                    wait_time = 2**attempt
-                    time.sleep(wait_time)
-                    continue
-            except (BackendAuthError, BackendConnectionError):
-                # Don't retry auth errors or other backend errors
-                raise
+            elif method == "POST":
+                response = self.session.post(
+                    url, json=data, timeout=self.timeout, verify=self.verify_ssl
+                )
+            elif method == "DELETE":
+                response = self.session.delete(
+                    url, timeout=self.timeout, verify=self.verify_ssl
+                )
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+        except requests.exceptions.Timeout:
+            raise BackendTimeoutError(f"Request timeout after {self.timeout}s")
+        except requests.exceptions.ConnectionError as e:
+            # Read timeouts that outlast the adapter's retries arrive wrapped in
+            # MaxRetryError, which requests reports as a ConnectionError
+            # (connect timeouts already surface as requests' ConnectTimeout)
+            reason = getattr(e.args[0], "reason", None) if e.args else None
+            if isinstance(reason, ReadTimeoutError):
+                raise BackendTimeoutError(f"Request timeout after {self.timeout}s")
+            raise BackendConnectionError(f"Connection failed: {str(e)}")
+
+        result = self._handle_response(response)
+
+        # Cache GET requests
+        if method == "GET" and use_cache:
+            cache_key = self._get_cache_key(endpoint, data)
+            self._set_cache(cache_key, result)
 
-        # All retries exhausted
-        raise last_exception  # type: ignore
+        return result
 
     # ========================================================================
     # Health & Status
@@ -331,6 +434,95 @@ class BackendClient:
         result = self._make_request("POST", "/api/query", data, use_cache=use_cache)
         return result.get("result")
 
+    def batch_execute(
+        self, jobs: List[Dict[str, Any]], use_cache: bool = False
+    ) -> List[Any]:
+        """
+        Execute several database queries in one request
+
+        Args:
+            jobs: Queries as {"connection": ..., "query": ..., "params": ...}
+            use_cache: Serve queries already answered from the cache and
+                cache the new results (off by default, as for write queries
+                a cached result would skip the write)
+
+        Returns:
+            Query results, in the order of jobs
+
+        Raises:
+            BackendConnectionError: A query failed (results of the others
+                are still cached), or the server returned a result count
+                that does not match the queries sent
+        """
+        results: List[Any] = [None] * len(jobs)
+        cache_keys = [self._get_cache_key("/api/query", job) for job in jobs]
+
+        # Only queries missing from the cache go to the server
+        pending = []
+        for index, cache_key in enumerate(cache_keys):
+            cached_data = self._get_from_cache(cache_key) if use_cache else None
+            if cached_data is None:
+                pending.append(index)
+            else:
+                results[index] = cached_data
+
+        if pending:
+            data = {"queries": [jobs[index] for index in pending]}
+            response = self._make_request(
+                "POST", "/api/query/batch", data, use_cache=False
+            )
+
+            items = response.get("results", [])
+            if len(items) != len(pending):
+                raise BackendConnectionError(
+                    f"Batch returned {len(items)} results for "
+                    f"{len(pending)} queries"
+                )
+
+            errors = []
+            for index, item in zip(pending, items):
+                if "error" in item:
+                    errors.append(f"query {index}: {item['error']}")
+                    continue
+                results[index] = item.get("result")
+                if use_cache:
+                    self._set_cache(cache_keys[index], results[index])
+
+            if errors:
+                raise BackendConnectionError("; ".join(errors))
+
+        return results
+
+    def queue_query(
+        self, connection: str, query: str, params: Optional[Any] = None
+    ) -> int:
+        """
+        Add a query to the pending batch sent by flush()
+
+        Returns:
+            Position of the query's result in flush()'s return value
+        """
+        job = {"connection": connection, "query": query}
+        if params is not None:
+            job["params"] = params
+        self._pending_batch.append(job)
+        return len(self._pending_batch) - 1
+
+    def flush(self, use_cache: bool = False) -> List[Any]:
+        """
+        Execute every queued query in one request
+
+        Args:
+            use_cache: As for batch_execute
+
+        Returns:
+            Query results, in the order the queries were queued
+        """
+        jobs, self._pending_batch = self._pending_batch, []
+        if not jobs:
+            return []
+        return self.batch_execute(jobs, use_cache=use_cache)
+
     def get_schema(self, connection: str) -> Dict[str, Any]:
         """
         Get database schema information
@@ -434,29 +626,6 @@ class BackendClient:
         """
         return self._make_request("GET", "/api/config")
 
-    # ========================================================================
-    # Cache Management
-    # ========================================================================
-
-    def clear_cache(self) -> None:
-        """Clear all cached data"""
-        self._cache.clear()
-
-    def get_cache_stats(self) -> Dict[str, int]:
-        """
-        Get cache statistics
-
-        Returns:
-            Cache size and hit count
-        """
-        total_entries = len(self._cache)
-        valid_entries = sum(
-            1
-            for cached in self._cache.values()
-            if datetime.now() < cached["expires_at"]
-        )
-        return {"total_entries": total_entries, "valid_entries": valid_entries}
-
     # ========================================================================
     # Graceful Degradation
     # ========================================================================
@@ -470,19 +639,6 @@ class BackendClient:
         """
         return self.health_check()
 
-    def get_offline_message(self) -> str:
-        """
-        Get user-friendly offline message
-
-        Returns:
-            Message to display when backend is offline
-        """
-        return (
-            "⚠️ Backend server is currently unavailable. "
-            "Some features may be limited. "
-            "Please try again later or contact your administrator."
-        )
-
 
 # ============================================================================
 # Convenience Functions
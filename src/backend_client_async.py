@@ -0,0 +1,307 @@
+"""
+Async Backend Client SDK - asyncio HTTP Client for V-Mart Backend Server
+
+Mirrors BackendClient's API with coroutines, so independent calls (schema
+lookups, queries, analyses) can run concurrently over one pooled HTTP/2
+connection instead of one after another.
+
+Usage:
+    from backend_client_async import AsyncBackendClient
+
+    async with AsyncBackendClient(
+        base_url="https://backend.vmart.co.in:5000",
+        api_key=os.getenv("BACKEND_API_KEY")
+    ) as client:
+        schema, customers = await asyncio.gather(
+            client.get_schema("postgres_prod"),
+            client.execute_query(
+                connection="postgres_prod",
+                query="SELECT * FROM customers LIMIT 10"
+            ),
+        )
+
+Developed by: DSR
+Version: 1.0.0
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from backend_client import (
+    BackendClientBase,
+    BackendConnectionError,
+    BackendTimeoutError,
+)
+
+
+class AsyncBackendClient(BackendClientBase):
+    """asyncio HTTP client for V-Mart Backend Server"""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: int = 30,
+        retry_attempts: int = 3,
+        cache_ttl: int = 300,
+        verify_ssl: bool = True,
+        max_connections: int = 64,
+    ):
+        """
+        Initialize Async Backend Client
+
+        Args:
+            max_connections: Most concurrent connections to the backend
+            (other arguments as for BackendClient)
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx is not installed. Install with: pip install 'httpx[http2]'"
+            )
+
+        super().__init__(
+            base_url, api_key, timeout, retry_attempts, cache_ttl, verify_ssl
+        )
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections // 2,
+        )
+        # The transport retries failed connection attempts; HTTP/2 carries
+        # concurrent requests over a single connection
+        transport = httpx.AsyncHTTPTransport(
+            verify=verify_ssl,
+            http2=True,
+            limits=limits,
+            retries=max(retry_attempts - 1, 0),
+        )
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=timeout,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncBackendClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        await self.client.aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        use_cache: bool = True,
+    ) -> Any:
+        """
+        Make HTTP request
+
+        Args:
+            method: HTTP method (GET, POST, DELETE)
+            endpoint: API endpoint (e.g., "/api/connections")
+            data: Request payload
+            use_cache: Whether to use cache for GET requests
+
+        Returns:
+            Response data
+
+        Raises:
+            BackendConnectionError: Connection failed
+            BackendTimeoutError: Request timeout
+            BackendAuthError: Authentication failed
+        """
+        # Check cache for GET requests
+        if method == "GET" and use_cache:
+            cache_key = self._get_cache_key(endpoint, data)
+            cached_data = self._get_from_cache(cache_key)
+            if cached_data is not None:
+                return cached_data
+
+        try:
+            if method == "GET":
+                response = await self.client.get(endpoint, params=data)
+            elif method == "POST":
+                response = await self.client.post(endpoint, json=data)
+            elif method == "DELETE":
+                response = await self.client.delete(endpoint)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+        except httpx.TimeoutException:
+            raise BackendTimeoutError(f"Request timeout after {self.timeout}s")
+        except httpx.TransportError as e:
+            raise BackendConnectionError(f"Connection failed: {str(e)}")
+
+        result = self._handle_response(response)
+
+        # Cache GET requests
+        if method == "GET" and use_cache:
+            cache_key = self._get_cache_key(endpoint, data)
+            self._set_cache(cache_key, result)
+
+        return result
+
+    # ========================================================================
+    # Health & Status
+    # ========================================================================
+
+    async def health_check(self) -> bool:
+        """
+        Check if backend server is healthy
+
+        Returns:
+            True if server is reachable and healthy
+        """
+        try:
+            response = await self.client.get("/health", timeout=5)
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get backend server statistics"""
+        return await self._make_request("GET", "/api/stats")
+
+    async def is_connected(self) -> bool:
+        """Check if backend is currently accessible"""
+        return await self.health_check()
+
+    # ========================================================================
+    # Connection Management
+    # ========================================================================
+
+    async def list_connections(self) -> List[Dict[str, Any]]:
+        """List all available database connections"""
+        result = await self._make_request("GET", "/api/connections")
+        return result.get("connections", [])
+
+    async def create_connection(
+        self, name: str, db_type: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create a new database connection"""
+        data = {"name": name, "type": db_type, "params": params}
+        return await self._make_request(
+            "POST", "/api/connections", data, use_cache=False
+        )
+
+    async def delete_connection(self, name: str) -> Dict[str, Any]:
+        """Delete a database connection"""
+        return await self._make_request(
+            "DELETE", f"/api/connections/{name}", use_cache=False
+        )
+
+    # ========================================================================
+    # Query Execution
+    # ========================================================================
+
+    async def execute_query(
+        self,
+        connection: str,
+        query: str,
+        params: Optional[Any] = None,
+        use_cache: bool = True,
+    ) -> Any:
+        """Execute a database query"""
+        data = {"connection": connection, "query": query}
+        if params is not None:
+            data["params"] = params
+
+        result = await self._make_request(
+            "POST", "/api/query", data, use_cache=use_cache
+        )
+        return result.get("result")
+
+    async def gather_queries(
+        self,
+        jobs: List[Tuple[str, str]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Execute several queries concurrently
+
+        Args:
+            jobs: (connection, query) pairs
+            max_concurrency: Most queries in flight at once (default: all)
+
+        Returns:
+            Query results, in the order of jobs
+        """
+        if not max_concurrency:
+            return await asyncio.gather(
+                *(self.execute_query(connection, query) for connection, query in jobs)
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(connection: str, query: str) -> Any:
+            async with semaphore:
+                return await self.execute_query(connection, query)
+
+        return await asyncio.gather(
+            *(run(connection, query) for connection, query in jobs)
+        )
+
+    async def get_schema(self, connection: str) -> Dict[str, Any]:
+        """Get database schema information"""
+        result = await self._make_request("GET", f"/api/schema/{connection}")
+        return result.get("schema", {})
+
+    # ========================================================================
+    # AI Insights
+    # ========================================================================
+
+    async def analyze_data(
+        self,
+        connection: str,
+        query: str,
+        analysis_type: str = "general",
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """Analyze query results with AI insights"""
+        data = {
+            "connection": connection,
+            "query": query,
+            "analysis_type": analysis_type,
+        }
+        result = await self._make_request("POST", "/api/ai/analyze", data, use_cache)
+        return result.get("insights", {})
+
+    async def get_recommendations(
+        self, connection: str, context: str = "", use_cache: bool = True
+    ) -> List[str]:
+        """Get AI recommendations based on database schema"""
+        data = {"connection": connection, "context": context}
+        result = await self._make_request("POST", "/api/ai/recommend", data, use_cache)
+        return result.get("recommendations", [])
+
+    # ========================================================================
+    # User & Role Management
+    # ========================================================================
+
+    async def list_users(self) -> List[Dict[str, Any]]:
+        """List all users (API keys)"""
+        result = await self._make_request("GET", "/api/users")
+        return result.get("users", [])
+
+    async def create_user(self, name: str, permissions: List[str]) -> Dict[str, Any]:
+        """Create a new user (API key)"""
+        data = {"name": name, "permissions": permissions}
+        return await self._make_request("POST", "/api/users", data, use_cache=False)
+
+    # ========================================================================
+    # Configuration
+    # ========================================================================
+
+    async def get_config(self) -> Dict[str, Any]:
+        """Get backend server configuration"""
+        return await self._make_request("GET", "/api/config")
@@ -0,0 +1,131 @@
+"""
+Tests for HandoffPool, the pool behind psycopg2 and SQL Server connections.
+"""
+
+import gc
+import sys
+import threading
+import unittest
+
+from src.backend.db_manager import HandoffPool
+
+
+class FakeConnection:
+    """Stand-in for a driver connection"""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def rollback(self):
+        if self.closed:
+            raise RuntimeError("connection is closed")
+
+
+class TestHandoffPool(unittest.TestCase):
+    def test_reuses_returned_connection(self):
+        pool = HandoffPool(FakeConnection, max_size=1, timeout=1)
+        conn = pool.getconn()
+        pool.putconn(conn)
+        self.assertIs(pool.getconn(), conn)
+
+    def test_times_out_when_exhausted(self):
+        pool = HandoffPool(FakeConnection, max_size=1, timeout=0.1)
+        conn = pool.getconn()
+        with self.assertRaises(TimeoutError):
+            pool.getconn()
+        pool.putconn(conn)
+
+    def test_release_racing_acquire_wakes_waiter(self):
+        """Every getconn succeeds while releases race queued waiters"""
+        pool = HandoffPool(
+            FakeConnection,
+            max_size=2,
+            timeout=2,
+            reset=lambda conn: conn.rollback(),
+        )
+        errors = []
+        in_use = []
+        lock = threading.Lock()
+
+        def worker():
+            try:
+                for _ in range(500):
+                    conn = pool.getconn()
+                    with lock:
+                        in_use.append(conn)
+                        assert len(in_use) <= 2
+                    with lock:
+                        in_use.remove(conn)
+                    pool.putconn(conn)
+            except Exception as e:
+                errors.append(e)
+
+        # Switch threads as often as possible to interleave the two paths
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+
+    def test_acquire_during_release_is_not_lost(self):
+        """A getconn arriving while putconn parks a connection gets it"""
+        pool = HandoffPool(FakeConnection, max_size=1, timeout=1)
+        conn = pool.getconn()
+        result = []
+
+        class RacingDeque(type(pool._idle)):
+            def append(self, item):
+                # Acquire from another thread just before the connection is
+                # parked, giving it time to queue as a waiter
+                thread = threading.Thread(
+                    target=lambda: result.append(pool.getconn())
+                )
+                thread.start()
+                thread.join(0.2)
+                super().append(item)
+                self.racer = thread
+
+        pool._idle = RacingDeque()
+        pool.putconn(conn)
+        pool._idle.racer.join()
+
+        self.assertEqual(result, [conn])
+
+    def test_waiter_gets_connection_released_later(self):
+        pool = HandoffPool(FakeConnection, max_size=1, timeout=2)
+        conn = pool.getconn()
+        result = []
+
+        thread = threading.Thread(target=lambda: result.append(pool.getconn()))
+        thread.start()
+        pool.putconn(conn)
+        thread.join()
+
+        self.assertEqual(result, [conn])
+
+    def test_closed_connection_frees_its_slot(self):
+        pool = HandoffPool(FakeConnection, max_size=1, timeout=0.1)
+        conn = pool.getconn()
+        pool.putconn(conn, close=True)
+        self.assertTrue(conn.closed)
+        self.assertIsNot(pool.getconn(), conn)
+
+    def test_leaked_connection_frees_its_slot(self):
+        pool = HandoffPool(FakeConnection, max_size=1, timeout=0.1)
+        pool.getconn()
+        gc.collect()
+        pool.putconn(pool.getconn())
+
+
+if __name__ == "__main__":
+    unittest.main()